@@ -10,8 +10,11 @@ standardized MCP tools.
 import asyncio
 import sys
 import signal
-from typing import Optional, Any
+from typing import Callable, Optional
 
+from .raindrop.auth import AuthenticationManager, close_shared_session
+from .raindrop.client import RaindropClient, close_connector
+from .raindrop.rate_limiter import RateLimiter
 from .raindrop.server import RaindropMCPServer
 from .utils.logging import setup_logging, get_logger
 from .utils.config import Config
@@ -20,28 +23,47 @@ from .utils.config import Config
 # Configure logging
 logger = setup_logging()
 
+# Prefer uvloop's libuv-based event loop when installed; stdlib asyncio otherwise
+try:
+    import uvloop
+
+    _loop_factory: Optional[Callable[[], asyncio.AbstractEventLoop]] = (
+        uvloop.new_event_loop
+    )
+except ImportError:  # pragma: no cover - depends on optional extra
+    _loop_factory = None
+
 
 class ServerManager:
     """Manages server lifecycle with graceful shutdown."""
 
     def __init__(self) -> None:
         self.server: Optional[RaindropMCPServer] = None
+        self.client: Optional[RaindropClient] = None
         self._shutdown_event = asyncio.Event()
 
     def setup_signal_handlers(self) -> None:
         """Setup signal handlers for graceful shutdown."""
+        loop = asyncio.get_running_loop()
+
         if sys.platform != "win32":
-            # Unix signals
+            # Unix signals are dispatched on the running event loop
             for sig in (signal.SIGTERM, signal.SIGINT):
-                signal.signal(sig, self._signal_handler)
+                loop.add_signal_handler(sig, self._shutdown_event.set)
         else:
-            # Windows signal
-            signal.signal(signal.SIGINT, self._signal_handler)
+            # Windows has no loop signal support; only SIGINT can be handled
+            signal.signal(
+                signal.SIGINT,
+                lambda signum, frame: loop.call_soon_threadsafe(
+                    self._shutdown_event.set
+                ),
+            )
+            logger.debug("SIGTERM handling is not supported on Windows")
 
-    def _signal_handler(self, signum: int, frame: Any) -> None:
-        """Handle shutdown signals."""
-        logger.info(f"Received signal {signum}, initiating graceful shutdown")
-        self._shutdown_event.set()
+    async def _cancel_on_shutdown(self, task: "asyncio.Task[None]") -> None:
+        """Cancel the server task once shutdown is requested."""
+        await self._shutdown_event.wait()
+        task.cancel()
 
     async def run(self) -> int:
         """
@@ -60,38 +82,27 @@ class ServerManager:
             Config.validate()
             logger.info("Configuration validated successfully")
 
-            # Create server instance
-            self.server = RaindropMCPServer()
+            # Create the process-wide client once and share it with the server
+            self.client = RaindropClient(AuthenticationManager(), RateLimiter())
+            await self.client.initialize()
 
-            # Create tasks for server and shutdown monitoring
-            server_task = asyncio.create_task(self.server.run_stdio())
-            shutdown_task = asyncio.create_task(self._shutdown_event.wait())
+            # Create server instance
+            self.server = RaindropMCPServer(client=self.client)
 
             logger.info("Raindrop MCP Server starting...")
 
-            # Wait for either server completion or shutdown signal
-            done, pending = await asyncio.wait(
-                [server_task, shutdown_task], return_when=asyncio.FIRST_COMPLETED
-            )
-
-            # Cancel pending tasks
-            for task in pending:
-                task.cancel()
-                try:
-                    await task
-                except asyncio.CancelledError:
-                    pass
-
-            # Check if server task completed with an exception
-            for task in done:
-                if task == server_task:
-                    try:
-                        await task  # Re-raise any exception
-                    except asyncio.CancelledError:
-                        pass  # Expected during shutdown
-                    except Exception as e:
-                        logger.error(f"Server error: {e}")
-                        exit_code = 1
+            # Run the server until it completes or a shutdown signal arrives
+            try:
+                async with asyncio.TaskGroup() as tg:
+                    server_task = tg.create_task(self.server.run_stdio())
+                    server_task.add_done_callback(
+                        lambda _: self._shutdown_event.set()
+                    )
+                    tg.create_task(self._cancel_on_shutdown(server_task))
+            except* Exception as eg:
+                for error in eg.exceptions:
+                    logger.error(f"Server error: {error}")
+                exit_code = 1
 
             logger.info("Raindrop MCP Server stopped")
 
@@ -108,6 +119,14 @@ class ServerManager:
                 except Exception as e:
                     logger.error(f"Cleanup error: {e}")
 
+            if self.client:
+                try:
+                    await self.client.close()
+                    await close_shared_session()
+                    await close_connector()
+                except Exception as e:
+                    logger.error(f"Client cleanup error: {e}")
+
         return exit_code
 
 
@@ -120,7 +139,8 @@ async def async_main() -> int:
 def main() -> None:
     """Main entry point."""
     try:
-        exit_code = asyncio.run(async_main())
+        with asyncio.Runner(loop_factory=_loop_factory) as runner:
+            exit_code = runner.run(async_main())
         sys.exit(exit_code)
     except KeyboardInterrupt:
         logger.info("Interrupted by user")
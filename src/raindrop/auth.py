@@ -1,8 +1,10 @@
 """Authentication and token validation for Raindrop.io API."""
 
 import asyncio
+import re
 import time
-from typing import Optional, Dict, Any
+from types import MappingProxyType
+from typing import Optional, Dict, Any, Mapping
 import aiohttp
 from .exceptions import (
     AuthenticationError,
@@ -14,14 +16,68 @@ from .exceptions import (
 from ..utils.config import Config
 
 
+# Raindrop tokens: at least 10 characters of alphanumerics and "-", "_", "."
+_TOKEN_RE = re.compile(r"^[A-Za-z0-9._\-]{10,}$")
+
+# Process-wide session used for token validation when no session is injected
+_shared_session: Optional[aiohttp.ClientSession] = None
+_shared_session_lock = asyncio.Lock()
+
+
+async def _get_shared_session() -> aiohttp.ClientSession:
+    """Get (or lazily create) the shared validation session."""
+    global _shared_session
+
+    async with _shared_session_lock:
+        if _shared_session is None or _shared_session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=10,
+                ttl_dns_cache=300,
+                keepalive_timeout=30,
+            )
+            _shared_session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=Config.REQUEST_TIMEOUT),
+            )
+        return _shared_session
+
+
+async def close_shared_session() -> None:
+    """Close the shared validation session if it was created."""
+    global _shared_session
+
+    if _shared_session is not None and not _shared_session.closed:
+        await _shared_session.close()
+    _shared_session = None
+
+
 class TokenValidator:
     """Handles API token validation and management."""
 
-    def __init__(self, token: str, base_url: Optional[str] = None) -> None:
+    def __init__(
+        self,
+        token: str,
+        base_url: Optional[str] = None,
+        session: Optional[aiohttp.ClientSession] = None,
+    ) -> None:
         self.token = token
-        self.base_url = base_url or Config.RAINDROP_API_BASE_URL
-        self._validation_cache: Dict[str, tuple[bool, float]] = {}
-        self._cache_duration = 300  # 5 minutes
+        self.base_url = (base_url or Config.RAINDROP_API_BASE_URL).rstrip("/")
+        self.session = session
+        # Token is fixed for the validator's lifetime, so build headers once
+        self._auth_headers: Mapping[str, str] = MappingProxyType(
+            {
+                "Authorization": f"Bearer {token}",
+                "Content-Type": "application/json",
+            }
+        )
+        self._cached: Optional[tuple[bool, float]] = None
+
+        # Adaptive cache TTL: grows while the token keeps validating
+        self._initial_ttl = 300.0  # 5 minutes
+        self._min_ttl = 60.0
+        self._max_ttl = 3600.0
+        self._current_ttl = self._initial_ttl
+        self._consecutive_hits = 0
 
     async def validate_token(self, force_refresh: bool = False) -> bool:
         """
@@ -45,27 +101,34 @@ class TokenValidator:
 
         try:
             is_valid = await self._validate_against_api()
-            self._cache_validation_result(is_valid)
-            return is_valid
-
         except aiohttp.ClientError as e:
+            self._reset_ttl()
             raise NetworkError(f"Failed to connect to Raindrop.io API: {str(e)}")
         except Exception as e:
+            self._reset_ttl()
             raise AuthenticationError(f"Token validation failed: {str(e)}")
 
+        if is_valid:
+            self._extend_ttl()
+        else:
+            self._reset_ttl()
+        self._cache_validation_result(is_valid)
+        return is_valid
+
     async def _validate_against_api(self) -> bool:
         """Validate token by making a test API call."""
-        headers = {
-            "Authorization": f"Bearer {self.token}",
-            "Content-Type": "application/json",
-        }
+        headers = self._auth_headers
 
-        timeout = aiohttp.ClientTimeout(total=Config.REQUEST_TIMEOUT)
+        # Reuse an existing session so validation doesn't pay a fresh handshake
+        session = self.session
+        if session is None or session.closed:
+            session = await _get_shared_session()
 
-        async with aiohttp.ClientSession(timeout=timeout) as session:
-            # Use the user endpoint for validation - it's lightweight
-            url = f"{self.base_url}/user"
+        # Use the user endpoint for validation - it's lightweight
+        url = f"{self.base_url}/user"
 
+        # The client session carries no ClientTimeout, so bound the check here
+        async with asyncio.timeout(Config.REQUEST_TIMEOUT):
             async with session.get(url, headers=headers) as response:
                 if response.status == 200:
                     return True
@@ -84,29 +147,38 @@ class TokenValidator:
 
     def _get_cached_validation(self) -> Optional[bool]:
         """Get cached validation result if still valid."""
-        if self.token not in self._validation_cache:
+        if self._cached is None:
             return None
 
-        is_valid, timestamp = self._validation_cache[self.token]
+        is_valid, timestamp = self._cached
 
         # Check if cache is still valid
-        if time.time() - timestamp < self._cache_duration:
+        if time.monotonic() - timestamp < self._current_ttl:
             return is_valid
 
-        # Cache expired, remove it
-        del self._validation_cache[self.token]
+        # Cache expired, drop it
+        self._cached = None
         return None
 
+    def _extend_ttl(self) -> None:
+        """Double the cache TTL (up to the maximum) after a successful check."""
+        # The first success keeps the initial TTL; later ones extend it
+        if self._consecutive_hits:
+            self._current_ttl = min(self._max_ttl, self._current_ttl * 2)
+        self._consecutive_hits += 1
+
+    def _reset_ttl(self) -> None:
+        """Drop back to the minimum TTL after a failed check."""
+        self._consecutive_hits = 0
+        self._current_ttl = self._min_ttl
+
     def _cache_validation_result(self, is_valid: bool) -> None:
         """Cache validation result with timestamp."""
-        self._validation_cache[self.token] = (is_valid, time.time())
+        self._cached = (is_valid, time.monotonic())
 
-    def get_auth_headers(self) -> Dict[str, str]:
-        """Get authentication headers for API requests."""
-        return {
-            "Authorization": f"Bearer {self.token}",
-            "Content-Type": "application/json",
-        }
+    def get_auth_headers(self) -> Mapping[str, str]:
+        """Get authentication headers for API requests (read-only)."""
+        return self._auth_headers
 
     @staticmethod
     def validate_token_format(token: str) -> bool:
@@ -114,21 +186,7 @@ class TokenValidator:
         if not isinstance(token, str):
             return False
 
-        # Remove whitespace
-        token = token.strip()
-
-        # Basic checks
-        if len(token) < 10:  # Raindrop tokens are typically longer
-            return False
-
-        # Should contain only valid characters (alphanumeric and some special chars)
-        allowed_chars = set(
-            "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789-_."
-        )
-        if not all(c in allowed_chars for c in token):
-            return False
-
-        return True
+        return _TOKEN_RE.match(token.strip()) is not None
 
 
 class AuthenticationManager:
@@ -139,8 +197,21 @@ class AuthenticationManager:
         self._validator: Optional[TokenValidator] = None
         self._authenticated = False
 
-    async def initialize(self) -> None:
-        """Initialize authentication system."""
+    async def initialize(
+        self, session: Optional[aiohttp.ClientSession] = None
+    ) -> None:
+        """
+        Initialize authentication system.
+
+        Args:
+            session: Optional HTTP session to reuse for token validation
+        """
+        # Already validated: just adopt the (newer) session, skip the API call
+        if self._authenticated and self._validator is not None:
+            if session is not None:
+                self._validator.session = session
+            return
+
         # Validate configuration
         self.config.validate()
 
@@ -149,7 +220,9 @@ class AuthenticationManager:
             raise MissingTokenError("API token not configured")
 
         # Create token validator
-        self._validator = TokenValidator(self.config.RAINDROP_API_TOKEN)
+        self._validator = TokenValidator(
+            self.config.RAINDROP_API_TOKEN, session=session
+        )
 
         # Validate token format
         if not TokenValidator.validate_token_format(self.config.RAINDROP_API_TOKEN):
@@ -171,8 +244,8 @@ class AuthenticationManager:
         """Check if currently authenticated."""
         return self._authenticated
 
-    def get_auth_headers(self) -> Dict[str, str]:
-        """Get authentication headers for API requests."""
+    def get_auth_headers(self) -> Mapping[str, str]:
+        """Get authentication headers for API requests (read-only)."""
         if not self._authenticated or not self._validator:
             raise AuthenticationError("Not authenticated. Call initialize() first.")
 
@@ -1,10 +1,21 @@
 """Raindrop.io API client with connection pooling, rate limiting, and retry logic."""
 
 import asyncio
+import json
+import random
 import time
-from typing import Dict, List, Optional, Any, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    NoReturn,
+    Optional,
+    TypeVar,
+    Union,
+)
 import aiohttp
-from aiohttp import ClientSession, ClientTimeout, ClientError, ClientResponseError
+from aiohttp import ClientSession, ClientError, ClientResponseError
 
 from .models import BookmarkModel, CollectionModel, UserModel
 from .auth import AuthenticationManager
@@ -27,21 +38,174 @@ from ..utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Prefer orjson for response decoding when installed; stdlib json otherwise
+try:
+    import orjson
+
+    _json_loads: Callable[[bytes], Any] = orjson.loads
+except ImportError:  # pragma: no cover - depends on optional extra
+    _json_loads = json.loads
+
+
+T = TypeVar("T")
+
+# Upper bound for each shutdown step so cleanup can't hang indefinitely
+_CLOSE_TIMEOUT = 5.0
+
+# Methods safe to repeat after a 5xx; a POST may already have been applied,
+# and a repeated DELETE would purge a bookmark the first call moved to Trash
+_IDEMPOTENT_METHODS = frozenset(("GET", "PUT"))
+
+# Connection pool shared by all clients so DNS cache and keepalive
+# connections survive client re-initialization
+_GLOBAL_CONNECTOR: Optional[aiohttp.TCPConnector] = None
+
+
+def _get_connector() -> aiohttp.TCPConnector:
+    """Get (or lazily create) the shared TCP connector."""
+    global _GLOBAL_CONNECTOR
+
+    if _GLOBAL_CONNECTOR is None or _GLOBAL_CONNECTOR.closed:
+        _GLOBAL_CONNECTOR = aiohttp.TCPConnector(
+            limit=Config.HTTP_MAX_CONNECTIONS,  # Total connection pool size
+            limit_per_host=Config.HTTP_MAX_CONNECTIONS_PER_HOST,  # Per-host cap
+            ttl_dns_cache=600,  # DNS cache TTL
+            use_dns_cache=True,
+            keepalive_timeout=60,
+            enable_cleanup_closed=True,
+        )
+    return _GLOBAL_CONNECTOR
+
+
+async def close_connector() -> None:
+    """Close the shared TCP connector if it was created."""
+    global _GLOBAL_CONNECTOR
+
+    if _GLOBAL_CONNECTOR is not None and not _GLOBAL_CONNECTOR.closed:
+        try:
+            async with asyncio.timeout(_CLOSE_TIMEOUT):
+                await _GLOBAL_CONNECTOR.close()
+        except TimeoutError:
+            logger.warning("Connector close timed out; continuing shutdown")
+    _GLOBAL_CONNECTOR = None
+
+
+def _require_bookmark_ids(bookmark_ids: List[int]) -> None:
+    """Reject an empty ID list, which the bulk endpoints apply to everything."""
+    if not bookmark_ids:
+        raise ValueError(
+            "bookmark_ids must not be empty; an empty list would affect every "
+            "bookmark in the collection"
+        )
+
+
+def _parse_items(
+    items: List[Dict[str, Any]],
+    parse: Callable[[Dict[str, Any]], T],
+    label: str,
+    parse_many: Optional[Callable[[List[Dict[str, Any]]], List[T]]] = None,
+) -> List[T]:
+    """
+    Parse API items, skipping malformed entries.
+
+    The common all-valid case is a single batch parse (``parse_many`` when
+    given); per-item error handling only runs if that bulk parse fails.
+    """
+    try:
+        if parse_many is not None:
+            return parse_many(items)
+        return [parse(item) for item in items]
+    except Exception:
+        parsed: List[T] = []
+        for item in items:
+            try:
+                parsed.append(parse(item))
+            except Exception as e:
+                logger.warning("Failed to parse %s: %s", label, e)
+        return parsed
+
+
+def _raise_validation(
+    response_data: Dict[str, Any], response: aiohttp.ClientResponse
+) -> NoReturn:
+    """Raise for 400 Bad Request."""
+    raise ValidationError(response_data.get("error", "Bad request"))
+
+
+def _raise_auth(
+    response_data: Dict[str, Any], response: aiohttp.ClientResponse
+) -> NoReturn:
+    """Raise for 401 Unauthorized, distinguishing token problems."""
+    error_message = response_data.get("error", "Unauthorized")
+    if "token" in error_message.lower():
+        if "expired" in error_message.lower():
+            raise TokenExpiredError(error_message)
+        raise InvalidTokenError(error_message)
+    raise AuthenticationError(error_message)
+
+
+def _raise_permission(
+    response_data: Dict[str, Any], response: aiohttp.ClientResponse
+) -> NoReturn:
+    """Raise for 403 Forbidden."""
+    raise PermissionError(response_data.get("error", "Forbidden"))
+
+
+def _raise_not_found(
+    response_data: Dict[str, Any], response: aiohttp.ClientResponse
+) -> NoReturn:
+    """Raise for 404 Not Found."""
+    raise NotFoundError("Resource", None)
+
+
+def _raise_rate_limit(
+    response_data: Dict[str, Any], response: aiohttp.ClientResponse
+) -> NoReturn:
+    """Raise for 429 Too Many Requests, carrying Retry-After."""
+    error_message = response_data.get("error", "Too many requests")
+    retry_after = response.headers.get("Retry-After")
+    retry_seconds = int(retry_after) if retry_after else None
+    raise RateLimitError(error_message, retry_seconds)
+
+
+_STATUS_HANDLERS: Dict[
+    int, Callable[[Dict[str, Any], aiohttp.ClientResponse], NoReturn]
+] = {
+    400: _raise_validation,
+    401: _raise_auth,
+    403: _raise_permission,
+    404: _raise_not_found,
+    429: _raise_rate_limit,
+}
+
 
 class RetryConfig:
     """Configuration for retry logic."""
 
     def __init__(
-        self, max_retries: int = 3, base_delay: float = 1.0, max_delay: float = 60.0
+        self,
+        max_retries: int = 3,
+        base_delay: float = 1.0,
+        max_delay: float = 60.0,
+        jitter: float = 0.0,
     ):
         self.max_retries = max_retries
         self.base_delay = base_delay
         self.max_delay = max_delay
+        self.jitter = jitter
+
+        # Backoff schedule is fixed after construction, so compute it once
+        self._delays = tuple(
+            min(base_delay * (1 << attempt), max_delay)
+            for attempt in range(max_retries + 1)
+        )
 
     def get_delay(self, attempt: int) -> float:
-        """Calculate exponential backoff delay."""
-        delay = self.base_delay * (2**attempt)
-        return min(delay, self.max_delay)
+        """Get exponential backoff delay, plus optional random jitter."""
+        delay = self._delays[min(attempt, len(self._delays) - 1)]
+        if self.jitter:
+            delay += random.uniform(0, self.jitter * delay)
+        return delay
 
 
 class RaindropClient:
@@ -52,8 +216,8 @@ class RaindropClient:
 
     def __init__(
         self,
-        auth_manager: Optional[AuthenticationManager] = None,
-        rate_limiter: Optional[RateLimiter] = None,
+        auth_manager: AuthenticationManager,
+        rate_limiter: RateLimiter,
     ) -> None:
         """
         Initialize Raindrop API client.
@@ -62,24 +226,15 @@ class RaindropClient:
             auth_manager: Authentication manager instance
             rate_limiter: Rate limiter instance
         """
-        self.auth_manager = auth_manager or AuthenticationManager()
-        self.rate_limiter = rate_limiter or RateLimiter()
-        self.base_url = Config.RAINDROP_API_BASE_URL
+        self.auth_manager = auth_manager
+        self.rate_limiter = rate_limiter
+        # Normalized once; endpoints are passed without a leading slash
+        self.base_url = Config.RAINDROP_API_BASE_URL.rstrip("/")
 
-        # HTTP client configuration
-        self.timeout = ClientTimeout(total=Config.REQUEST_TIMEOUT)
+        # HTTP client configuration (enforced per request via asyncio.timeout)
+        self.request_timeout: float = Config.REQUEST_TIMEOUT
         self.retry_config = RetryConfig(
-            max_retries=Config.MAX_RETRIES, base_delay=Config.RETRY_DELAY
-        )
-
-        # Connection pooling
-        self.connector = aiohttp.TCPConnector(
-            limit=10,  # Total connection pool size
-            limit_per_host=5,  # Max connections per host
-            ttl_dns_cache=300,  # DNS cache TTL
-            use_dns_cache=True,
-            keepalive_timeout=30,
-            enable_cleanup_closed=True,
+            max_retries=Config.MAX_RETRIES, base_delay=Config.RETRY_DELAY, jitter=0.25
         )
 
         self.session: Optional[ClientSession] = None
@@ -99,19 +254,23 @@ class RaindropClient:
         if self._closed:
             raise RaindropError("Client has been closed")
 
-        # Initialize authentication
-        await self.auth_manager.initialize()
-
-        # Start rate limiter
-        await self.rate_limiter.start()
+        # Recycle any previous session; the pooled connections survive it
+        if self.session and not self.session.closed:
+            await self.session.close()
 
-        # Create HTTP session
+        # Create HTTP session on the shared connection pool
         self.session = ClientSession(
-            connector=self.connector,
-            timeout=self.timeout,
+            connector=_get_connector(),
+            connector_owner=False,
             headers={"User-Agent": "Raindrop-MCP-Client/0.1.0"},
         )
 
+        # Initialize authentication, sharing the client session for validation
+        await self.auth_manager.initialize(session=self.session)
+
+        # Start rate limiter
+        await self.rate_limiter.start()
+
         logger.info("Raindrop API client initialized")
 
     async def close(self) -> None:
@@ -122,15 +281,19 @@ class RaindropClient:
         self._closed = True
 
         # Stop rate limiter
-        await self.rate_limiter.stop()
+        try:
+            async with asyncio.timeout(_CLOSE_TIMEOUT):
+                await self.rate_limiter.stop()
+        except TimeoutError:
+            logger.warning("Rate limiter stop timed out; continuing shutdown")
 
-        # Close HTTP session
+        # Close HTTP session (the shared connector stays open for reuse)
         if self.session and not self.session.closed:
-            await self.session.close()
-
-        # Close connector
-        if self.connector and not self.connector.closed:
-            await self.connector.close()
+            try:
+                async with asyncio.timeout(_CLOSE_TIMEOUT):
+                    await self.session.close()
+            except TimeoutError:
+                logger.warning("Session close timed out; continuing shutdown")
 
         logger.info("Raindrop API client closed")
 
@@ -145,16 +308,18 @@ class RaindropClient:
         params: Optional[Dict] = None,
         data: Optional[Dict] = None,
         priority: str = "normal",
+        expect_empty: bool = False,
     ) -> Dict[str, Any]:
         """
         Make HTTP request with rate limiting, retries, and error handling.
 
         Args:
             method: HTTP method
-            endpoint: API endpoint
+            endpoint: API endpoint, relative to base_url (no leading slash)
             params: Query parameters
             data: Request body data
             priority: Request priority for rate limiting
+            expect_empty: Skip reading the body of successful responses
 
         Returns:
             Response data as dictionary
@@ -168,7 +333,8 @@ class RaindropClient:
         if not self.session:
             raise RaindropError("Client not initialized. Call initialize() first.")
 
-        url = f"{self.base_url}/{endpoint.lstrip('/')}"
+        assert not endpoint.startswith("/"), f"Unnormalized endpoint: {endpoint}"
+        url = f"{self.base_url}/{endpoint}"
 
         # Acquire rate limit permission
         if not await self.rate_limiter.acquire(priority=priority):
@@ -177,27 +343,81 @@ class RaindropClient:
         # Prepare headers
         headers = self.auth_manager.get_auth_headers()
 
+        # Bind hot attributes locally for the retry loop
+        session_request = self.session.request
+        record_success = self.rate_limiter.record_success
+        record_failure = self.rate_limiter.record_failure
+        max_retries = self.retry_config.max_retries
+        max_delay = self.retry_config.max_delay
+        get_delay = self.retry_config.get_delay
+        request_timeout = self.request_timeout
+        retry_server_errors = method.upper() in _IDEMPOTENT_METHODS
+
         # Retry loop
         last_exception = None
 
-        for attempt in range(self.retry_config.max_retries + 1):
+        for attempt in range(max_retries + 1):
             try:
-                async with self.session.request(
-                    method=method, url=url, params=params, json=data, headers=headers
-                ) as response:
-                    # Handle response
-                    response_data = await self._handle_response(response)
+                async with asyncio.timeout(request_timeout):
+                    async with session_request(
+                        method=method,
+                        url=url,
+                        params=params,
+                        json=data,
+                        headers=headers,
+                    ) as response:
+                        # Handle response (callers ignoring the body skip it)
+                        if expect_empty and 200 <= response.status < 300:
+                            response_data = {}
+                        else:
+                            response_data = await self._handle_response(response)
+
+                # Record success for rate limiter
+                record_success()
+
+                return response_data
+
+            except RateLimitError as e:
+                # Slow the shared limiter down for whatever the server asked
+                if e.retry_after:
+                    self.rate_limiter.record_rate_limited(e.retry_after)
+
+                # Give up rather than hold the tool call for a long server
+                # pause (e.g. Retry-After: 3600)
+                if attempt == max_retries or (e.retry_after or 0) > max_delay:
+                    raise
 
-                    # Record success for rate limiter
-                    self.rate_limiter.record_success()
+                # Prefer the server's Retry-After over our own backoff
+                delay = e.retry_after or get_delay(attempt)
+                logger.warning(
+                    "Rate limited (attempt %s), retrying in %ss", attempt + 1, delay
+                )
+                await asyncio.sleep(delay)
+
+            except ServerError as e:
+                # 5xx responses are upstream failures: count them toward the
+                # circuit breaker and retry idempotent requests with backoff.
+                # A POST is never repeated, since the upstream may have
+                # committed the write before failing (duplicate bookmarks).
+                record_failure()
 
-                    return response_data
+                if not retry_server_errors or attempt == max_retries:
+                    raise
+
+                delay = get_delay(attempt)
+                logger.warning(
+                    "Server error (attempt %s), retrying in %ss: %s",
+                    attempt + 1,
+                    delay,
+                    e,
+                )
+                await asyncio.sleep(delay)
 
             except (ClientError, asyncio.TimeoutError) as e:
                 last_exception = e
 
                 # Record failure for rate limiter
-                self.rate_limiter.record_failure()
+                record_failure()
 
                 # Don't retry authentication errors
                 if isinstance(
@@ -216,11 +436,11 @@ class RaindropClient:
                     raise
 
                 # Don't retry on last attempt
-                if attempt == self.retry_config.max_retries:
+                if attempt == max_retries:
                     break
 
                 # Calculate delay
-                delay = self.retry_config.get_delay(attempt)
+                delay = get_delay(attempt)
                 logger.warning(
                     f"Request failed (attempt {attempt + 1}), retrying in {delay}s: {e}"
                 )
@@ -232,7 +452,7 @@ class RaindropClient:
                 raise NetworkError("Request timed out after multiple retries")
             else:
                 raise NetworkError(
-                    f"Request failed after {self.retry_config.max_retries} retries: {last_exception}"
+                    f"Request failed after {max_retries} retries: {last_exception}"
                 )
 
         raise NetworkError("Request failed for unknown reason")
@@ -252,60 +472,38 @@ class RaindropClient:
         Raises:
             Various Raindrop exceptions based on response status
         """
-        try:
-            # Try to parse JSON response
-            response_data = await response.json()
-        except Exception:
-            # If JSON parsing fails, use text
-            response_text = await response.text()
-            response_data = {"message": response_text}
-
-        # Handle different status codes
-        if response.status == 200 or response.status == 201:
+        # Read the body once and decode it according to its content type
+        raw = await response.read()
+        response_data: Any = None
+        if raw and response.content_type == "application/json":
+            try:
+                response_data = _json_loads(raw)
+            except ValueError:
+                response_data = None
+        if response_data is None:
+            response_data = {"message": raw.decode("utf-8", "replace")}
+
+        # Success is the common case; errors dispatch through a status table
+        if 200 <= response.status < 300:
             return response_data
 
-        elif response.status == 400:
-            error_message = response_data.get("error", "Bad request")
-            raise ValidationError(error_message)
-
-        elif response.status == 401:
-            error_message = response_data.get("error", "Unauthorized")
-            if "token" in error_message.lower():
-                if "expired" in error_message.lower():
-                    raise TokenExpiredError(error_message)
-                else:
-                    raise InvalidTokenError(error_message)
-            else:
-                raise AuthenticationError(error_message)
-
-        elif response.status == 403:
-            error_message = response_data.get("error", "Forbidden")
-            raise PermissionError(error_message)
-
-        elif response.status == 404:
-            error_message = response_data.get("error", "Not found")
-            raise NotFoundError("Resource", None)
+        handler = _STATUS_HANDLERS.get(response.status)
+        if handler is not None:
+            handler(response_data, response)
 
-        elif response.status == 429:
-            error_message = response_data.get("error", "Too many requests")
-            retry_after = response.headers.get("Retry-After")
-            retry_seconds = int(retry_after) if retry_after else None
-            raise RateLimitError(error_message, retry_seconds)
-
-        elif response.status >= 500:
+        if response.status >= 500:
             error_message = response_data.get("error", "Server error")
             raise ServerError(error_message, response.status)
 
-        else:
-            error_message = response_data.get(
-                "error", f"Unexpected status code: {response.status}"
-            )
-            raise RaindropError(error_message, response.status)
+        error_message = response_data.get(
+            "error", f"Unexpected status code: {response.status}"
+        )
+        raise RaindropError(error_message, response.status)
 
     # User API methods
     async def get_user(self) -> UserModel:
         """Get current user information."""
-        data = await self._make_request("GET", "/user")
+        data = await self._make_request("GET", "user")
         return UserModel.from_dict(data["user"])
 
     # Bookmark API methods
@@ -320,17 +518,17 @@ class RaindropClient:
             Search results with items and metadata
         """
         collection_id = params.pop("collection", 0)  # Default to all bookmarks
-        endpoint = f"/raindrops/{collection_id}"
+        endpoint = f"raindrops/{collection_id}"
 
         data = await self._make_request("GET", endpoint, params=params)
 
         # Parse bookmarks
-        bookmarks = []
-        for item in data.get("items", []):
-            try:
-                bookmarks.append(BookmarkModel.from_dict(item))
-            except Exception as e:
-                logger.warning(f"Failed to parse bookmark: {e}")
+        bookmarks = _parse_items(
+            data.get("items", []),
+            BookmarkModel.from_dict,
+            "bookmark",
+            parse_many=BookmarkModel.from_dicts,
+        )
 
         return {
             "items": bookmarks,
@@ -341,12 +539,12 @@ class RaindropClient:
 
     async def get_bookmark(self, bookmark_id: int) -> BookmarkModel:
         """Get bookmark by ID."""
-        data = await self._make_request("GET", f"/raindrop/{bookmark_id}")
+        data = await self._make_request("GET", f"raindrop/{bookmark_id}")
         return BookmarkModel.from_dict(data["item"])
 
     async def create_bookmark(self, bookmark_data: Dict[str, Any]) -> BookmarkModel:
         """Create a new bookmark."""
-        data = await self._make_request("POST", "/raindrop", data=bookmark_data)
+        data = await self._make_request("POST", "raindrop", data=bookmark_data)
         return BookmarkModel.from_dict(data["item"])
 
     async def update_bookmark(
@@ -354,54 +552,112 @@ class RaindropClient:
     ) -> BookmarkModel:
         """Update an existing bookmark."""
         data = await self._make_request(
-            "PUT", f"/raindrop/{bookmark_id}", data=bookmark_data
+            "PUT", f"raindrop/{bookmark_id}", data=bookmark_data
         )
         return BookmarkModel.from_dict(data["item"])
 
     async def delete_bookmark(self, bookmark_id: int) -> bool:
         """Delete a bookmark."""
-        await self._make_request("DELETE", f"/raindrop/{bookmark_id}")
+        await self._make_request(
+            "DELETE", f"raindrop/{bookmark_id}", expect_empty=True
+        )
         return True
 
+    async def bulk_update_bookmarks(
+        self, bookmark_ids: List[int], patch: Dict[str, Any], collection_id: int = 0
+    ) -> int:
+        """
+        Apply one update to many bookmarks in a single request.
+
+        Args:
+            bookmark_ids: IDs of the bookmarks to update
+            patch: Fields to apply (tags, collection)
+            collection_id: Collection the bookmarks live in (0 for all)
+
+        Returns:
+            Number of bookmarks modified
+
+        Raises:
+            ValueError: If no bookmark IDs are given
+        """
+        _require_bookmark_ids(bookmark_ids)
+        data = await self._make_request(
+            "PUT", f"raindrops/{collection_id}", data={**patch, "ids": bookmark_ids}
+        )
+        return int(data.get("modified", 0))
+
+    async def bulk_delete_bookmarks(
+        self, bookmark_ids: List[int], collection_id: int = 0
+    ) -> int:
+        """
+        Delete many bookmarks in a single request.
+
+        Args:
+            bookmark_ids: IDs of the bookmarks to delete
+            collection_id: Collection the bookmarks live in (0 for all)
+
+        Returns:
+            Number of bookmarks deleted
+
+        Raises:
+            ValueError: If no bookmark IDs are given
+        """
+        _require_bookmark_ids(bookmark_ids)
+        data = await self._make_request(
+            "DELETE", f"raindrops/{collection_id}", data={"ids": bookmark_ids}
+        )
+        return int(data.get("modified", 0))
+
     # Collection API methods
     async def list_collections(self) -> List[CollectionModel]:
         """List all collections (both root and child collections)."""
-        collections = []
-        
-        # Get root collections
-        try:
-            root_data = await self._make_request("GET", "/collections")
-            for item in root_data.get("items", []):
-                try:
-                    collections.append(CollectionModel.from_dict(item))
-                except Exception as e:
-                    logger.warning(f"Failed to parse root collection: {e}")
-        except Exception as e:
-            logger.error(f"Failed to fetch root collections: {e}")
-        
-        # Get child collections (subcollections)
-        try:
-            child_data = await self._make_request("GET", "/collections/childrens")
-            for item in child_data.get("items", []):
-                try:
-                    collections.append(CollectionModel.from_dict(item))
-                except Exception as e:
-                    logger.warning(f"Failed to parse child collection: {e}")
-        except Exception as e:
-            logger.warning(f"Failed to fetch child collections: {e}")
+        collections: List[CollectionModel] = []
+
+        # Root and child collections are independent, so fetch them concurrently
+        root_data: Union[Dict[str, Any], BaseException]
+        child_data: Union[Dict[str, Any], BaseException]
+        root_data, child_data = await asyncio.gather(
+            self._make_request("GET", "collections"),
+            self._make_request("GET", "collections/childrens"),
+            return_exceptions=True,
+        )
+
+        # Parse root collections
+        if isinstance(root_data, BaseException):
+            logger.error("Failed to fetch root collections: %s", root_data)
+        else:
+            collections.extend(
+                _parse_items(
+                    root_data.get("items", []),
+                    CollectionModel.from_dict,
+                    "root collection",
+                )
+            )
+
+        # Parse child collections (subcollections)
+        if isinstance(child_data, BaseException):
+            logger.warning("Failed to fetch child collections: %s", child_data)
+        else:
+            collections.extend(
+                _parse_items(
+                    child_data.get("items", []),
+                    CollectionModel.from_dict,
+                    "child collection",
+                )
+            )
 
         return collections
 
     async def get_collection(self, collection_id: int) -> CollectionModel:
         """Get collection by ID."""
-        data = await self._make_request("GET", f"/collection/{collection_id}")
+        data = await self._make_request("GET", f"collection/{collection_id}")
         return CollectionModel.from_dict(data["item"])
 
     async def create_collection(
         self, collection_data: Dict[str, Any]
     ) -> CollectionModel:
         """Create a new collection."""
-        data = await self._make_request("POST", "/collection", data=collection_data)
+        data = await self._make_request("POST", "collection", data=collection_data)
         return CollectionModel.from_dict(data["item"])
 
     async def update_collection(
@@ -409,13 +665,15 @@ class RaindropClient:
     ) -> CollectionModel:
         """Update an existing collection."""
         data = await self._make_request(
-            "PUT", f"/collection/{collection_id}", data=collection_data
+            "PUT", f"collection/{collection_id}", data=collection_data
         )
         return CollectionModel.from_dict(data["item"])
 
     async def delete_collection(self, collection_id: int) -> bool:
         """Delete a collection."""
-        await self._make_request("DELETE", f"/collection/{collection_id}")
+        await self._make_request(
+            "DELETE", f"collection/{collection_id}", expect_empty=True
+        )
         return True
 
     # Health and status methods
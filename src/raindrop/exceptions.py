@@ -1,11 +1,18 @@
 """Custom exceptions for Raindrop.io API interactions."""
 
-from typing import Optional, Dict, Any
+from types import MappingProxyType
+from typing import Optional, Dict, Any, Mapping
+
+
+# Shared by every error raised without details, so none allocates its own dict
+_EMPTY_DETAILS: Mapping[str, Any] = MappingProxyType({})
 
 
 class RaindropError(Exception):
     """Base exception for Raindrop.io API errors."""
 
+    __slots__ = ("status_code", "details")
+
     def __init__(
         self,
         message: str,
@@ -14,12 +21,18 @@ class RaindropError(Exception):
     ):
         super().__init__(message)
         self.status_code = status_code
-        self.details = details or {}
+        self.details: Mapping[str, Any] = details or _EMPTY_DETAILS
 
 
 class AuthenticationError(RaindropError):
     """Authentication-related errors."""
 
+    __slots__ = ()
+    recovery_suggestion = (
+        "Please check your RAINDROP_API_TOKEN in the .env file. "
+        "You can generate a new token at https://app.raindrop.io/settings/integrations"
+    )
+
     def __init__(
         self,
         message: str = "Authentication failed",
@@ -28,66 +41,55 @@ class AuthenticationError(RaindropError):
     ):
         super().__init__(message, status_code, details)
 
-    @property
-    def recovery_suggestion(self) -> str:
-        """Provide recovery suggestions for authentication errors."""
-        return (
-            "Please check your RAINDROP_API_TOKEN in the .env file. "
-            "You can generate a new token at https://app.raindrop.io/settings/integrations"
-        )
-
 
 class InvalidTokenError(AuthenticationError):
     """Invalid API token error."""
 
+    __slots__ = ()
+    recovery_suggestion = (
+        "The provided API token is invalid or malformed. "
+        "Please verify your RAINDROP_API_TOKEN in the .env file. "
+        "Generate a new token at https://app.raindrop.io/settings/integrations"
+    )
+
     def __init__(self, message: str = "Invalid API token provided"):
         super().__init__(message, 401)
 
-    @property
-    def recovery_suggestion(self) -> str:
-        """Recovery suggestion for invalid token."""
-        return (
-            "The provided API token is invalid or malformed. "
-            "Please verify your RAINDROP_API_TOKEN in the .env file. "
-            "Generate a new token at https://app.raindrop.io/settings/integrations"
-        )
-
 
 class TokenExpiredError(AuthenticationError):
     """Expired API token error."""
 
+    __slots__ = ()
+    recovery_suggestion = (
+        "Your API token has expired. "
+        "Please generate a new token at https://app.raindrop.io/settings/integrations "
+        "and update your .env file"
+    )
+
     def __init__(self, message: str = "API token has expired"):
         super().__init__(message, 401)
 
-    @property
-    def recovery_suggestion(self) -> str:
-        """Recovery suggestion for expired token."""
-        return (
-            "Your API token has expired. "
-            "Please generate a new token at https://app.raindrop.io/settings/integrations "
-            "and update your .env file"
-        )
-
 
 class MissingTokenError(AuthenticationError):
     """Missing API token error."""
 
+    __slots__ = ()
+    recovery_suggestion = (
+        "No API token is configured. "
+        "Please add your RAINDROP_API_TOKEN to the .env file. "
+        "Generate a token at https://app.raindrop.io/settings/integrations"
+    )
+
     def __init__(self, message: str = "API token is required but not configured"):
         super().__init__(message, 401)
 
-    @property
-    def recovery_suggestion(self) -> str:
-        """Recovery suggestion for missing token."""
-        return (
-            "No API token is configured. "
-            "Please add your RAINDROP_API_TOKEN to the .env file. "
-            "Generate a token at https://app.raindrop.io/settings/integrations"
-        )
-
 
 class RateLimitError(RaindropError):
     """Rate limiting error."""
 
+    __slots__ = ("retry_after",)
+    _RECOVERY_PREFIX = "You have exceeded the API rate limit."
+
     def __init__(
         self, message: str = "Rate limit exceeded", retry_after: Optional[int] = None
     ):
@@ -97,15 +99,18 @@ class RateLimitError(RaindropError):
     @property
     def recovery_suggestion(self) -> str:
         """Recovery suggestion for rate limit errors."""
-        retry_msg = ""
         if self.retry_after:
-            retry_msg = f" Please retry after {self.retry_after} seconds."
-        return f"You have exceeded the API rate limit.{retry_msg}"
+            return (
+                f"{self._RECOVERY_PREFIX} Please retry after {self.retry_after} seconds."
+            )
+        return self._RECOVERY_PREFIX
 
 
 class ValidationError(RaindropError):
     """Data validation error."""
 
+    __slots__ = ("field",)
+
     def __init__(self, message: str, field: Optional[str] = None):
         super().__init__(message, 400)
         self.field = field
@@ -114,6 +119,8 @@ class ValidationError(RaindropError):
 class NotFoundError(RaindropError):
     """Resource not found error."""
 
+    __slots__ = ("resource", "resource_id")
+
     def __init__(self, resource: str, resource_id: Optional[int] = None):
         message = f"{resource} not found"
         if resource_id:
@@ -126,6 +133,8 @@ class NotFoundError(RaindropError):
 class PermissionError(RaindropError):
     """Permission denied error."""
 
+    __slots__ = ()
+
     def __init__(self, message: str = "Permission denied"):
         super().__init__(message, 403)
 
@@ -133,6 +142,8 @@ class PermissionError(RaindropError):
 class ServerError(RaindropError):
     """Server-side error."""
 
+    __slots__ = ()
+
     def __init__(self, message: str = "Server error occurred", status_code: int = 500):
         super().__init__(message, status_code)
 
@@ -140,5 +151,7 @@ class ServerError(RaindropError):
 class NetworkError(RaindropError):
     """Network-related error."""
 
+    __slots__ = ()
+
     def __init__(self, message: str = "Network error occurred"):
         super().__init__(message)
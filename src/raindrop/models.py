@@ -1,12 +1,64 @@
 """Data models for Raindrop.io API responses."""
 
+import gc
+import sys
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, List, Optional, Any, Union
-from enum import Enum
-
-
-class BookmarkType(Enum):
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Tuple, Union
+from enum import StrEnum
+
+
+@contextmanager
+def _gc_paused() -> Iterator[None]:
+    """Suspend cyclic garbage collection for the duration of the block."""
+    if not gc.isenabled():
+        yield
+        return
+    gc.disable()
+    try:
+        yield
+    finally:
+        gc.enable()
+
+
+@lru_cache(maxsize=8192)
+def _parse_iso_datetime(date_str: str) -> Optional[datetime]:
+    """Parse an ISO 8601 string (cached; timestamps repeat across records)."""
+    try:
+        if date_str.endswith("Z"):
+            return datetime.fromisoformat(date_str[:-1] + "+00:00")
+        return datetime.fromisoformat(date_str)
+    except ValueError:
+        return None
+
+
+def _parse_datetime(date_str: Optional[str]) -> Optional[datetime]:
+    """Parse datetime string to datetime object."""
+    # Only plausible ISO dates (YYYY-MM-DD...) reach the cache, so junk
+    # input can't pollute it or pay for a raised ValueError
+    if not isinstance(date_str, str) or len(date_str) < 10 or date_str[4] != "-":
+        return None
+    return _parse_iso_datetime(date_str)
+
+
+def _intern(value: Any) -> Any:
+    """Intern a string so repeats across a result page share one object."""
+    return sys.intern(value) if type(value) is str else value
+
+
+def _isoformat(
+    value: datetime, memo: Optional[Tuple[datetime, str]]
+) -> Tuple[datetime, str]:
+    """Format a datetime as ISO 8601, reusing ``memo`` if it was built for it."""
+    if memo is not None and memo[0] is value:
+        return memo
+    return value, value.isoformat()
+
+
+class BookmarkType(StrEnum):
     """Bookmark type enumeration."""
 
     LINK = "link"
@@ -17,7 +69,7 @@ class BookmarkType(Enum):
     AUDIO = "audio"
 
 
-class CollectionView(Enum):
+class CollectionView(StrEnum):
     """Collection view enumeration."""
 
     LIST = "list"
@@ -26,7 +78,16 @@ class CollectionView(Enum):
     MASONRY = "masonry"
 
 
-@dataclass
+# Value -> member lookups, avoiding Enum.__call__ on every record
+_BOOKMARK_TYPES: Mapping[str, BookmarkType] = MappingProxyType(
+    {t.value: t for t in BookmarkType}
+)
+_COLLECTION_VIEWS: Mapping[str, CollectionView] = MappingProxyType(
+    {v.value: v for v in CollectionView}
+)
+
+
+@dataclass(slots=True)
 class MediaModel:
     """Media information for a bookmark."""
 
@@ -34,7 +95,7 @@ class MediaModel:
     type: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class UserModel:
     """User information model."""
 
@@ -51,22 +112,12 @@ class UserModel:
             id=data.get("_id") or data.get("id") or data.get("$id"),  # Handle _id, id, and $id formats
             name=data.get("name", ""),
             email=data.get("email", ""),
-            registered=cls._parse_datetime(data.get("registered")),
-            lastAction=cls._parse_datetime(data.get("lastAction")),
+            registered=_parse_datetime(data.get("registered")),
+            lastAction=_parse_datetime(data.get("lastAction")),
         )
 
-    @staticmethod
-    def _parse_datetime(date_str: Optional[str]) -> Optional[datetime]:
-        """Parse datetime string to datetime object."""
-        if not date_str:
-            return None
-        try:
-            return datetime.fromisoformat(date_str.replace("Z", "+00:00"))
-        except (ValueError, TypeError):
-            return None
 
-
-@dataclass
+@dataclass(slots=True)
 class CollectionModel:
     """Collection model for Raindrop.io collections."""
 
@@ -76,18 +127,21 @@ class CollectionModel:
     public: bool = False
     view: CollectionView = CollectionView.LIST
     count: int = 0
-    cover: Optional[List[str]] = None
+    cover: List[str] = field(default_factory=list, repr=False, compare=False)
     created: Optional[datetime] = None
     lastUpdate: Optional[datetime] = None
     expanded: bool = True
     sort: int = 0
-    user: Optional[UserModel] = None
+    user: Optional[UserModel] = field(default=None, repr=False, compare=False)
     parent_id: Optional[int] = None
 
-    def __post_init__(self) -> None:
-        """Initialize mutable defaults."""
-        if self.cover is None:
-            self.cover = []
+    # isoformat() output memoized by to_dict, keyed on the source datetime
+    _created_iso: Optional[Tuple[datetime, str]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _last_update_iso: Optional[Tuple[datetime, str]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "CollectionModel":
@@ -103,14 +157,15 @@ class CollectionModel:
 
         return cls(
             id=data.get("_id") or data.get("id") or data.get("$id"),  # Handle _id, id, and $id formats
-            title=data.get("title", ""),
+            # Many bookmarks on a page share a collection, so share its title
+            title=_intern(data.get("title", "")),
             description=data.get("description", ""),
             public=data.get("public", False),
-            view=CollectionView(data.get("view", "list")),
+            view=_COLLECTION_VIEWS.get(data.get("view", "list"), CollectionView.LIST),
             count=data.get("count", 0),
-            cover=data.get("cover", []),
-            created=cls._parse_datetime(data.get("created")),
-            lastUpdate=cls._parse_datetime(data.get("lastUpdate")),
+            cover=data.get("cover") or [],
+            created=_parse_datetime(data.get("created")),
+            lastUpdate=_parse_datetime(data.get("lastUpdate")),
             expanded=data.get("expanded", True),
             sort=data.get("sort", 0),
             user=user,
@@ -132,9 +187,11 @@ class CollectionModel:
         }
 
         if self.created:
-            result["created"] = self.created.isoformat()
+            self._created_iso = _isoformat(self.created, self._created_iso)
+            result["created"] = self._created_iso[1]
         if self.lastUpdate:
-            result["lastUpdate"] = self.lastUpdate.isoformat()
+            self._last_update_iso = _isoformat(self.lastUpdate, self._last_update_iso)
+            result["lastUpdate"] = self._last_update_iso[1]
         if self.user:
             result["user"] = {
                 "id": self.user.id,
@@ -146,42 +203,33 @@ class CollectionModel:
 
         return result
 
-    @staticmethod
-    def _parse_datetime(date_str: Optional[str]) -> Optional[datetime]:
-        """Parse datetime string to datetime object."""
-        if not date_str:
-            return None
-        try:
-            return datetime.fromisoformat(date_str.replace("Z", "+00:00"))
-        except (ValueError, TypeError):
-            return None
-
 
-@dataclass
+@dataclass(slots=True)
 class BookmarkModel:
     """Bookmark model for Raindrop.io bookmarks."""
 
     id: int
     title: str
-    excerpt: str = ""
-    note: str = ""
+    excerpt: str = field(default="", repr=False, compare=False)
+    note: str = field(default="", repr=False, compare=False)
     type: BookmarkType = BookmarkType.LINK
-    cover: str = ""
+    cover: str = field(default="", repr=False, compare=False)
     tags: List[str] = field(default_factory=list)
     created: Optional[datetime] = None
     lastUpdate: Optional[datetime] = None
     domain: str = ""
     link: str = ""
-    media: Optional[List[MediaModel]] = None
-    user: Optional[UserModel] = None
+    media: List[MediaModel] = field(default_factory=list, repr=False, compare=False)
+    user: Optional[UserModel] = field(default=None, repr=False, compare=False)
     collection: Optional[CollectionModel] = None
 
-    def __post_init__(self) -> None:
-        """Initialize mutable defaults."""
-        if self.media is None:
-            self.media = []
-        if not self.tags:
-            self.tags = []
+    # isoformat() output memoized by to_dict, keyed on the source datetime
+    _created_iso: Optional[Tuple[datetime, str]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _last_update_iso: Optional[Tuple[datetime, str]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "BookmarkModel":
@@ -197,40 +245,83 @@ class BookmarkModel:
             collection = CollectionModel.from_dict(collection_data)
 
         # Parse media data
-        media_list = []
-        media_data = data.get("media", [])
-        if isinstance(media_data, list):
-            for item in media_data:
-                if isinstance(item, dict):
-                    media_list.append(
-                        MediaModel(link=item.get("link"), type=item.get("type"))
-                    )
-
-        # Parse bookmark type
-        bookmark_type = BookmarkType.LINK
-        type_str = data.get("type", "link")
-        try:
-            bookmark_type = BookmarkType(type_str)
-        except ValueError:
-            bookmark_type = BookmarkType.LINK
+        media_list = [
+            MediaModel(link=item.get("link"), type=item.get("type"))
+            for item in data.get("media") or ()
+            if isinstance(item, dict)
+        ]
 
         return cls(
             id=data["_id"],
             title=data.get("title", ""),
             excerpt=data.get("excerpt", ""),
             note=data.get("note", ""),
-            type=bookmark_type,
+            type=_BOOKMARK_TYPES.get(data.get("type", "link"), BookmarkType.LINK),
             cover=data.get("cover", ""),
-            tags=data.get("tags", []),
-            created=cls._parse_datetime(data.get("created")),
-            lastUpdate=cls._parse_datetime(data.get("lastUpdate")),
-            domain=data.get("domain", ""),
+            tags=data.get("tags") or [],
+            created=_parse_datetime(data.get("created")),
+            lastUpdate=_parse_datetime(data.get("lastUpdate")),
+            domain=_intern(data.get("domain", "")),
             link=data.get("link", ""),
             media=media_list,
             user=user,
             collection=collection,
         )
 
+    @classmethod
+    def from_dicts(cls, items: List[Dict[str, Any]]) -> List["BookmarkModel"]:
+        """
+        Create BookmarkModels from a page of dictionary data.
+
+        Equivalent to calling from_dict per item, with lookups hoisted out
+        of the loop since this runs for every bookmark on a result page.
+        """
+        type_map = _BOOKMARK_TYPES
+        default_type = BookmarkType.LINK
+        parse_dt = _parse_datetime
+        parse_user = UserModel.from_dict
+        parse_collection = CollectionModel.from_dict
+        intern = _intern
+
+        bookmarks: List["BookmarkModel"] = []
+        append = bookmarks.append
+        # Parsed records hold no reference cycles, so allocation-triggered
+        # GC passes over a large page are wasted work
+        with _gc_paused():
+            for data in items:
+                get = data.get
+                user_data = get("user")
+                collection_data = get("collection")
+                media_data = get("media") or ()
+
+                append(
+                    cls(
+                        id=data["_id"],
+                        title=get("title", ""),
+                        excerpt=get("excerpt", ""),
+                        note=get("note", ""),
+                        type=type_map.get(get("type", "link"), default_type),
+                        cover=get("cover", ""),
+                        tags=get("tags") or [],
+                        created=parse_dt(get("created")),
+                        lastUpdate=parse_dt(get("lastUpdate")),
+                        domain=intern(get("domain", "")),
+                        link=get("link", ""),
+                        media=[
+                            MediaModel(link=m.get("link"), type=m.get("type"))
+                            for m in media_data
+                            if isinstance(m, dict)
+                        ],
+                        user=parse_user(user_data) if user_data else None,
+                        collection=(
+                            parse_collection(collection_data)
+                            if collection_data and isinstance(collection_data, dict)
+                            else None
+                        ),
+                    )
+                )
+        return bookmarks
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert model to dictionary."""
         result = {
@@ -246,9 +337,11 @@ class BookmarkModel:
         }
 
         if self.created:
-            result["created"] = self.created.isoformat()
+            self._created_iso = _isoformat(self.created, self._created_iso)
+            result["created"] = self._created_iso[1]
         if self.lastUpdate:
-            result["lastUpdate"] = self.lastUpdate.isoformat()
+            self._last_update_iso = _isoformat(self.lastUpdate, self._last_update_iso)
+            result["lastUpdate"] = self._last_update_iso[1]
 
         if self.media:
             result["media"] = [{"link": m.link, "type": m.type} for m in self.media]
@@ -272,13 +365,3 @@ class BookmarkModel:
         if not self.title:
             return False
         return True
-
-    @staticmethod
-    def _parse_datetime(date_str: Optional[str]) -> Optional[datetime]:
-        """Parse datetime string to datetime object."""
-        if not date_str:
-            return None
-        try:
-            return datetime.fromisoformat(date_str.replace("Z", "+00:00"))
-        except (ValueError, TypeError):
-            return None
@@ -1,10 +1,11 @@
 """Rate limiting system with token bucket algorithm and circuit breaker."""
 
 import asyncio
+import itertools
 import time
 from typing import Dict, Optional, Tuple, Any
 from enum import Enum
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
 from .exceptions import RateLimitError
 from ..utils.config import Config
 from ..utils.logging import get_logger
@@ -21,6 +22,14 @@ class CircuitState(Enum):
     HALF_OPEN = "half_open"  # Testing if service recovered
 
 
+# Whether each state lets requests through without a transition check
+_STATE_ALLOWS_EXECUTION = {
+    CircuitState.CLOSED: True,
+    CircuitState.OPEN: False,
+    CircuitState.HALF_OPEN: True,
+}
+
+
 @dataclass
 class TokenBucket:
     """Token bucket for rate limiting."""
@@ -28,7 +37,7 @@ class TokenBucket:
     capacity: int
     tokens: float
     refill_rate: float  # tokens per second
-    last_refill: float = field(default_factory=time.time)
+    last_refill: float = field(default_factory=time.monotonic)
 
     def consume(self, tokens: int = 1) -> bool:
         """
@@ -49,7 +58,7 @@ class TokenBucket:
 
     def _refill(self) -> None:
         """Refill tokens based on elapsed time."""
-        now = time.time()
+        now = time.monotonic()
         elapsed = now - self.last_refill
 
         # Add tokens based on elapsed time
@@ -60,7 +69,7 @@ class TokenBucket:
     def tokens_available(self) -> int:
         """Get current number of available tokens."""
         self._refill()
-        return int(self.tokens)
+        return max(0, int(self.tokens))
 
     def time_until_available(self, tokens: int = 1) -> float:
         """
@@ -80,6 +89,19 @@ class TokenBucket:
         tokens_needed = tokens - self.tokens
         return tokens_needed / self.refill_rate
 
+    def drain_for(self, seconds: float) -> None:
+        """
+        Empty the bucket so the next token is not available for ``seconds``.
+
+        The balance may go below zero to hold the wait; it is never raised,
+        so a bucket that is already drained further stays that way.
+
+        Args:
+            seconds: Time before a single token can be consumed again
+        """
+        self._refill()
+        self.tokens = min(self.tokens, 1 - seconds * self.refill_rate)
+
 
 @dataclass
 class CircuitBreaker:
@@ -96,20 +118,16 @@ class CircuitBreaker:
 
     def can_execute(self) -> bool:
         """Check if request can be executed through circuit breaker."""
-        if self.state == CircuitState.CLOSED:
-            return True
-        elif self.state == CircuitState.OPEN:
-            # Check if we should transition to half-open
-            if time.time() - self.last_failure_time >= self.recovery_timeout:
-                self.state = CircuitState.HALF_OPEN
-                self.success_count = 0
-                logger.info("Circuit breaker transitioning to HALF_OPEN")
-                return True
-            return False
-        elif self.state == CircuitState.HALF_OPEN:
-            return True
+        return _STATE_ALLOWS_EXECUTION[self.state] or self._try_half_open()
 
-        return False
+    def _try_half_open(self) -> bool:
+        """Move an open circuit to half-open once the recovery timeout passes."""
+        if time.monotonic() - self.last_failure_time < self.recovery_timeout:
+            return False
+        self.state = CircuitState.HALF_OPEN
+        self.success_count = 0
+        logger.info("Circuit breaker transitioning to HALF_OPEN")
+        return True
 
     def record_success(self) -> None:
         """Record a successful operation."""
@@ -126,7 +144,7 @@ class CircuitBreaker:
     def record_failure(self) -> None:
         """Record a failed operation."""
         self.failure_count += 1
-        self.last_failure_time = time.time()
+        self.last_failure_time = time.monotonic()
 
         if self.state == CircuitState.CLOSED:
             if self.failure_count >= self.failure_threshold:
@@ -137,82 +155,54 @@ class CircuitBreaker:
             logger.warning("Circuit breaker OPEN - failure during half-open test")
 
 
+# Waits shorter than this are slept through inline rather than queued
+_SHORT_WAIT = 0.005
+
+# Priority names mapped to heap order (lower is served first)
+_PRIORITY_ORDER = {"high": 0, "normal": 1, "low": 2}
+_PRIORITY_NAMES = {order: name for name, order in _PRIORITY_ORDER.items()}
+
+
 class PriorityQueue:
     """Priority queue for request management."""
 
     def __init__(self) -> None:
-        self._high_priority: asyncio.Queue[Any] = asyncio.Queue()
-        self._normal_priority: asyncio.Queue[Any] = asyncio.Queue()
-        self._low_priority: asyncio.Queue[Any] = asyncio.Queue()
+        self._queue: asyncio.PriorityQueue[Tuple[int, int, Any]] = (
+            asyncio.PriorityQueue()
+        )
+        # Sequence numbers keep FIFO order within a priority level
+        self._seq = itertools.count()
+        self._sizes = {name: 0 for name in _PRIORITY_ORDER}
 
     async def put(self, item: Any, priority: str = "normal") -> None:
         """Add item to queue with specified priority."""
-        if priority == "high":
-            await self._high_priority.put(item)
-        elif priority == "low":
-            await self._low_priority.put(item)
-        else:
-            await self._normal_priority.put(item)
+        if priority not in _PRIORITY_ORDER:
+            priority = "normal"
+        self._sizes[priority] += 1
+        await self._queue.put((_PRIORITY_ORDER[priority], next(self._seq), item))
 
     async def get(self) -> Tuple[Any, str]:
         """Get next item from queue, respecting priority."""
-        # Check high priority first
-        if not self._high_priority.empty():
-            item = await self._high_priority.get()
-            return item, "high"
-
-        # Then normal priority
-        if not self._normal_priority.empty():
-            item = await self._normal_priority.get()
-            return item, "normal"
-
-        # Finally low priority
-        if not self._low_priority.empty():
-            item = await self._low_priority.get()
-            return item, "low"
-
-        # If all queues are empty, wait for any item
-        tasks = [
-            asyncio.create_task(self._high_priority.get()),
-            asyncio.create_task(self._normal_priority.get()),
-            asyncio.create_task(self._low_priority.get()),
-        ]
-
-        try:
-            done, pending = await asyncio.wait(
-                tasks, return_when=asyncio.FIRST_COMPLETED
-            )
-
-            # Cancel remaining tasks
-            for task in pending:
-                task.cancel()
-
-            # Get result from completed task
-            completed_task = next(iter(done))
-            result = await completed_task
-
-            # Determine priority based on which task completed
-            if completed_task == tasks[0]:
-                return result, "high"
-            elif completed_task == tasks[1]:
-                return result, "normal"
-            else:
-                return result, "low"
-
-        except Exception:
-            # Cancel all tasks on error
-            for task in tasks:
-                if not task.done():
-                    task.cancel()
-            raise
+        order, _, item = await self._queue.get()
+        priority = _PRIORITY_NAMES[order]
+        self._sizes[priority] -= 1
+        return item, priority
 
     def qsize(self) -> Dict[str, int]:
         """Get queue sizes by priority."""
-        return {
-            "high": self._high_priority.qsize(),
-            "normal": self._normal_priority.qsize(),
-            "low": self._low_priority.qsize(),
-        }
+        return dict(self._sizes)
+
+
+@dataclass(slots=True)
+class RateLimiterStats:
+    """Counters collected by the rate limiter."""
+
+    requests_processed: int = 0
+    requests_rejected: int = 0
+    requests_queued: int = 0
+    requests_rate_limited: int = 0
+    circuit_breaker_trips: int = 0
+    average_wait_time: float = 0.0
 
 
 class RateLimiter:
@@ -250,13 +240,10 @@ class RateLimiter:
         self._running = False
 
         # Statistics
-        self.stats = {
-            "requests_processed": 0,
-            "requests_rejected": 0,
-            "requests_queued": 0,
-            "circuit_breaker_trips": 0,
-            "average_wait_time": 0.0,
-        }
+        self.stats = RateLimiterStats()
+        # Queued acquire() calls that haven't returned yet
+        self._backlog = 0
+        self._wait_samples = 0
 
     async def start(self) -> None:
         """Start the rate limiter and queue processor."""
@@ -294,21 +281,34 @@ class RateLimiter:
         Raises:
             RateLimitError: If rate limit exceeded and cannot queue
         """
-        start_time = time.time()
+        circuit_breaker = self.circuit_breaker
 
-        # Check circuit breaker first
-        if self.circuit_breaker and not self.circuit_breaker.can_execute():
-            self.stats["requests_rejected"] += 1
+        # Fast path: closed (or no) circuit breaker and a token on hand
+        if circuit_breaker is None or circuit_breaker.state is CircuitState.CLOSED:
+            if self.token_bucket.consume():
+                self.stats.requests_processed += 1
+                return True
+        elif not circuit_breaker.can_execute():
+            self.stats.requests_rejected += 1
             raise RateLimitError(
                 "Service temporarily unavailable (circuit breaker open)"
             )
-
-        # Try immediate token consumption
-        if self.token_bucket.consume():
-            self.stats["requests_processed"] += 1
+        elif self.token_bucket.consume():
+            self.stats.requests_processed += 1
             return True
 
+        # With nothing queued ahead of us, ride out a near-immediate refill
+        # inline rather than paying for a queue round trip
+        if not self._backlog:
+            wait_time = self.token_bucket.time_until_available()
+            if wait_time < _SHORT_WAIT:
+                await asyncio.sleep(wait_time)
+                if self.token_bucket.consume():
+                    self.stats.requests_processed += 1
+                    return True
+
         # If no tokens available, queue the request
+        start_time = time.monotonic()
         future: asyncio.Future[bool] = asyncio.Future()
         request_info = {
             "timestamp": start_time,
@@ -317,21 +317,24 @@ class RateLimiter:
         }
 
         await self.request_queue.put(request_info, priority)
-        self.stats["requests_queued"] += 1
+        self.stats.requests_queued += 1
+        self._backlog += 1
 
         try:
             # Wait for request to be processed or timeout
             result: bool = await asyncio.wait_for(future, timeout=timeout)
 
-            wait_time = time.time() - start_time
+            wait_time = time.monotonic() - start_time
             self._update_average_wait_time(wait_time)
 
             return result
 
         except asyncio.TimeoutError:
-            self.stats["requests_rejected"] += 1
+            self.stats.requests_rejected += 1
             logger.warning(f"Request timed out after {timeout}s")
             return False
+        finally:
+            self._backlog -= 1
 
     async def _process_queue(self) -> None:
         """Process queued requests."""
@@ -342,10 +345,10 @@ class RateLimiter:
                 # Get next request from queue
                 request_info, priority = await self.request_queue.get()
 
-                # Wait for tokens to be available
+                # Sleep until the next token is due instead of polling; the
+                # small margin absorbs float error so consume() succeeds
                 while self._running and not self.token_bucket.consume():
-                    wait_time = self.token_bucket.time_until_available()
-                    await asyncio.sleep(min(wait_time, 1.0))
+                    await asyncio.sleep(self.token_bucket.time_until_available() + 1e-3)
 
                 if not self._running:
                     break
@@ -353,12 +356,12 @@ class RateLimiter:
                 # Check circuit breaker
                 if self.circuit_breaker and not self.circuit_breaker.can_execute():
                     request_info["future"].set_result(False)
-                    self.stats["requests_rejected"] += 1
+                    self.stats.requests_rejected += 1
                     continue
 
                 # Grant permission
                 request_info["future"].set_result(True)
-                self.stats["requests_processed"] += 1
+                self.stats.requests_processed += 1
 
             except asyncio.CancelledError:
                 break
@@ -378,7 +381,21 @@ class RateLimiter:
         if self.circuit_breaker:
             self.circuit_breaker.record_failure()
             if self.circuit_breaker.state == CircuitState.OPEN:
-                self.stats["circuit_breaker_trips"] += 1
+                self.stats.circuit_breaker_trips += 1
+
+    def record_rate_limited(self, retry_after: float) -> None:
+        """
+        Record a server-side rate limit response.
+
+        Drains the token bucket so no further requests are granted until
+        ``retry_after`` seconds of refill have elapsed.
+
+        Args:
+            retry_after: Seconds the server asked us to wait
+        """
+        self.token_bucket.drain_for(retry_after)
+        self.stats.requests_rate_limited += 1
+        logger.warning("Server rate limit hit, pausing requests for %ss", retry_after)
 
     def get_status(self) -> Dict[str, Any]:
         """Get current rate limiter status."""
@@ -397,18 +414,14 @@ class RateLimiter:
                     self.circuit_breaker.failure_count if self.circuit_breaker else 0
                 ),
             },
-            "statistics": self.stats.copy(),
+            "statistics": asdict(self.stats),
         }
 
     def _update_average_wait_time(self, wait_time: float) -> None:
         """Update average wait time statistic."""
-        current_avg = self.stats["average_wait_time"]
-        processed = self.stats["requests_processed"]
-
-        if processed <= 1:
-            self.stats["average_wait_time"] = wait_time
-        else:
-            # Calculate rolling average
-            self.stats["average_wait_time"] = (
-                (current_avg * (processed - 1)) + wait_time
-            ) / processed
+        # Incremental mean over requests that had to wait in the queue
+        self._wait_samples += 1
+        stats = self.stats
+        stats.average_wait_time += (
+            wait_time - stats.average_wait_time
+        ) / self._wait_samples
@@ -1,19 +1,31 @@
 """MCP protocol schemas for Raindrop.io operations."""
 
-from typing import Dict, List, Optional, Any, Union
+from datetime import datetime
+from types import MappingProxyType
+from typing import Annotated, Dict, List, Literal, Mapping, Optional, Any, Union
 from dataclasses import dataclass
-from pydantic import BaseModel, Field, HttpUrl, field_validator
-from enum import Enum
-
-
-class SortOrder(Enum):
+from functools import lru_cache
+from pydantic import (
+    BaseModel,
+    BeforeValidator,
+    ConfigDict,
+    Field,
+    StringConstraints,
+    TypeAdapter,
+)
+from pydantic.json_schema import GenerateJsonSchema, JsonSchemaValue
+from pydantic_core import core_schema
+from enum import StrEnum
+
+
+class SortOrder(StrEnum):
     """Sort order options."""
 
     ASC = "asc"
     DESC = "desc"
 
 
-class SearchSort(Enum):
+class SearchSort(StrEnum):
     """Search sort options."""
 
     SCORE = "score"
@@ -23,7 +35,7 @@ class SearchSort(Enum):
     DOMAIN = "domain"
 
 
-class BookmarkType(Enum):
+class BookmarkType(StrEnum):
     """Bookmark type enumeration."""
 
     LINK = "link"
@@ -34,138 +46,117 @@ class BookmarkType(Enum):
     AUDIO = "audio"
 
 
+def _lowercase(v: Any) -> Any:
+    """Lowercase string input ahead of literal validation."""
+    return v.lower() if isinstance(v, str) else v
+
+
+# Literal choices are checked by pydantic-core without a Python callback
+_Order = Annotated[Literal["asc", "desc"], BeforeValidator(_lowercase)]
+_BookmarkSort = Literal["score", "created", "lastUpdate", "title", "domain"]
+_CollectionSort = Literal["title", "count", "created", "lastUpdate"]
+_CollectionView = Literal["list", "simple", "grid", "masonry"]
+
+# Up to 50 tags of at most 50 characters, validated entirely in pydantic-core
+_TagList = Annotated[
+    List[Annotated[str, StringConstraints(max_length=50)]], Field(max_length=50)
+]
+
+# URLs are stored and returned as given, so a scheme check is enough and
+# avoids the full URL parse (and IDNA host encoding) that HttpUrl performs
+_HttpUrl = Annotated[
+    str,
+    StringConstraints(
+        strip_whitespace=True,
+        min_length=8,
+        max_length=2048,
+        pattern=r"^[Hh][Tt][Tt][Pp][Ss]?://\S+$",
+    ),
+]
+
+
 # Tool argument schemas
-class SearchBookmarksArgs(BaseModel):
+class _ToolArgs(BaseModel):
+    """Base for tool arguments, which are built once and only read after."""
+
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
+
+class SearchBookmarksArgs(_ToolArgs):
     """Arguments for search_bookmarks tool."""
 
     query: Optional[str] = Field(None, description="Search query string")
     collection_id: Optional[int] = Field(
         None, description="Collection ID to search within"
     )
-    type: Optional[str] = Field(None, description="Bookmark type filter")
+    type: Optional[str] = Field(
+        None,
+        description=(
+            "Bookmark type filter (link, article, image, video, document, audio)"
+        ),
+    )
     tag: Optional[str] = Field(None, description="Tag filter")
-    sort: Optional[str] = Field("created", description="Sort field")
-    order: Optional[str] = Field("desc", description="Sort order (asc/desc)")
+    sort: Optional[_BookmarkSort] = Field("created", description="Sort field")
+    order: Optional[_Order] = Field("desc", description="Sort order")
     page: Optional[int] = Field(0, ge=0, description="Page number (0-based)")
     per_page: Optional[int] = Field(50, ge=1, le=50, description="Items per page")
 
-    @field_validator("sort")
-    @classmethod
-    def validate_sort(cls, v: Optional[str]) -> Optional[str]:
-        """Validate sort field."""
-        valid_sorts = ["score", "created", "lastUpdate", "title", "domain"]
-        if v and v not in valid_sorts:
-            raise ValueError(f"Sort must be one of: {', '.join(valid_sorts)}")
-        return v
-
-    @field_validator("order")
-    @classmethod
-    def validate_order(cls, v: Optional[str]) -> Optional[str]:
-        """Validate sort order."""
-        if v and v.lower() not in ["asc", "desc"]:
-            raise ValueError("Order must be 'asc' or 'desc'")
-        return v.lower() if v else v
-
 
-class CreateBookmarkArgs(BaseModel):
+class CreateBookmarkArgs(_ToolArgs):
     """Arguments for create_bookmark tool."""
 
-    url: HttpUrl = Field(..., description="Bookmark URL")
+    url: _HttpUrl = Field(..., description="Bookmark URL")
     title: Optional[str] = Field(None, max_length=300, description="Bookmark title")
     excerpt: Optional[str] = Field(
         None, max_length=1000, description="Bookmark excerpt"
     )
     note: Optional[str] = Field(None, max_length=10000, description="Personal note")
-    tags: Optional[List[str]] = Field(None, description="List of tags")
+    tags: Optional[_TagList] = Field(None, description="List of tags")
     collection_id: Optional[int] = Field(None, description="Collection ID")
 
-    @field_validator("tags")
-    @classmethod
-    def validate_tags(cls, v: Optional[List[str]]) -> Optional[List[str]]:
-        """Validate tags list."""
-        if v is None:
-            return v
-        if len(v) > 50:
-            raise ValueError("Maximum 50 tags allowed")
-        for tag in v:
-            if not isinstance(tag, str):
-                raise ValueError("All tags must be strings")
-            if len(tag) > 50:
-                raise ValueError("Tag length cannot exceed 50 characters")
-        return v
-
-
-class UpdateBookmarkArgs(BaseModel):
+
+class UpdateBookmarkArgs(_ToolArgs):
     """Arguments for update_bookmark tool."""
 
     bookmark_id: int = Field(..., description="Bookmark ID to update")
     title: Optional[str] = Field(None, max_length=300, description="New title")
     excerpt: Optional[str] = Field(None, max_length=1000, description="New excerpt")
     note: Optional[str] = Field(None, max_length=10000, description="New note")
-    tags: Optional[List[str]] = Field(None, description="New tags list")
+    tags: Optional[_TagList] = Field(None, description="New tags list")
     collection_id: Optional[int] = Field(None, description="New collection ID")
 
-    @field_validator("tags")
-    @classmethod
-    def validate_tags(cls, v: Optional[List[str]]) -> Optional[List[str]]:
-        """Validate tags list."""
-        if v is None:
-            return v
-        if len(v) > 50:
-            raise ValueError("Maximum 50 tags allowed")
-        for tag in v:
-            if not isinstance(tag, str):
-                raise ValueError("All tags must be strings")
-            if len(tag) > 50:
-                raise ValueError("Tag length cannot exceed 50 characters")
-        return v
-
-
-class GetBookmarkArgs(BaseModel):
+
+class GetBookmarkArgs(_ToolArgs):
     """Arguments for get_bookmark tool."""
 
-    bookmark_id: int = Field(..., description="Bookmark ID to retrieve")
+    bookmark_id: int = Field(..., description="Bookmark ID")
 
 
-class DeleteBookmarkArgs(BaseModel):
+class DeleteBookmarkArgs(_ToolArgs):
     """Arguments for delete_bookmark tool."""
 
     bookmark_id: int = Field(..., description="Bookmark ID to delete")
 
 
-class GetRecentUnsortedArgs(BaseModel):
+class GetRecentUnsortedArgs(_ToolArgs):
     """Arguments for get_recent_unsorted tool."""
 
     limit: Optional[int] = Field(
-        50, ge=1, le=50, description="Maximum number of recent unsorted bookmarks to retrieve (default: 50, max: 50)"
+        50,
+        ge=1,
+        le=50,
+        description="Maximum number of recent unsorted bookmarks to retrieve",
     )
 
 
-class ListCollectionsArgs(BaseModel):
+class ListCollectionsArgs(_ToolArgs):
     """Arguments for list_collections tool."""
 
-    sort: Optional[str] = Field("title", description="Sort field")
-    order: Optional[str] = Field("asc", description="Sort order")
-
-    @field_validator("sort")
-    @classmethod
-    def validate_sort(cls, v: Optional[str]) -> Optional[str]:
-        """Validate sort field."""
-        valid_sorts = ["title", "count", "created", "lastUpdate"]
-        if v and v not in valid_sorts:
-            raise ValueError(f"Sort must be one of: {', '.join(valid_sorts)}")
-        return v
-
-    @field_validator("order")
-    @classmethod
-    def validate_order(cls, v: Optional[str]) -> Optional[str]:
-        """Validate sort order."""
-        if v and v.lower() not in ["asc", "desc"]:
-            raise ValueError("Order must be 'asc' or 'desc'")
-        return v.lower() if v else v
+    sort: Optional[_CollectionSort] = Field("title", description="Sort field")
+    order: Optional[_Order] = Field("asc", description="Sort order")
 
 
-class CreateCollectionArgs(BaseModel):
+class CreateCollectionArgs(_ToolArgs):
     """Arguments for create_collection tool."""
 
     title: str = Field(
@@ -175,20 +166,80 @@ class CreateCollectionArgs(BaseModel):
         None, max_length=500, description="Collection description"
     )
     public: Optional[bool] = Field(False, description="Make collection public")
-    view: Optional[str] = Field("list", description="Collection view type")
+    view: Optional[_CollectionView] = Field("list", description="Collection view type")
 
-    @field_validator("view")
-    @classmethod
-    def validate_view(cls, v: Optional[str]) -> Optional[str]:
-        """Validate view type."""
-        valid_views = ["list", "simple", "grid", "masonry"]
-        if v and v not in valid_views:
-            raise ValueError(f"View must be one of: {', '.join(valid_views)}")
-        return v
+
+# Upper bound on items accepted by one bulk tool call
+BULK_MAX_ITEMS = 100
+
+
+class CreateBookmarksBulkArgs(_ToolArgs):
+    """Arguments for create_bookmarks_bulk tool."""
+
+    items: List[CreateBookmarkArgs] = Field(
+        ..., min_length=1, max_length=BULK_MAX_ITEMS, description="Bookmarks to create"
+    )
+
+
+class UpdateBookmarksBulkArgs(_ToolArgs):
+    """Arguments for update_bookmarks_bulk tool."""
+
+    items: List[UpdateBookmarkArgs] = Field(
+        ..., min_length=1, max_length=BULK_MAX_ITEMS, description="Bookmark updates"
+    )
+
+
+class DeleteBookmarksBulkArgs(_ToolArgs):
+    """Arguments for delete_bookmarks_bulk tool."""
+
+    ids: List[int] = Field(
+        ..., min_length=1, max_length=BULK_MAX_ITEMS, description="Bookmark IDs"
+    )
+
+
+class TagOrMoveBookmarksArgs(_ToolArgs):
+    """Arguments for tag_or_move_bookmarks tool."""
+
+    ids: List[int] = Field(
+        ..., min_length=1, max_length=BULK_MAX_ITEMS, description="Bookmark IDs"
+    )
+    tags: Optional[_TagList] = Field(
+        None, description="Tags to add to every bookmark (empty list removes all)"
+    )
+    collection_id: Optional[int] = Field(
+        None, description="Collection ID to move every bookmark to"
+    )
+
+
+# Adapters for each tool's argument model, built once at import time. They
+# produce the tool input schemas; tool calls themselves are still checked by
+# validate_mcp_tool_args in src/utils/transformers.py
+ARG_ADAPTERS: Dict[str, TypeAdapter[Any]] = {
+    "search_bookmarks": TypeAdapter(SearchBookmarksArgs),
+    "create_bookmark": TypeAdapter(CreateBookmarkArgs),
+    "get_bookmark": TypeAdapter(GetBookmarkArgs),
+    "update_bookmark": TypeAdapter(UpdateBookmarkArgs),
+    "delete_bookmark": TypeAdapter(DeleteBookmarkArgs),
+    "create_bookmarks_bulk": TypeAdapter(CreateBookmarksBulkArgs),
+    "update_bookmarks_bulk": TypeAdapter(UpdateBookmarksBulkArgs),
+    "delete_bookmarks_bulk": TypeAdapter(DeleteBookmarksBulkArgs),
+    "tag_or_move_bookmarks": TypeAdapter(TagOrMoveBookmarksArgs),
+    "get_recent_unsorted": TypeAdapter(GetRecentUnsortedArgs),
+    "list_collections": TypeAdapter(ListCollectionsArgs),
+    "create_collection": TypeAdapter(CreateCollectionArgs),
+}
+
+
+def _iso(value: Optional[datetime]) -> Optional[str]:
+    """Format an optional datetime as ISO 8601."""
+    return value.isoformat() if value is not None else None
 
 
 # Response schemas
-@dataclass
+# These are only ever built from already-validated models, so they stay plain
+# dataclasses with no validation. If one becomes a pydantic model, its from_*
+# classmethod should use model_construct() to keep skipping validation.
+@dataclass(slots=True)
 class BookmarkResponse:
     """MCP response for bookmark data."""
 
@@ -208,23 +259,41 @@ class BookmarkResponse:
     @classmethod
     def from_bookmark_model(cls, bookmark: Any) -> "BookmarkResponse":
         """Create response from BookmarkModel."""
-        return cls(
-            id=bookmark.id,
-            title=bookmark.title,
-            url=bookmark.link,
-            excerpt=bookmark.excerpt,
-            note=bookmark.note,
-            type=bookmark.type.value,
-            tags=bookmark.tags,
-            created=bookmark.created.isoformat() if bookmark.created else None,
-            lastUpdate=bookmark.lastUpdate.isoformat() if bookmark.lastUpdate else None,
-            domain=bookmark.domain,
-            collection_id=bookmark.collection.id if bookmark.collection else None,
-            collection_title=bookmark.collection.title if bookmark.collection else None,
-        )
-
-
-@dataclass
+        return cls(**bookmark_response_dict(bookmark))
+
+    @classmethod
+    def from_bookmark_models(cls, bookmarks: List[Any]) -> List["BookmarkResponse"]:
+        """Create responses from a list of BookmarkModels."""
+        from_model = cls.from_bookmark_model
+        return [from_model(bookmark) for bookmark in bookmarks]
+
+
+def bookmark_response_dict(bookmark: Any) -> Dict[str, Any]:
+    """Build a BookmarkResponse's JSON-ready dict straight from a BookmarkModel.
+
+    For paths that only serialize the result, this skips allocating the
+    response dataclass and copying it back out into a dict.
+    """
+    # Plain attribute reads: on the slotted models the interpreter
+    # specializes them, which measured faster than operator.attrgetter
+    collection = bookmark.collection
+    return {
+        "id": bookmark.id,
+        "title": bookmark.title,
+        "url": bookmark.link,
+        "excerpt": bookmark.excerpt,
+        "note": bookmark.note,
+        "type": bookmark.type,
+        "tags": list(bookmark.tags),
+        "created": _iso(bookmark.created),
+        "lastUpdate": _iso(bookmark.lastUpdate),
+        "domain": bookmark.domain,
+        "collection_id": collection.id if collection else None,
+        "collection_title": collection.title if collection else None,
+    }
+
+
+@dataclass(slots=True)
 class CollectionResponse:
     """MCP response for collection data."""
 
@@ -239,20 +308,23 @@ class CollectionResponse:
     @classmethod
     def from_collection_model(cls, collection: Any) -> "CollectionResponse":
         """Create response from CollectionModel."""
-        return cls(
-            id=collection.id,
-            title=collection.title,
-            description=collection.description,
-            public=collection.public,
-            count=collection.count,
-            created=collection.created.isoformat() if collection.created else None,
-            lastUpdate=(
-                collection.lastUpdate.isoformat() if collection.lastUpdate else None
-            ),
-        )
-
-
-@dataclass
+        return cls(**collection_response_dict(collection))
+
+
+def collection_response_dict(collection: Any) -> Dict[str, Any]:
+    """Build a CollectionResponse's JSON-ready dict straight from a CollectionModel."""
+    return {
+        "id": collection.id,
+        "title": collection.title,
+        "description": collection.description,
+        "public": collection.public,
+        "count": collection.count,
+        "created": _iso(collection.created),
+        "lastUpdate": _iso(collection.lastUpdate),
+    }
+
+
+@dataclass(slots=True)
 class SearchResponse:
     """MCP response for search results."""
 
@@ -264,221 +336,78 @@ class SearchResponse:
     has_more: bool
 
 
-@dataclass
+@dataclass(slots=True)
 class ErrorResponse:
     """MCP error response."""
 
     code: str
     message: str
-    details: Optional[Dict[str, Any]] = None
-
-
-# MCP tool definitions
-MCP_TOOLS = {
-    "search_bookmarks": {
-        "description": "Search bookmarks with optional filters",
-        "inputSchema": {
-            "type": "object",
-            "properties": {
-                "query": {"type": "string", "description": "Search query string"},
-                "collection_id": {
-                    "type": "integer",
-                    "description": "Collection ID to search within",
-                },
-                "type": {
-                    "type": "string",
-                    "description": "Bookmark type filter (link, article, image, video, document, audio)",
-                },
-                "tag": {"type": "string", "description": "Tag filter"},
-                "sort": {
-                    "type": "string",
-                    "enum": ["score", "created", "lastUpdate", "title", "domain"],
-                    "default": "created",
-                    "description": "Sort field",
-                },
-                "order": {
-                    "type": "string",
-                    "enum": ["asc", "desc"],
-                    "default": "desc",
-                    "description": "Sort order",
-                },
-                "page": {
-                    "type": "integer",
-                    "minimum": 0,
-                    "default": 0,
-                    "description": "Page number (0-based)",
-                },
-                "per_page": {
-                    "type": "integer",
-                    "minimum": 1,
-                    "maximum": 50,
-                    "default": 50,
-                    "description": "Items per page",
-                },
-            },
-        },
-    },
-    "create_bookmark": {
-        "description": "Create a new bookmark",
-        "inputSchema": {
-            "type": "object",
-            "properties": {
-                "url": {
-                    "type": "string",
-                    "format": "uri",
-                    "description": "Bookmark URL",
-                },
-                "title": {
-                    "type": "string",
-                    "maxLength": 300,
-                    "description": "Bookmark title",
-                },
-                "excerpt": {
-                    "type": "string",
-                    "maxLength": 1000,
-                    "description": "Bookmark excerpt",
-                },
-                "note": {
-                    "type": "string",
-                    "maxLength": 10000,
-                    "description": "Personal note",
-                },
-                "tags": {
-                    "type": "array",
-                    "items": {"type": "string"},
-                    "maxItems": 50,
-                    "description": "List of tags",
-                },
-                "collection_id": {"type": "integer", "description": "Collection ID"},
-            },
-            "required": ["url"],
-        },
-    },
-    "get_bookmark": {
-        "description": "Get bookmark details by ID",
-        "inputSchema": {
-            "type": "object",
-            "properties": {
-                "bookmark_id": {"type": "integer", "description": "Bookmark ID"}
-            },
-            "required": ["bookmark_id"],
-        },
-    },
-    "update_bookmark": {
-        "description": "Update an existing bookmark",
-        "inputSchema": {
-            "type": "object",
-            "properties": {
-                "bookmark_id": {
-                    "type": "integer",
-                    "description": "Bookmark ID to update",
-                },
-                "title": {
-                    "type": "string",
-                    "maxLength": 300,
-                    "description": "New title",
-                },
-                "excerpt": {
-                    "type": "string",
-                    "maxLength": 1000,
-                    "description": "New excerpt",
-                },
-                "note": {
-                    "type": "string",
-                    "maxLength": 10000,
-                    "description": "New note",
-                },
-                "tags": {
-                    "type": "array",
-                    "items": {"type": "string"},
-                    "maxItems": 50,
-                    "description": "New tags list",
-                },
-                "collection_id": {
-                    "type": "integer",
-                    "description": "New collection ID",
-                },
-            },
-            "required": ["bookmark_id"],
-        },
-    },
-    "delete_bookmark": {
-        "description": "Delete a bookmark",
-        "inputSchema": {
-            "type": "object",
-            "properties": {
-                "bookmark_id": {
-                    "type": "integer",
-                    "description": "Bookmark ID to delete",
-                }
-            },
-            "required": ["bookmark_id"],
-        },
-    },
-    "get_recent_unsorted": {
-        "description": "Get recent unsorted bookmarks (convenience tool for accessing newest items in Unsorted collection)",
-        "inputSchema": {
-            "type": "object",
-            "properties": {
-                "limit": {
-                    "type": "integer",
-                    "minimum": 1,
-                    "maximum": 50,
-                    "default": 50,
-                    "description": "Maximum number of recent unsorted bookmarks to retrieve",
-                }
-            },
-        },
-    },
-    "list_collections": {
-        "description": "List all collections",
-        "inputSchema": {
-            "type": "object",
-            "properties": {
-                "sort": {
-                    "type": "string",
-                    "enum": ["title", "count", "created", "lastUpdate"],
-                    "default": "title",
-                    "description": "Sort field",
-                },
-                "order": {
-                    "type": "string",
-                    "enum": ["asc", "desc"],
-                    "default": "asc",
-                    "description": "Sort order",
-                },
-            },
-        },
-    },
-    "create_collection": {
-        "description": "Create a new collection",
-        "inputSchema": {
-            "type": "object",
-            "properties": {
-                "title": {
-                    "type": "string",
-                    "minLength": 1,
-                    "maxLength": 100,
-                    "description": "Collection title",
-                },
-                "description": {
-                    "type": "string",
-                    "maxLength": 500,
-                    "description": "Collection description",
-                },
-                "public": {
-                    "type": "boolean",
-                    "default": False,
-                    "description": "Make collection public",
-                },
-                "view": {
-                    "type": "string",
-                    "enum": ["list", "simple", "grid", "masonry"],
-                    "default": "list",
-                    "description": "Collection view type",
-                },
-            },
-            "required": ["title"],
-        },
-    },
-}
+    details: Optional[Mapping[str, Any]] = None
+
+
+# Tool descriptions; input schemas are generated from the matching *Args model
+_TOOL_DESCRIPTIONS: Mapping[str, str] = MappingProxyType({
+    "search_bookmarks": "Search bookmarks with optional filters",
+    "create_bookmark": "Create a new bookmark",
+    "get_bookmark": "Get bookmark details by ID",
+    "update_bookmark": "Update an existing bookmark",
+    "delete_bookmark": "Delete a bookmark",
+    "create_bookmarks_bulk": (
+        "Create several bookmarks concurrently; returns one result per item"
+    ),
+    "update_bookmarks_bulk": (
+        "Update several bookmarks concurrently; returns one result per item"
+    ),
+    "delete_bookmarks_bulk": "Delete several bookmarks in one request",
+    "tag_or_move_bookmarks": (
+        "Add tags to and/or move several bookmarks in one request"
+    ),
+    "get_recent_unsorted": (
+        "Get recent unsorted bookmarks "
+        "(convenience tool for accessing newest items in Unsorted collection)"
+    ),
+    "list_collections": "List all collections",
+    "create_collection": "Create a new collection",
+})
+
+
+class _ToolSchemaGenerator(GenerateJsonSchema):
+    """JSON Schema generator producing compact MCP tool input schemas."""
+
+    def nullable_schema(self, schema: core_schema.NullableSchema) -> JsonSchemaValue:
+        # Optional arguments are omitted rather than sent as null
+        return self.generate_inner(schema["schema"])
+
+    def default_schema(
+        self, schema: core_schema.WithDefaultSchema
+    ) -> JsonSchemaValue:
+        json_schema = super().default_schema(schema)
+        if json_schema.get("default", ...) is None:
+            del json_schema["default"]
+        return json_schema
+
+    def field_title_should_be_set(self, schema: Any) -> bool:
+        return False
+
+
+def _input_schema(adapter: TypeAdapter[Any]) -> Dict[str, Any]:
+    """Generate a tool's input schema from its argument adapter."""
+    json_schema = adapter.json_schema(schema_generator=_ToolSchemaGenerator)
+    # Model title and docstring would only duplicate the tool description
+    json_schema.pop("title", None)
+    json_schema.pop("description", None)
+    return json_schema
+
+
+# MCP tool definitions, built on first use so imports that never list
+# tools (CLI entry points, tests) skip generating the schemas
+@lru_cache(maxsize=None)
+def get_mcp_tools() -> Mapping[str, Dict[str, Any]]:
+    """Return the read-only MCP tool definitions, keyed by tool name."""
+    return MappingProxyType({
+        name: {
+            "description": _TOOL_DESCRIPTIONS[name],
+            "inputSchema": _input_schema(adapter),
+        }
+        for name, adapter in ARG_ADAPTERS.items()
+    })
@@ -1,30 +1,31 @@
 """MCP protocol handler for Raindrop.io server."""
 
 import asyncio
-from typing import Dict, List, Optional, Any, Sequence
+from functools import lru_cache, partial
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
 import json
 import sys
+import time
 
 from mcp.server.lowlevel import NotificationOptions, Server
 from mcp.server.models import InitializationOptions
 from mcp import types
 import mcp.server.stdio
 
-from .schemas import MCP_TOOLS
-from ..raindrop.client import RaindropClient
-from ..raindrop.auth import AuthenticationManager
+from .schemas import get_mcp_tools
+from ..raindrop.client import RaindropClient, close_connector
+from ..raindrop.models import CollectionModel
+from ..raindrop.auth import AuthenticationManager, close_shared_session
 from ..raindrop.rate_limiter import RateLimiter
 from ..utils.logging import get_logger
-from ..tools.bookmarks import get_recent_unsorted
+from ..tools.bookmarks import BOOKMARK_OPERATIONS
 from ..utils.transformers import (
     validate_mcp_tool_args,
     mcp_to_raindrop_search_params,
-    mcp_to_raindrop_create_bookmark,
-    mcp_to_raindrop_update_bookmark,
+    raindrop_to_mcp_search_dict,
     mcp_to_raindrop_create_collection,
-    raindrop_to_mcp_search_results,
-    raindrop_to_mcp_bookmark,
-    raindrop_to_mcp_collection,
+    raindrop_to_mcp_collection_dict,
+    sort_mcp_collections,
     format_error_response,
 )
 
@@ -32,6 +33,44 @@ from ..utils.transformers import (
 logger = get_logger(__name__)
 
 
+# Prefer orjson for tool output (several times faster on large result pages).
+# Output is compact: it is read by a model, so indentation only adds bytes.
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> str:
+        """Encode a tool result as compact JSON text."""
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+
+except ImportError:  # pragma: no cover - depends on optional extra
+
+    def _dumps(obj: Any) -> str:
+        """Encode a tool result as compact JSON text."""
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+
+# Tool handler: MCP arguments in, JSON-ready result out
+_ToolHandler = Callable[[Dict[str, Any]], Awaitable[Dict[str, Any]]]
+
+# Bookmark tools that never change collection counts
+_READ_ONLY_BOOKMARK_TOOLS = frozenset(("get_bookmark", "get_recent_unsorted"))
+
+# Seconds a fetched collection list is reused; collections change rarely
+_COLLECTIONS_TTL = 30.0
+
+@lru_cache(maxsize=None)
+def _build_tools() -> Tuple[types.Tool, ...]:
+    """Build the Tool definitions once; the tool table never changes."""
+    return tuple(
+        types.Tool(
+            name=tool_name,
+            description=tool_def["description"],
+            inputSchema=tool_def["inputSchema"],
+        )
+        for tool_name, tool_def in get_mcp_tools().items()
+    )
+
+
 class RaindropMCPServer:
     """
     MCP server for Raindrop.io integration.
@@ -44,6 +83,7 @@ class RaindropMCPServer:
         self,
         auth_manager: Optional[AuthenticationManager] = None,
         rate_limiter: Optional[RateLimiter] = None,
+        client: Optional[RaindropClient] = None,
     ):
         """
         Initialize the MCP server.
@@ -51,10 +91,22 @@ class RaindropMCPServer:
         Args:
             auth_manager: Authentication manager instance
             rate_limiter: Rate limiter instance
+            client: Shared, already initialized Raindrop client. When given,
+                the server uses it for every tool call and leaves closing
+                it to the caller.
         """
-        self.auth_manager = auth_manager or AuthenticationManager()
-        self.rate_limiter = rate_limiter or RateLimiter()
-        self.raindrop_client: Optional[RaindropClient] = None
+        if client is not None:
+            self.auth_manager = client.auth_manager
+            self.rate_limiter = client.rate_limiter
+        else:
+            self.auth_manager = auth_manager or AuthenticationManager()
+            self.rate_limiter = rate_limiter or RateLimiter()
+        self.raindrop_client: Optional[RaindropClient] = client
+        self._owns_client = client is None
+        self._collections_cache: Optional[Tuple[List[CollectionModel], float]] = None
+
+        # Tool name -> handler, built up front so dispatch is a single lookup
+        self._handlers: Dict[str, _ToolHandler] = self._build_handlers()
 
         # Create MCP server instance
         self.server: Server = Server("raindrop-mcp")
@@ -62,6 +114,43 @@ class RaindropMCPServer:
         # Register handlers
         self._register_handlers()
 
+    def _build_handlers(self) -> Dict[str, _ToolHandler]:
+        """Map tool names to handlers for the current client."""
+        client = self.raindrop_client
+        # _call_tool validates arguments once, so bookmark tools run the
+        # operations directly rather than the re-validating tool functions
+        handlers: Dict[str, _ToolHandler] = {
+            "search_bookmarks": self._handle_search_bookmarks,
+            "list_collections": self._handle_list_collections,
+            "create_collection": self._handle_create_collection,
+        }
+        for name, operation in BOOKMARK_OPERATIONS.items():
+            if name in _READ_ONLY_BOOKMARK_TOOLS:
+                # Pure pass-throughs are bound to the client directly,
+                # saving a wrapper coroutine per call
+                handlers[name] = partial(operation, client)
+            else:
+                handlers[name] = self._bookmark_write_handler(operation)
+        return handlers
+
+    def _bookmark_write_handler(
+        self,
+        operation: Callable[
+            [RaindropClient, Dict[str, Any]], Awaitable[Dict[str, Any]]
+        ],
+    ) -> _ToolHandler:
+        """Bind a bookmark write tool that invalidates cached collections."""
+        client = self.raindrop_client
+
+        async def handler(arguments: Dict[str, Any]) -> Dict[str, Any]:
+            try:
+                return await operation(client, arguments)
+            finally:
+                # Bookmark writes change collection counts
+                self._collections_cache = None
+
+        return handler
+
     def _register_handlers(self) -> None:
         """Register MCP protocol handlers."""
 
@@ -79,17 +168,8 @@ class RaindropMCPServer:
 
     async def _list_tools(self) -> List[types.Tool]:
         """Return list of available MCP tools."""
-        tools = []
-
-        for tool_name, tool_def in MCP_TOOLS.items():
-            tool = types.Tool(
-                name=tool_name,
-                description=tool_def["description"],
-                inputSchema=tool_def["inputSchema"],
-            )
-            tools.append(tool)
-
-        logger.debug(f"Listed {len(tools)} tools")
+        tools = list(_build_tools())
+        logger.debug("Listed %s tools", len(tools))
         return tools
 
     async def _call_tool(
@@ -105,7 +185,7 @@ class RaindropMCPServer:
         Returns:
             Tool execution results as MCP content
         """
-        logger.info(f"Calling tool: {name} with args: {arguments}")
+        logger.info("Calling tool: %s with args: %s", name, arguments)
 
         try:
             # Validate arguments
@@ -118,33 +198,19 @@ class RaindropMCPServer:
             assert self.raindrop_client is not None
 
             # Route to appropriate handler
-            if name == "search_bookmarks":
-                result = await self._handle_search_bookmarks(arguments)
-            elif name == "create_bookmark":
-                result = await self._handle_create_bookmark(arguments)
-            elif name == "get_bookmark":
-                result = await self._handle_get_bookmark(arguments)
-            elif name == "update_bookmark":
-                result = await self._handle_update_bookmark(arguments)
-            elif name == "delete_bookmark":
-                result = await self._handle_delete_bookmark(arguments)
-            elif name == "list_collections":
-                result = await self._handle_list_collections(arguments)
-            elif name == "create_collection":
-                result = await self._handle_create_collection(arguments)
-            elif name == "get_recent_unsorted":
-                result = await self._handle_get_recent_unsorted(arguments)
-            else:
+            handler = self._handlers.get(name)
+            if handler is None:
                 raise ValueError(f"Unknown tool: {name}")
+            result = await handler(arguments)
 
             # Format successful response
-            response_text = json.dumps(result, indent=2, ensure_ascii=False)
+            response_text = _dumps(result)
             return [types.TextContent(type="text", text=response_text)]
 
         except Exception as e:
-            logger.error(f"Tool execution failed: {e}")
+            logger.error("Tool execution failed: %s", e)
             error_response = format_error_response(e, f"Tool: {name}")
-            error_text = json.dumps(error_response, indent=2, ensure_ascii=False)
+            error_text = _dumps(error_response)
             return [types.TextContent(type="text", text=error_text)]
 
     async def _handle_search_bookmarks(
@@ -158,193 +224,49 @@ class RaindropMCPServer:
         api_response = await self.raindrop_client.search_bookmarks(**params)
 
         # Convert response to MCP format
-        mcp_response = raindrop_to_mcp_search_results(
+        data = raindrop_to_mcp_search_dict(
             bookmarks=api_response["items"],
             total=api_response.get("total", 0),
             page=params.get("page", 0),
             per_page=params.get("perpage", 50),
         )
 
-        return {
-            "success": True,
-            "data": {
-                "items": [
-                    {
-                        "id": item.id,
-                        "title": item.title,
-                        "url": item.url,
-                        "excerpt": item.excerpt,
-                        "note": item.note,
-                        "type": item.type,
-                        "tags": item.tags,
-                        "created": item.created,
-                        "lastUpdate": item.lastUpdate,
-                        "domain": item.domain,
-                        "collection_id": item.collection_id,
-                        "collection_title": item.collection_title,
-                    }
-                    for item in mcp_response.items
-                ],
-                "count": mcp_response.count,
-                "total": mcp_response.total,
-                "page": mcp_response.page,
-                "per_page": mcp_response.per_page,
-                "has_more": mcp_response.has_more,
-            },
-        }
-
-    async def _handle_create_bookmark(
-        self, arguments: Dict[str, Any]
-    ) -> Dict[str, Any]:
-        """Handle create_bookmark tool call."""
-        # Convert MCP args to Raindrop API format
-        bookmark_data = mcp_to_raindrop_create_bookmark(arguments)
-
-        # Call Raindrop API
-        bookmark = await self.raindrop_client.create_bookmark(bookmark_data)
-
-        # Convert response to MCP format
-        mcp_bookmark = raindrop_to_mcp_bookmark(bookmark)
-
-        return {
-            "success": True,
-            "data": {
-                "id": mcp_bookmark.id,
-                "title": mcp_bookmark.title,
-                "url": mcp_bookmark.url,
-                "excerpt": mcp_bookmark.excerpt,
-                "note": mcp_bookmark.note,
-                "type": mcp_bookmark.type,
-                "tags": mcp_bookmark.tags,
-                "created": mcp_bookmark.created,
-                "lastUpdate": mcp_bookmark.lastUpdate,
-                "domain": mcp_bookmark.domain,
-                "collection_id": mcp_bookmark.collection_id,
-                "collection_title": mcp_bookmark.collection_title,
-            },
-        }
-
-    async def _handle_get_bookmark(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
-        """Handle get_bookmark tool call."""
-        bookmark_id = arguments["bookmark_id"]
-
-        # Call Raindrop API
-        bookmark = await self.raindrop_client.get_bookmark(bookmark_id)
-
-        # Convert response to MCP format
-        mcp_bookmark = raindrop_to_mcp_bookmark(bookmark)
-
-        return {
-            "success": True,
-            "data": {
-                "id": mcp_bookmark.id,
-                "title": mcp_bookmark.title,
-                "url": mcp_bookmark.url,
-                "excerpt": mcp_bookmark.excerpt,
-                "note": mcp_bookmark.note,
-                "type": mcp_bookmark.type,
-                "tags": mcp_bookmark.tags,
-                "created": mcp_bookmark.created,
-                "lastUpdate": mcp_bookmark.lastUpdate,
-                "domain": mcp_bookmark.domain,
-                "collection_id": mcp_bookmark.collection_id,
-                "collection_title": mcp_bookmark.collection_title,
-            },
-        }
-
-    async def _handle_update_bookmark(
-        self, arguments: Dict[str, Any]
-    ) -> Dict[str, Any]:
-        """Handle update_bookmark tool call."""
-        bookmark_id = arguments["bookmark_id"]
-
-        # Convert MCP args to Raindrop API format
-        update_data = mcp_to_raindrop_update_bookmark(arguments)
-
-        # Call Raindrop API
-        bookmark = await self.raindrop_client.update_bookmark(bookmark_id, update_data)
-
-        # Convert response to MCP format
-        mcp_bookmark = raindrop_to_mcp_bookmark(bookmark)
-
-        return {
-            "success": True,
-            "data": {
-                "id": mcp_bookmark.id,
-                "title": mcp_bookmark.title,
-                "url": mcp_bookmark.url,
-                "excerpt": mcp_bookmark.excerpt,
-                "note": mcp_bookmark.note,
-                "type": mcp_bookmark.type,
-                "tags": mcp_bookmark.tags,
-                "created": mcp_bookmark.created,
-                "lastUpdate": mcp_bookmark.lastUpdate,
-                "domain": mcp_bookmark.domain,
-                "collection_id": mcp_bookmark.collection_id,
-                "collection_title": mcp_bookmark.collection_title,
-            },
-        }
-
-    async def _handle_delete_bookmark(
-        self, arguments: Dict[str, Any]
-    ) -> Dict[str, Any]:
-        """Handle delete_bookmark tool call."""
-        bookmark_id = arguments["bookmark_id"]
-
-        # Call Raindrop API
-        success = await self.raindrop_client.delete_bookmark(bookmark_id)
-
-        return {
-            "success": success,
-            "data": {"bookmark_id": bookmark_id, "deleted": success},
-        }
+        return {"success": True, "data": data}
 
     async def _handle_list_collections(
         self, arguments: Dict[str, Any]
     ) -> Dict[str, Any]:
         """Handle list_collections tool call."""
-        # Call Raindrop API
-        collections = await self.raindrop_client.list_collections()
+        collections = await self._get_collections()
 
         # Convert response to MCP format
         mcp_collections = [
-            raindrop_to_mcp_collection(collection) for collection in collections
+            raindrop_to_mcp_collection_dict(collection) for collection in collections
         ]
 
         # Apply sorting if requested
-        sort_field = arguments.get("sort", "title")
-        sort_order = arguments.get("order", "asc")
-
-        reverse = sort_order.lower() == "desc"
-
-        if sort_field == "title":
-            mcp_collections.sort(key=lambda x: x.title.lower(), reverse=reverse)
-        elif sort_field == "count":
-            mcp_collections.sort(key=lambda x: x.count, reverse=reverse)
-        elif sort_field == "created":
-            mcp_collections.sort(key=lambda x: x.created or "", reverse=reverse)
-        elif sort_field == "lastUpdate":
-            mcp_collections.sort(key=lambda x: x.lastUpdate or "", reverse=reverse)
+        sort_mcp_collections(
+            mcp_collections,
+            arguments.get("sort", "title"),
+            arguments.get("order", "asc"),
+        )
 
         return {
             "success": True,
-            "data": {
-                "collections": [
-                    {
-                        "id": collection.id,
-                        "title": collection.title,
-                        "description": collection.description,
-                        "public": collection.public,
-                        "count": collection.count,
-                        "created": collection.created,
-                        "lastUpdate": collection.lastUpdate,
-                    }
-                    for collection in mcp_collections
-                ],
-                "count": len(mcp_collections),
-            },
+            "data": {"collections": mcp_collections, "count": len(mcp_collections)},
         }
 
+    async def _get_collections(self) -> List[CollectionModel]:
+        """Return all collections, reusing a recent fetch within the TTL."""
+        if self._collections_cache is not None:
+            collections, fetched_at = self._collections_cache
+            if time.monotonic() - fetched_at < _COLLECTIONS_TTL:
+                return collections
+
+        collections = await self.raindrop_client.list_collections()
+        self._collections_cache = (collections, time.monotonic())
+        return collections
+
     async def _handle_create_collection(
         self, arguments: Dict[str, Any]
     ) -> Dict[str, Any]:
@@ -353,54 +275,37 @@ class RaindropMCPServer:
         collection_data = mcp_to_raindrop_create_collection(arguments)
 
         # Call Raindrop API
-        collection = await self.raindrop_client.create_collection(collection_data)
+        try:
+            collection = await self.raindrop_client.create_collection(collection_data)
+        finally:
+            self._collections_cache = None
 
         # Convert response to MCP format
-        mcp_collection = raindrop_to_mcp_collection(collection)
-
-        return {
-            "success": True,
-            "data": {
-                "id": mcp_collection.id,
-                "title": mcp_collection.title,
-                "description": mcp_collection.description,
-                "public": mcp_collection.public,
-                "count": mcp_collection.count,
-                "created": mcp_collection.created,
-                "lastUpdate": mcp_collection.lastUpdate,
-            },
-        }
-
-    async def _handle_get_recent_unsorted(
-        self, arguments: Dict[str, Any]
-    ) -> Dict[str, Any]:
-        """Handle get_recent_unsorted tool call."""
-        return await get_recent_unsorted(self.raindrop_client, arguments)
+        return {"success": True, "data": raindrop_to_mcp_collection_dict(collection)}
 
     async def initialize(self) -> None:
         """Initialize the server and its dependencies."""
         logger.info("Initializing Raindrop MCP server")
 
-        try:
-            # Initialize authentication
-            await self.auth_manager.initialize()
-            logger.info("Authentication initialized")
-
-            # Start rate limiter
-            await self.rate_limiter.start()
-            logger.info("Rate limiter started")
+        if not self._owns_client:
+            logger.info("Using shared Raindrop client")
+            return
 
-            # Initialize Raindrop client
+        try:
+            # The client authenticates and starts the rate limiter itself.
+            # Validating the token on its pooled session leaves a warm
+            # keepalive connection behind for the first tool call.
             self.raindrop_client = RaindropClient(
                 auth_manager=self.auth_manager, rate_limiter=self.rate_limiter
             )
             await self.raindrop_client.initialize()
+            self._handlers = self._build_handlers()
             logger.info("Raindrop client initialized")
 
             logger.info("Raindrop MCP server initialization complete")
 
         except Exception as e:
-            logger.error(f"Failed to initialize server: {e}")
+            logger.error("Failed to initialize server: %s", e)
             await self.cleanup()
             raise
 
@@ -408,10 +313,16 @@ class RaindropMCPServer:
         """Cleanup server resources."""
         logger.info("Cleaning up Raindrop MCP server")
 
-        if self.raindrop_client:
-            await self.raindrop_client.close()
+        # A shared client (and its HTTP resources) is closed by its owner
+        if self._owns_client:
+            if self.raindrop_client:
+                await self.raindrop_client.close()
+
+            await self.rate_limiter.stop()
 
-        await self.rate_limiter.stop()
+            # Release process-wide HTTP resources
+            await close_shared_session()
+            await close_connector()
 
         logger.info("Raindrop MCP server cleanup complete")
 
@@ -441,7 +352,7 @@ class RaindropMCPServer:
         except KeyboardInterrupt:
             logger.info("Received interrupt signal")
         except Exception as e:
-            logger.error(f"Server error: {e}")
+            logger.error("Server error: %s", e)
             raise
         finally:
             await self.cleanup()
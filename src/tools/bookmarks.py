@@ -1,13 +1,18 @@
 """Bookmark CRUD operations for Raindrop.io."""
 
-from typing import Dict, Any
+import asyncio
+from functools import wraps
+from types import MappingProxyType
+from typing import Any, Awaitable, Callable, Dict, List, Mapping
 from ..raindrop.client import RaindropClient
 from ..utils.transformers import (
+    format_error_response,
+    mcp_to_raindrop_bulk_update,
     mcp_to_raindrop_create_bookmark,
     mcp_to_raindrop_update_bookmark,
-    raindrop_to_mcp_bookmark,
+    raindrop_to_mcp_bookmark_dict,
     mcp_to_raindrop_search_params,
-    raindrop_to_mcp_search_results,
+    raindrop_to_mcp_search_dict,
     validate_mcp_tool_args,
 )
 from ..utils.logging import get_logger
@@ -15,7 +20,50 @@ from ..utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+_Operation = Callable[..., Awaitable[Dict[str, Any]]]
+
+# Tool name -> operation without its own argument check, for callers such as
+# the MCP server that validate once at their boundary. The public functions
+# below validate first and then run the matching operation.
+_OPERATIONS: Dict[str, _Operation] = {}
+BOOKMARK_OPERATIONS: Mapping[str, _Operation] = MappingProxyType(_OPERATIONS)
+
+# Default cap on in-flight API calls per bulk tool call; the client's rate
+# limiter still paces the requests themselves
+BULK_CONCURRENCY = 10
+
+# API params for get_recent_unsorted, converted once; only the page size varies
+_UNSORTED_SEARCH_PARAMS = MappingProxyType(
+    mcp_to_raindrop_search_params(
+        {
+            "collection_id": -1,  # Unsorted collection
+            "sort": "created",    # Sort field
+            "order": "desc",      # Newest first (descending order)
+            "page": 0,           # First page
+        }
+    )
+)
+
+
+def _tool(tool_name: str) -> Callable[[_Operation], _Operation]:
+    """Register an operation and return its validating entry point."""
+
+    def decorate(operation: _Operation) -> _Operation:
+        _OPERATIONS[tool_name] = operation
+
+        @wraps(operation)
+        async def validated(
+            client: RaindropClient, arguments: Dict[str, Any], **kwargs: Any
+        ) -> Dict[str, Any]:
+            validate_mcp_tool_args(tool_name, arguments)
+            return await operation(client, arguments, **kwargs)
 
+        return validated
+
+    return decorate
+
+
+@_tool("create_bookmark")
 async def create_bookmark(
     client: RaindropClient, arguments: Dict[str, Any]
 ) -> Dict[str, Any]:
@@ -29,40 +77,24 @@ async def create_bookmark(
     Returns:
         Created bookmark in MCP format
     """
-    logger.info(f"Creating bookmark with args: {arguments}")
+    logger.info("Creating bookmark with args: %s", arguments)
 
-    # Validate arguments
-    validate_mcp_tool_args("create_bookmark", arguments)
-
-    # Convert MCP args to Raindrop API format
-    bookmark_data = mcp_to_raindrop_create_bookmark(arguments)
+    # Convert MCP args to Raindrop API format; every route here has already
+    # run validate_mcp_tool_args, so the URL needs no second check
+    bookmark_data = mcp_to_raindrop_create_bookmark(arguments, url_validated=True)
 
     # Call Raindrop API
     bookmark = await client.create_bookmark(bookmark_data)
 
     # Convert response to MCP format
-    mcp_bookmark = raindrop_to_mcp_bookmark(bookmark)
-
     return {
         "success": True,
         "tool": "create_bookmark",
-        "data": {
-            "id": mcp_bookmark.id,
-            "title": mcp_bookmark.title,
-            "url": mcp_bookmark.url,
-            "excerpt": mcp_bookmark.excerpt,
-            "note": mcp_bookmark.note,
-            "type": mcp_bookmark.type,
-            "tags": mcp_bookmark.tags,
-            "created": mcp_bookmark.created,
-            "lastUpdate": mcp_bookmark.lastUpdate,
-            "domain": mcp_bookmark.domain,
-            "collection_id": mcp_bookmark.collection_id,
-            "collection_title": mcp_bookmark.collection_title,
-        },
+        "data": raindrop_to_mcp_bookmark_dict(bookmark),
     }
 
 
+@_tool("get_bookmark")
 async def get_bookmark(
     client: RaindropClient, arguments: Dict[str, Any]
 ) -> Dict[str, Any]:
@@ -77,37 +109,20 @@ async def get_bookmark(
         Bookmark data in MCP format
     """
     bookmark_id = arguments["bookmark_id"]
-    logger.info(f"Getting bookmark with ID: {bookmark_id}")
-
-    # Validate arguments
-    validate_mcp_tool_args("get_bookmark", arguments)
+    logger.info("Getting bookmark with ID: %s", bookmark_id)
 
     # Call Raindrop API
     bookmark = await client.get_bookmark(bookmark_id)
 
     # Convert response to MCP format
-    mcp_bookmark = raindrop_to_mcp_bookmark(bookmark)
-
     return {
         "success": True,
         "tool": "get_bookmark",
-        "data": {
-            "id": mcp_bookmark.id,
-            "title": mcp_bookmark.title,
-            "url": mcp_bookmark.url,
-            "excerpt": mcp_bookmark.excerpt,
-            "note": mcp_bookmark.note,
-            "type": mcp_bookmark.type,
-            "tags": mcp_bookmark.tags,
-            "created": mcp_bookmark.created,
-            "lastUpdate": mcp_bookmark.lastUpdate,
-            "domain": mcp_bookmark.domain,
-            "collection_id": mcp_bookmark.collection_id,
-            "collection_title": mcp_bookmark.collection_title,
-        },
+        "data": raindrop_to_mcp_bookmark_dict(bookmark),
     }
 
 
+@_tool("update_bookmark")
 async def update_bookmark(
     client: RaindropClient, arguments: Dict[str, Any]
 ) -> Dict[str, Any]:
@@ -122,10 +137,7 @@ async def update_bookmark(
         Updated bookmark in MCP format
     """
     bookmark_id = arguments["bookmark_id"]
-    logger.info(f"Updating bookmark {bookmark_id} with args: {arguments}")
-
-    # Validate arguments
-    validate_mcp_tool_args("update_bookmark", arguments)
+    logger.info("Updating bookmark %s with args: %s", bookmark_id, arguments)
 
     # Convert MCP args to Raindrop API format
     update_data = mcp_to_raindrop_update_bookmark(arguments)
@@ -134,28 +146,14 @@ async def update_bookmark(
     bookmark = await client.update_bookmark(bookmark_id, update_data)
 
     # Convert response to MCP format
-    mcp_bookmark = raindrop_to_mcp_bookmark(bookmark)
-
     return {
         "success": True,
         "tool": "update_bookmark",
-        "data": {
-            "id": mcp_bookmark.id,
-            "title": mcp_bookmark.title,
-            "url": mcp_bookmark.url,
-            "excerpt": mcp_bookmark.excerpt,
-            "note": mcp_bookmark.note,
-            "type": mcp_bookmark.type,
-            "tags": mcp_bookmark.tags,
-            "created": mcp_bookmark.created,
-            "lastUpdate": mcp_bookmark.lastUpdate,
-            "domain": mcp_bookmark.domain,
-            "collection_id": mcp_bookmark.collection_id,
-            "collection_title": mcp_bookmark.collection_title,
-        },
+        "data": raindrop_to_mcp_bookmark_dict(bookmark),
     }
 
 
+@_tool("delete_bookmark")
 async def delete_bookmark(
     client: RaindropClient, arguments: Dict[str, Any]
 ) -> Dict[str, Any]:
@@ -170,10 +168,7 @@ async def delete_bookmark(
         Deletion confirmation
     """
     bookmark_id = arguments["bookmark_id"]
-    logger.info(f"Deleting bookmark with ID: {bookmark_id}")
-
-    # Validate arguments
-    validate_mcp_tool_args("delete_bookmark", arguments)
+    logger.info("Deleting bookmark with ID: %s", bookmark_id)
 
     # Call Raindrop API
     success = await client.delete_bookmark(bookmark_id)
@@ -185,6 +180,160 @@ async def delete_bookmark(
     }
 
 
+async def _run_bulk(
+    tool_name: str,
+    operation: Callable[[RaindropClient, Dict[str, Any]], Awaitable[Dict[str, Any]]],
+    client: RaindropClient,
+    items: List[Dict[str, Any]],
+    concurrency: int,
+) -> Dict[str, Any]:
+    """Run a single-bookmark operation over many items concurrently."""
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run_one(item: Dict[str, Any]) -> Dict[str, Any]:
+        async with semaphore:
+            return await operation(client, item)
+
+    outcomes = await asyncio.gather(
+        *(run_one(item) for item in items), return_exceptions=True
+    )
+
+    # Per-item failures are reported in place so one bad item can't hide
+    # the results of the others
+    results: List[Dict[str, Any]] = []
+    failed = 0
+    for outcome in outcomes:
+        if isinstance(outcome, Exception):
+            failed += 1
+            results.append(format_error_response(outcome))
+        elif isinstance(outcome, BaseException):
+            raise outcome
+        else:
+            results.append(outcome)
+
+    return {
+        "success": failed == 0,
+        "tool": tool_name,
+        "data": {
+            "results": results,
+            "succeeded": len(results) - failed,
+            "failed": failed,
+        },
+    }
+
+
+@_tool("create_bookmarks_bulk")
+async def create_bookmarks_bulk(
+    client: RaindropClient,
+    arguments: Dict[str, Any],
+    concurrency: int = BULK_CONCURRENCY,
+) -> Dict[str, Any]:
+    """
+    Create several bookmarks concurrently.
+
+    Args:
+        client: Raindrop API client
+        arguments: MCP tool arguments, with one create_bookmark payload per item
+        concurrency: Maximum number of API calls in flight at once
+
+    Returns:
+        One result per item, in input order
+    """
+    items = arguments["items"]
+    logger.info("Creating %s bookmarks", len(items))
+
+    return await _run_bulk(
+        "create_bookmarks_bulk",
+        BOOKMARK_OPERATIONS["create_bookmark"],
+        client,
+        items,
+        concurrency,
+    )
+
+
+@_tool("update_bookmarks_bulk")
+async def update_bookmarks_bulk(
+    client: RaindropClient,
+    arguments: Dict[str, Any],
+    concurrency: int = BULK_CONCURRENCY,
+) -> Dict[str, Any]:
+    """
+    Update several bookmarks concurrently.
+
+    Args:
+        client: Raindrop API client
+        arguments: MCP tool arguments, with one update_bookmark payload per item
+        concurrency: Maximum number of API calls in flight at once
+
+    Returns:
+        One result per item, in input order
+    """
+    items = arguments["items"]
+    logger.info("Updating %s bookmarks", len(items))
+
+    return await _run_bulk(
+        "update_bookmarks_bulk",
+        BOOKMARK_OPERATIONS["update_bookmark"],
+        client,
+        items,
+        concurrency,
+    )
+
+
+@_tool("delete_bookmarks_bulk")
+async def delete_bookmarks_bulk(
+    client: RaindropClient, arguments: Dict[str, Any]
+) -> Dict[str, Any]:
+    """
+    Delete several bookmarks with Raindrop's bulk endpoint.
+
+    Args:
+        client: Raindrop API client
+        arguments: MCP tool arguments
+
+    Returns:
+        Number of bookmarks deleted
+    """
+    bookmark_ids = arguments["ids"]
+    logger.info("Deleting %s bookmarks", len(bookmark_ids))
+
+    deleted = await client.bulk_delete_bookmarks(bookmark_ids)
+
+    return {
+        "success": True,
+        "tool": "delete_bookmarks_bulk",
+        "data": {"bookmark_ids": bookmark_ids, "deleted": deleted},
+    }
+
+
+@_tool("tag_or_move_bookmarks")
+async def tag_or_move_bookmarks(
+    client: RaindropClient, arguments: Dict[str, Any]
+) -> Dict[str, Any]:
+    """
+    Apply shared tags and/or a collection move with Raindrop's bulk endpoint.
+
+    Args:
+        client: Raindrop API client
+        arguments: MCP tool arguments
+
+    Returns:
+        Number of bookmarks modified
+    """
+    bookmark_ids = arguments["ids"]
+    logger.info("Bulk updating %s bookmarks", len(bookmark_ids))
+
+    patch = mcp_to_raindrop_bulk_update(arguments)
+    modified = await client.bulk_update_bookmarks(bookmark_ids, patch)
+
+    return {
+        "success": True,
+        "tool": "tag_or_move_bookmarks",
+        "data": {"bookmark_ids": bookmark_ids, "modified": modified},
+    }
+
+
+@_tool("get_recent_unsorted")
 async def get_recent_unsorted(
     client: RaindropClient, arguments: Dict[str, Any]
 ) -> Dict[str, Any]:
@@ -203,61 +352,28 @@ async def get_recent_unsorted(
         Recent unsorted bookmarks in MCP format
     """
     limit = arguments.get("limit", 50)
-    logger.info(f"Getting {limit} recent unsorted bookmarks")
-
-    # Validate arguments
-    validate_mcp_tool_args("get_recent_unsorted", arguments)
+    logger.info("Getting %s recent unsorted bookmarks", limit)
 
     # Build search parameters for unsorted collection
-    search_args = {
-        "collection_id": -1,  # Unsorted collection
-        "sort": "created",    # Sort field
-        "order": "desc",      # Newest first (descending order)
-        "page": 0,           # First page
-        "per_page": min(limit, 50),  # Respect API limits
+    params = {
+        **_UNSORTED_SEARCH_PARAMS,
+        "perpage": min(limit, 50),  # Respect API limits
     }
 
-    # Convert MCP args to Raindrop API params
-    params = mcp_to_raindrop_search_params(search_args)
-
     # Call Raindrop API
     api_response = await client.search_bookmarks(**params)
 
     # Convert response to MCP format
-    mcp_response = raindrop_to_mcp_search_results(
+    pagination = raindrop_to_mcp_search_dict(
         bookmarks=api_response["items"],
         total=api_response.get("total", 0),
         page=params.get("page", 0),
         per_page=params.get("perpage", 50),
     )
+    items = pagination.pop("items")
 
     return {
         "success": True,
         "tool": "get_recent_unsorted",
-        "data": {
-            "items": [
-                {
-                    "id": item.id,
-                    "title": item.title,
-                    "url": item.url,
-                    "excerpt": item.excerpt,
-                    "note": item.note,
-                    "type": item.type,
-                    "tags": item.tags,
-                    "created": item.created,
-                    "lastUpdate": item.lastUpdate,
-                    "domain": item.domain,
-                    "collection_id": item.collection_id,
-                    "collection_title": item.collection_title,
-                }
-                for item in mcp_response.items
-            ],
-            "pagination": {
-                "count": mcp_response.count,
-                "total": mcp_response.total,
-                "page": mcp_response.page,
-                "per_page": mcp_response.per_page,
-                "has_more": mcp_response.has_more,
-            },
-        },
+        "data": {"items": items, "pagination": pagination},
     }
@@ -4,7 +4,7 @@ from typing import Dict, List, Any, Optional
 from ..raindrop.client import RaindropClient
 from ..utils.transformers import (
     mcp_to_raindrop_search_params,
-    raindrop_to_mcp_search_results,
+    raindrop_to_mcp_search_dict,
     validate_mcp_tool_args,
 )
 from ..utils.logging import get_logger
@@ -26,7 +26,7 @@ async def search_bookmarks(
     Returns:
         Search results in MCP format
     """
-    logger.info(f"Searching bookmarks with args: {arguments}")
+    logger.info("Searching bookmarks with args: %s", arguments)
 
     # Validate arguments
     validate_mcp_tool_args("search_bookmarks", arguments)
@@ -38,40 +38,16 @@ async def search_bookmarks(
     api_response = await client.search_bookmarks(**params)
 
     # Convert response to MCP format
-    mcp_response = raindrop_to_mcp_search_results(
+    pagination = raindrop_to_mcp_search_dict(
         bookmarks=api_response["items"],
         total=api_response.get("total", 0),
         page=params.get("page", 0),
         per_page=params.get("perpage", 50),
     )
+    items = pagination.pop("items")
 
     return {
         "success": True,
         "tool": "search_bookmarks",
-        "data": {
-            "items": [
-                {
-                    "id": item.id,
-                    "title": item.title,
-                    "url": item.url,
-                    "excerpt": item.excerpt,
-                    "note": item.note,
-                    "type": item.type,
-                    "tags": item.tags,
-                    "created": item.created,
-                    "lastUpdate": item.lastUpdate,
-                    "domain": item.domain,
-                    "collection_id": item.collection_id,
-                    "collection_title": item.collection_title,
-                }
-                for item in mcp_response.items
-            ],
-            "pagination": {
-                "count": mcp_response.count,
-                "total": mcp_response.total,
-                "page": mcp_response.page,
-                "per_page": mcp_response.per_page,
-                "has_more": mcp_response.has_more,
-            },
-        },
+        "data": {"items": items, "pagination": pagination},
     }
@@ -1,21 +1,52 @@
 """Data transformation utilities between MCP and Raindrop.io formats."""
 
 import re
-from typing import Dict, List, Optional, Any, Union
+from operator import itemgetter
+from types import MappingProxyType
+from typing import Callable, Dict, List, Mapping, Optional, Any, Union
 from urllib.parse import urlparse
 from ..raindrop.models import BookmarkModel, CollectionModel, BookmarkType
-from ..raindrop.schemas import BookmarkResponse, CollectionResponse, SearchResponse
+from ..raindrop.schemas import (
+    BULK_MAX_ITEMS,
+    BookmarkResponse,
+    CollectionResponse,
+    SearchResponse,
+    bookmark_response_dict,
+    collection_response_dict,
+)
+
+
+# Allowed values, hoisted so validation doesn't rebuild them per call
+_SEARCH_SORTS = frozenset(("score", "created", "lastUpdate", "title", "domain"))
+_SORT_ORDERS = frozenset(("asc", "desc"))
+_BOOKMARK_TYPE_VALUES = frozenset(t.value for t in BookmarkType)
+_COLLECTION_VIEWS = frozenset(("list", "simple", "grid", "masonry"))
+# System collections: -1 (Unsorted), -99 (Trash)
+_SYSTEM_COLLECTION_IDS = frozenset((-1, -99))
+# Patterns compiled once; tags and text fields are cleaned on every write
+_TAG_STRIP = re.compile(r"[^\w\s-]")
+_WHITESPACE = re.compile(r"\s+")
+# http(s) URLs with a plain host, which urlparse would always accept; anything
+# else (other schemes, IPv6 literals, odd spacing) falls back to urlparse
+_HTTP_URL = re.compile(r"https?://[^/?#\s\[\]]+", re.IGNORECASE)
+# Fields Raindrop's bulk update endpoint applies to every selected bookmark
+_BULK_UPDATE_FIELDS = ("tags", "collection_id")
+
+# Sort keys for collection dicts; list.sort computes each key once per item
+_COLLECTION_SORT_KEYS: Mapping[str, Callable[[Dict[str, Any]], Any]] = (
+    MappingProxyType({
+        "title": lambda collection: collection["title"].lower(),
+        "count": itemgetter("count"),
+        "created": lambda collection: collection["created"] or "",
+        "lastUpdate": lambda collection: collection["lastUpdate"] or "",
+    })
+)
 
 
 def remove_duplicates_preserve_order(items: List[str]) -> List[str]:
     """Remove duplicates from list while preserving order."""
-    seen = set()
-    result = []
-    for item in items:
-        if item and item not in seen:
-            seen.add(item)
-            result.append(item)
-    return result
+    # dict keys keep first-seen order and dedup in C; empty items are dropped
+    return [item for item in dict.fromkeys(items) if item]
 
 
 def sanitize_tag(tag: str) -> str:
@@ -24,18 +55,16 @@ def sanitize_tag(tag: str) -> str:
         return ""
 
     # Remove special characters and normalize
-    tag = re.sub(r"[^\w\s-]", "", tag)
-    tag = re.sub(r"\s+", " ", tag).strip()
+    tag = _WHITESPACE.sub(" ", _TAG_STRIP.sub("", tag)).strip()
 
     # Limit length
-    if len(tag) > 50:
-        tag = tag[:50]
-
-    return tag.lower()
+    return tag[:50].lower()
 
 
 def validate_url(url: str) -> bool:
     """Validate a URL string."""
+    if isinstance(url, str) and _HTTP_URL.match(url):
+        return True
     try:
         result = urlparse(url)
         return all([result.scheme, result.netloc])
@@ -47,8 +76,10 @@ def validate_collection_id(collection_id: Optional[int]) -> bool:
     """Validate collection ID."""
     if collection_id is None:
         return True
-    # Allow special system collections: -1 (Unsorted), -99 (Trash), and positive IDs
-    return isinstance(collection_id, int) and (collection_id > 0 or collection_id in [-1, -99])
+    # Allow special system collections and positive IDs
+    return isinstance(collection_id, int) and (
+        collection_id > 0 or collection_id in _SYSTEM_COLLECTION_IDS
+    )
 
 
 def sanitize_text_field(text: Optional[str], max_length: int = 1000) -> str:
@@ -57,13 +88,10 @@ def sanitize_text_field(text: Optional[str], max_length: int = 1000) -> str:
         return ""
 
     # Remove excessive whitespace
-    text = re.sub(r"\s+", " ", text).strip()
+    text = _WHITESPACE.sub(" ", text).strip()
 
     # Limit length
-    if len(text) > max_length:
-        text = text[:max_length]
-
-    return text
+    return text[:max_length]
 
 
 def raindrop_to_mcp_bookmark(bookmark: BookmarkModel) -> BookmarkResponse:
@@ -71,18 +99,36 @@ def raindrop_to_mcp_bookmark(bookmark: BookmarkModel) -> BookmarkResponse:
     return BookmarkResponse.from_bookmark_model(bookmark)
 
 
+def raindrop_to_mcp_bookmark_dict(bookmark: BookmarkModel) -> Dict[str, Any]:
+    """Convert Raindrop BookmarkModel straight to a JSON-ready MCP dict."""
+    return bookmark_response_dict(bookmark)
+
+
 def raindrop_to_mcp_collection(collection: CollectionModel) -> CollectionResponse:
     """Convert Raindrop CollectionModel to MCP CollectionResponse."""
     return CollectionResponse.from_collection_model(collection)
 
 
+def raindrop_to_mcp_collection_dict(collection: CollectionModel) -> Dict[str, Any]:
+    """Convert Raindrop CollectionModel straight to a JSON-ready MCP dict."""
+    return collection_response_dict(collection)
+
+
+def sort_mcp_collections(
+    collections: List[Dict[str, Any]], sort_field: str, sort_order: str
+) -> None:
+    """Sort MCP collection dicts in place; unknown fields keep API order."""
+    sort_key = _COLLECTION_SORT_KEYS.get(sort_field)
+    if sort_key is not None:
+        collections.sort(key=sort_key, reverse=sort_order.lower() == "desc")
+
+
 def raindrop_to_mcp_search_results(
     bookmarks: List[BookmarkModel], total: int, page: int, per_page: int
 ) -> SearchResponse:
     """Convert Raindrop search results to MCP SearchResponse."""
-    items = [raindrop_to_mcp_bookmark(bookmark) for bookmark in bookmarks]
+    items = BookmarkResponse.from_bookmark_models(bookmarks)
     count = len(items)
-    has_more = (page + 1) * per_page < total
 
     return SearchResponse(
         items=items,
@@ -90,12 +136,43 @@ def raindrop_to_mcp_search_results(
         total=total,
         page=page,
         per_page=per_page,
-        has_more=has_more,
+        has_more=_has_more(total, page, per_page),
     )
 
 
-def mcp_to_raindrop_create_bookmark(args: Dict[str, Any]) -> Dict[str, Any]:
-    """Convert MCP create_bookmark args to Raindrop API format."""
+def raindrop_to_mcp_search_dict(
+    bookmarks: List[BookmarkModel], total: int, page: int, per_page: int
+) -> Dict[str, Any]:
+    """Convert Raindrop search results straight to a JSON-ready dict.
+
+    Same fields as raindrop_to_mcp_search_results, without building the
+    intermediate response dataclasses.
+    """
+    items = [bookmark_response_dict(bookmark) for bookmark in bookmarks]
+
+    return {
+        "items": items,
+        "count": len(items),
+        "total": total,
+        "page": page,
+        "per_page": per_page,
+        "has_more": _has_more(total, page, per_page),
+    }
+
+
+def _has_more(total: int, page: int, per_page: int) -> bool:
+    """Return whether results continue past the given 0-based page."""
+    return (page + 1) * per_page < total
+
+
+def mcp_to_raindrop_create_bookmark(
+    args: Dict[str, Any], url_validated: bool = False
+) -> Dict[str, Any]:
+    """Convert MCP create_bookmark args to Raindrop API format.
+
+    Callers that already ran validate_mcp_tool_args pass
+    ``url_validated=True`` to skip checking the URL format a second time.
+    """
     data: Dict[str, Any] = {}
 
     # Required fields
@@ -103,7 +180,7 @@ def mcp_to_raindrop_create_bookmark(args: Dict[str, Any]) -> Dict[str, Any]:
     if not url:
         raise ValueError("URL is required")
 
-    if not validate_url(str(url)):
+    if not url_validated and not validate_url(str(url)):
         raise ValueError("Invalid URL format")
 
     data["link"] = str(url)
@@ -144,6 +221,21 @@ def mcp_to_raindrop_update_bookmark(args: Dict[str, Any]) -> Dict[str, Any]:
     if not bookmark_id or not isinstance(bookmark_id, int):
         raise ValueError("Valid bookmark_id is required")
 
+    return _build_update_patch(args)
+
+
+def mcp_to_raindrop_bulk_update(args: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert MCP tag_or_move_bookmarks args to a Raindrop bulk update patch."""
+    patch = _build_update_patch(
+        {field: args[field] for field in _BULK_UPDATE_FIELDS if field in args}
+    )
+    if not patch:
+        raise ValueError("tags or collection_id is required")
+    return patch
+
+
+def _build_update_patch(args: Dict[str, Any]) -> Dict[str, Any]:
+    """Build the update payload shared by single and bulk bookmark updates."""
     data: Dict[str, Any] = {}
 
     # Optional update fields
@@ -198,12 +290,12 @@ def mcp_to_raindrop_search_params(args: Dict[str, Any]) -> Dict[str, Any]:
     # Type filter
     if args.get("type"):
         bookmark_type = args["type"]
-        try:
-            # Validate bookmark type
-            BookmarkType(bookmark_type)
-            params["type"] = bookmark_type
-        except ValueError:
+        if (
+            not isinstance(bookmark_type, str)
+            or bookmark_type not in _BOOKMARK_TYPE_VALUES
+        ):
             raise ValueError(f"Invalid bookmark type: {bookmark_type}")
+        params["type"] = bookmark_type
 
     # Tag filter
     if args.get("tag"):
@@ -215,11 +307,10 @@ def mcp_to_raindrop_search_params(args: Dict[str, Any]) -> Dict[str, Any]:
     sort_field = args.get("sort", "created")
     sort_order = args.get("order", "desc")
 
-    valid_sorts = ["score", "created", "lastUpdate", "title", "domain"]
-    if sort_field not in valid_sorts:
+    if not isinstance(sort_field, str) or sort_field not in _SEARCH_SORTS:
         raise ValueError(f"Invalid sort field: {sort_field}")
 
-    if sort_order not in ["asc", "desc"]:
+    if not isinstance(sort_order, str) or sort_order not in _SORT_ORDERS:
         raise ValueError(f"Invalid sort order: {sort_order}")
 
     params["sort"] = f"{sort_field}"
@@ -259,8 +350,7 @@ def mcp_to_raindrop_create_collection(args: Dict[str, Any]) -> Dict[str, Any]:
 
     if "view" in args:
         view = args["view"]
-        valid_views = ["list", "simple", "grid", "masonry"]
-        if view not in valid_views:
+        if not isinstance(view, str) or view not in _COLLECTION_VIEWS:
             raise ValueError(f"Invalid view type: {view}")
         data["view"] = view
 
@@ -303,50 +393,96 @@ def format_error_response(error: Exception, context: str = "") -> Dict[str, Any]
     return response
 
 
+def _validate_bookmark_id(args: Dict[str, Any]) -> None:
+    """Validate arguments that identify a single bookmark."""
+    if "bookmark_id" not in args:
+        raise ValueError("bookmark_id is required")
+    if not isinstance(args["bookmark_id"], int):
+        raise ValueError("bookmark_id must be an integer")
+
+
+def _validate_create_bookmark(args: Dict[str, Any]) -> None:
+    """Validate create_bookmark arguments."""
+    if "url" not in args:
+        raise ValueError("URL is required")
+    if not validate_url(str(args["url"])):
+        raise ValueError("Invalid URL format")
+
+
+def _validate_get_recent_unsorted(args: Dict[str, Any]) -> None:
+    """Validate get_recent_unsorted arguments."""
+    # Validate limit parameter if provided
+    if "limit" in args:
+        limit = args["limit"]
+        if not isinstance(limit, int):
+            raise ValueError("limit must be an integer")
+        if limit < 1 or limit > 50:
+            raise ValueError("limit must be between 1 and 50")
+
+
+def _validate_create_collection(args: Dict[str, Any]) -> None:
+    """Validate create_collection arguments."""
+    if "title" not in args:
+        raise ValueError("title is required")
+    if not isinstance(args["title"], str) or not args["title"].strip():
+        raise ValueError("title must be a non-empty string")
+    # Validate parent_id if provided
+    if "parent_id" in args and not validate_collection_id(args["parent_id"]):
+        raise ValueError("parent_id must be a valid collection ID")
+
+
+def _validate_bookmark_ids(args: Dict[str, Any]) -> None:
+    """Validate arguments that select bookmarks by a list of IDs."""
+    ids = args.get("ids")
+    if not isinstance(ids, list) or not ids:
+        raise ValueError("ids must be a non-empty list")
+    if len(ids) > BULK_MAX_ITEMS:
+        raise ValueError(f"ids must contain at most {BULK_MAX_ITEMS} entries")
+    if not all(type(bookmark_id) is int for bookmark_id in ids):
+        raise ValueError("ids must contain only integers")
+
+
+def _bulk_validator(
+    validate_item: Callable[[Dict[str, Any]], None]
+) -> Callable[[Dict[str, Any]], None]:
+    """Build a validator checking every item of a bulk tool call up front."""
+
+    def validate(args: Dict[str, Any]) -> None:
+        items = args.get("items")
+        if not isinstance(items, list) or not items:
+            raise ValueError("items must be a non-empty list")
+        if len(items) > BULK_MAX_ITEMS:
+            raise ValueError(f"items must contain at most {BULK_MAX_ITEMS} entries")
+        for index, item in enumerate(items):
+            if not isinstance(item, dict):
+                raise ValueError(f"items[{index}] must be an object")
+            try:
+                validate_item(item)
+            except ValueError as e:
+                raise ValueError(f"items[{index}]: {e}") from e
+
+    return validate
+
+
+# Per-tool validators, looked up once per call instead of walking an if/elif
+# chain. Tools without an entry (e.g. search_bookmarks, whose fields all have
+# defaults) need no checks here.
+_TOOL_VALIDATORS: Mapping[str, Callable[[Dict[str, Any]], None]] = MappingProxyType({
+    "create_bookmark": _validate_create_bookmark,
+    "get_bookmark": _validate_bookmark_id,
+    "update_bookmark": _validate_bookmark_id,
+    "delete_bookmark": _validate_bookmark_id,
+    "create_bookmarks_bulk": _bulk_validator(_validate_create_bookmark),
+    "update_bookmarks_bulk": _bulk_validator(_validate_bookmark_id),
+    "delete_bookmarks_bulk": _validate_bookmark_ids,
+    "tag_or_move_bookmarks": _validate_bookmark_ids,
+    "get_recent_unsorted": _validate_get_recent_unsorted,
+    "create_collection": _validate_create_collection,
+})
+
+
 def validate_mcp_tool_args(tool_name: str, args: Dict[str, Any]) -> None:
     """Validate MCP tool arguments."""
-    if tool_name == "search_bookmarks":
-        # Optional validation - most fields have defaults
-        pass
-
-    elif tool_name == "create_bookmark":
-        if "url" not in args:
-            raise ValueError("URL is required")
-        if not validate_url(str(args["url"])):
-            raise ValueError("Invalid URL format")
-
-    elif tool_name == "get_bookmark":
-        if "bookmark_id" not in args:
-            raise ValueError("bookmark_id is required")
-        if not isinstance(args["bookmark_id"], int):
-            raise ValueError("bookmark_id must be an integer")
-
-    elif tool_name == "update_bookmark":
-        if "bookmark_id" not in args:
-            raise ValueError("bookmark_id is required")
-        if not isinstance(args["bookmark_id"], int):
-            raise ValueError("bookmark_id must be an integer")
-
-    elif tool_name == "delete_bookmark":
-        if "bookmark_id" not in args:
-            raise ValueError("bookmark_id is required")
-        if not isinstance(args["bookmark_id"], int):
-            raise ValueError("bookmark_id must be an integer")
-
-    elif tool_name == "get_recent_unsorted":
-        # Validate limit parameter if provided
-        if "limit" in args:
-            limit = args["limit"]
-            if not isinstance(limit, int):
-                raise ValueError("limit must be an integer")
-            if limit < 1 or limit > 50:
-                raise ValueError("limit must be between 1 and 50")
-
-    elif tool_name == "create_collection":
-        if "title" not in args:
-            raise ValueError("title is required")
-        if not isinstance(args["title"], str) or not args["title"].strip():
-            raise ValueError("title must be a non-empty string")
-        # Validate parent_id if provided
-        if "parent_id" in args and not validate_collection_id(args["parent_id"]):
-            raise ValueError("parent_id must be a valid collection ID")
+    validator = _TOOL_VALIDATORS.get(tool_name)
+    if validator is not None:
+        validator(args)
@@ -4,6 +4,7 @@ import pytest
 import pytest_asyncio
 import asyncio
 import json
+from datetime import datetime
 from unittest.mock import AsyncMock, Mock, patch
 from src.raindrop.server import RaindropMCPServer
 from src.raindrop.models import BookmarkModel, CollectionModel, UserModel
@@ -143,10 +144,13 @@ class TestRaindropMCPServer:
             server = RaindropMCPServer()
             await server.initialize()
             
-            # Verify initialization calls
-            mock_auth_instance.initialize.assert_called_once()
-            mock_rate_limiter_instance.start.assert_called_once()
+            # Authentication and rate limiting are set up by the client
+            mock_client.assert_called_once_with(
+                auth_manager=mock_auth_instance,
+                rate_limiter=mock_rate_limiter_instance,
+            )
             mock_client_instance.initialize.assert_called_once()
+            mock_auth_instance.initialize.assert_not_called()
             
             await server.cleanup()
     
@@ -177,6 +181,15 @@ class TestRaindropMCPServer:
         assert search_tool.description is not None
         assert search_tool.inputSchema is not None
     
+    @pytest.mark.asyncio
+    async def test_list_tools_reuses_definitions(self, server):
+        """Test tool definitions are built once and shared across calls."""
+        first = await server._list_tools()
+        second = await server._list_tools()
+        
+        assert first is not second
+        assert all(a is b for a, b in zip(first, second))
+    
     @pytest.mark.asyncio
     async def test_search_bookmarks_tool(self, server):
         """Test search_bookmarks tool execution."""
@@ -211,6 +224,7 @@ class TestRaindropMCPServer:
         assert len(result) == 1
         response_data = json.loads(result[0].text)
         assert response_data["success"] is True
+        assert response_data["tool"] == "create_bookmark"
         assert response_data["data"]["id"] == 124
         assert response_data["data"]["title"] == "New Bookmark"
     
@@ -224,8 +238,37 @@ class TestRaindropMCPServer:
         assert len(result) == 1
         response_data = json.loads(result[0].text)
         assert response_data["success"] is True
+        assert response_data["tool"] == "get_bookmark"
         assert response_data["data"]["id"] == 123
     
+    @pytest.mark.asyncio
+    async def test_concurrent_tool_calls_overlap(self, server):
+        """Test separate tool calls run concurrently rather than serially."""
+        in_flight = 0
+        both_started = asyncio.Event()
+        
+        async def fake_get(bookmark_id):
+            nonlocal in_flight
+            in_flight += 1
+            if in_flight == 2:
+                both_started.set()
+            # Deadlocks (and times out) if the calls were serialized
+            await both_started.wait()
+            return BookmarkModel(id=bookmark_id, title="Item", tags=[])
+        
+        server.raindrop_client.get_bookmark.side_effect = fake_get
+        
+        results = await asyncio.wait_for(
+            asyncio.gather(
+                server._call_tool("get_bookmark", {"bookmark_id": 1}),
+                server._call_tool("get_bookmark", {"bookmark_id": 2}),
+            ),
+            timeout=1.0,
+        )
+        
+        ids = [json.loads(result[0].text)["data"]["id"] for result in results]
+        assert ids == [1, 2]
+    
     @pytest.mark.asyncio
     async def test_update_bookmark_tool(self, server):
         """Test update_bookmark tool execution."""
@@ -240,6 +283,7 @@ class TestRaindropMCPServer:
         assert len(result) == 1
         response_data = json.loads(result[0].text)
         assert response_data["success"] is True
+        assert response_data["tool"] == "update_bookmark"
         assert response_data["data"]["title"] == "Updated Bookmark"
     
     @pytest.mark.asyncio
@@ -252,8 +296,34 @@ class TestRaindropMCPServer:
         assert len(result) == 1
         response_data = json.loads(result[0].text)
         assert response_data["success"] is True
+        assert response_data["tool"] == "delete_bookmark"
         assert response_data["data"]["deleted"] is True
     
+    @pytest.mark.asyncio
+    async def test_bookmark_tools_validated_once(self, server):
+        """Test delegated bookmark tools skip the tool layer's re-validation."""
+        arguments = {"url": "https://test.example.com"}
+        
+        with patch("src.tools.bookmarks.validate_mcp_tool_args") as tool_check:
+            result = await server._call_tool("create_bookmark", arguments)
+        
+        assert json.loads(result[0].text)["success"] is True
+        tool_check.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_bulk_delete_tool(self, server):
+        """Test bulk deletes run through the server and drop cached collections."""
+        server._collections_cache = ([], 0.0)
+        server.raindrop_client.bulk_delete_bookmarks.return_value = 2
+        
+        result = await server._call_tool("delete_bookmarks_bulk", {"ids": [1, 2]})
+        
+        response_data = json.loads(result[0].text)
+        assert response_data["success"] is True
+        assert response_data["data"]["deleted"] == 2
+        server.raindrop_client.bulk_delete_bookmarks.assert_awaited_once_with([1, 2])
+        assert server._collections_cache is None
+    
     @pytest.mark.asyncio
     async def test_list_collections_tool(self, server):
         """Test list_collections tool execution."""
@@ -267,6 +337,51 @@ class TestRaindropMCPServer:
         assert len(response_data["data"]["collections"]) == 1
         assert response_data["data"]["collections"][0]["title"] == "Test Collection"
     
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "sort,order,expected",
+        [
+            ("title", "asc", [2, 1, 3]),
+            ("count", "desc", [3, 1, 2]),
+            ("created", "asc", [3, 2, 1]),
+        ],
+    )
+    async def test_list_collections_sorting(self, server, sort, order, expected):
+        """Test collections are ordered by the requested field and direction."""
+        server.raindrop_client.list_collections.return_value = [
+            CollectionModel(id=1, title="beta", count=5, created=datetime(2024, 3, 1)),
+            CollectionModel(id=2, title="Alpha", count=1, created=datetime(2024, 2, 1)),
+            CollectionModel(id=3, title="gamma", count=9),
+        ]
+        
+        result = await server._call_tool(
+            "list_collections", {"sort": sort, "order": order}
+        )
+        collections = json.loads(result[0].text)["data"]["collections"]
+        
+        assert [c["id"] for c in collections] == expected
+    
+    @pytest.mark.asyncio
+    async def test_list_collections_cached_until_write(self, server):
+        """Test collection lists are reused until a write or the TTL expires."""
+        client = server.raindrop_client
+        
+        await server._call_tool("list_collections", {})
+        await server._call_tool("list_collections", {"sort": "count"})
+        assert client.list_collections.await_count == 1
+        
+        await server._call_tool("create_collection", {"title": "New"})
+        await server._call_tool("list_collections", {})
+        assert client.list_collections.await_count == 2
+        
+        await server._call_tool("delete_bookmark", {"bookmark_id": 1})
+        await server._call_tool("list_collections", {})
+        assert client.list_collections.await_count == 3
+        
+        with patch("src.raindrop.server._COLLECTIONS_TTL", 0.0):
+            await server._call_tool("list_collections", {})
+        assert client.list_collections.await_count == 4
+    
     @pytest.mark.asyncio
     async def test_create_collection_tool(self, server):
         """Test create_collection tool execution."""
@@ -294,6 +409,30 @@ class TestRaindropMCPServer:
         assert "error" in response_data
         assert response_data["error"]["code"] in ["INTERNAL_ERROR", "INVALID_INPUT"]
     
+    @pytest.mark.asyncio
+    async def test_tool_call_logging_is_lazy(self, server, caplog):
+        """Test tool arguments are passed to logging unformatted."""
+        arguments = {"bookmark_id": 1}
+        
+        with caplog.at_level("INFO", logger="src.raindrop.server"):
+            await server._call_tool("get_bookmark", arguments)
+        
+        record = next(r for r in caplog.records if r.msg.startswith("Calling tool"))
+        assert record.args == ("get_bookmark", arguments)
+    
+    @pytest.mark.asyncio
+    async def test_every_listed_tool_has_handler(self, server):
+        """Test each advertised tool routes to a handler."""
+        tools = await server._list_tools()
+        
+        assert {tool.name for tool in tools} == set(server._handlers)
+    
+    @pytest.mark.asyncio
+    async def test_pass_through_handlers_bound_to_client(self, server):
+        """Test pass-through tools are bound to the initialized client."""
+        for name in ("get_bookmark", "get_recent_unsorted"):
+            assert server._handlers[name].args == (server.raindrop_client,)
+    
     @pytest.mark.asyncio
     async def test_tool_validation_error(self, server):
         """Test tool argument validation error."""
@@ -304,6 +443,21 @@ class TestRaindropMCPServer:
         response_data = json.loads(result[0].text)
         assert "error" in response_data
     
+    @pytest.mark.asyncio
+    async def test_tool_output_format(self, server):
+        """Test tool output is compact UTF-8 JSON, matching stdlib formatting."""
+        server.raindrop_client.get_bookmark.return_value = BookmarkModel(
+            id=7, title="Café ☕", tags=[]
+        )
+        
+        result = await server._call_tool("get_bookmark", {"bookmark_id": 7})
+        data = json.loads(result[0].text)
+        
+        assert "Café ☕" in result[0].text
+        assert result[0].text == json.dumps(
+            data, ensure_ascii=False, separators=(",", ":")
+        )
+    
     @pytest.mark.asyncio
     async def test_server_capabilities(self, server):
         """Test server capabilities."""
@@ -345,4 +499,18 @@ class TestRaindropMCPServer:
         
         assert len(result) == 1
         response_data = json.loads(result[0].text)
-        assert "error" in response_data
\ No newline at end of file
+        assert "error" in response_data
+    
+    @pytest.mark.asyncio
+    async def test_shared_client_injection(self, mock_raindrop_client):
+        """Test an injected client is used as-is and left open on cleanup."""
+        server = RaindropMCPServer(client=mock_raindrop_client)
+        
+        await server.initialize()
+        result = await server._call_tool("get_bookmark", {"bookmark_id": 123})
+        await server.cleanup()
+        
+        response_data = json.loads(result[0].text)
+        assert response_data["success"] is True
+        mock_raindrop_client.initialize.assert_not_called()
+        mock_raindrop_client.close.assert_not_called()
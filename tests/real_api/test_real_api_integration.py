@@ -15,6 +15,7 @@ import os
 from typing import List, Optional
 from src.raindrop.client import RaindropClient
 from src.raindrop.auth import AuthenticationManager
+from src.raindrop.rate_limiter import RateLimiter
 from src.raindrop.models import BookmarkModel, CollectionModel, UserModel
 from src.raindrop_mcp.server import RaindropMCPServer
 from src.utils.config import Config
@@ -30,7 +31,7 @@ class TestRealAPIIntegration:
         if not Config.RAINDROP_API_TOKEN:
             pytest.skip("RAINDROP_API_TOKEN not configured for real API tests")
         
-        client = RaindropClient()
+        client = RaindropClient(AuthenticationManager(), RateLimiter())
         await client.initialize()
         yield client
         await client.cleanup()
@@ -369,7 +370,7 @@ async def test_real_api_rate_limiting():
     if not Config.RAINDROP_API_TOKEN:
         pytest.skip("RAINDROP_API_TOKEN not configured for real API tests")
     
-    client = RaindropClient()
+    client = RaindropClient(AuthenticationManager(), RateLimiter())
     await client.initialize()
     
     try:
@@ -0,0 +1,178 @@
+"""Unit tests for authentication and token validation."""
+
+import asyncio
+import pytest
+import time
+from unittest.mock import MagicMock, patch
+from src.raindrop import auth
+from src.raindrop.auth import AuthenticationManager, TokenValidator
+from src.raindrop.exceptions import AuthenticationError
+
+
+class _FakeResponse:
+    """Minimal async context manager standing in for an aiohttp response."""
+
+    def __init__(self, status: int, text: str = ""):
+        self.status = status
+        self._text = text
+
+    async def text(self):
+        return self._text
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+def _make_session(status: int, text: str = ""):
+    session = MagicMock()
+    session.closed = False
+    session.get.return_value = _FakeResponse(status, text)
+    return session
+
+
+class TestSharedSession:
+    """Test cases for the shared validation session."""
+
+    @pytest.mark.asyncio
+    async def test_shared_session_is_reused(self):
+        """Test the lazily created session is returned on subsequent calls."""
+        try:
+            first = await auth._get_shared_session()
+            second = await auth._get_shared_session()
+            assert first is second
+        finally:
+            await auth.close_shared_session()
+
+        assert auth._shared_session is None
+
+    @pytest.mark.asyncio
+    async def test_validator_uses_injected_session(self):
+        """Test token validation goes through the injected session."""
+        session = _make_session(200)
+        validator = TokenValidator("a" * 32, session=session)
+
+        assert await validator.validate_token() is True
+        session.get.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_validator_invalid_token(self):
+        """Test 401 responses surface as authentication errors."""
+        session = _make_session(401, "bad token")
+        validator = TokenValidator("a" * 32, session=session)
+
+        with pytest.raises(AuthenticationError):
+            await validator.validate_token()
+
+    @pytest.mark.asyncio
+    async def test_validator_times_out_stalled_response(self):
+        """Test a stalled /user check is cut off at REQUEST_TIMEOUT."""
+
+        class _StalledResponse(_FakeResponse):
+            async def __aenter__(self):
+                await asyncio.sleep(60)
+
+        session = _make_session(200)
+        session.get.return_value = _StalledResponse(200)
+        validator = TokenValidator("a" * 32, session=session)
+
+        with patch.object(auth.Config, "REQUEST_TIMEOUT", 0.01):
+            with pytest.raises(AuthenticationError):
+                await asyncio.wait_for(validator.validate_token(), timeout=1.0)
+
+
+class TestValidationCache:
+    """Test cases for the token validation cache."""
+
+    @pytest.mark.asyncio
+    async def test_cached_result_skips_api(self):
+        """Test a cached validation result avoids a second API call."""
+        session = _make_session(200)
+        validator = TokenValidator("a" * 32, session=session)
+
+        assert await validator.validate_token() is True
+        assert await validator.validate_token() is True
+        session.get.assert_called_once()
+
+    def test_cache_expires(self):
+        """Test expired cache entries are discarded."""
+        validator = TokenValidator("a" * 32)
+        validator._cached = (True, time.monotonic() - validator._current_ttl - 1)
+
+        assert validator._get_cached_validation() is None
+        assert validator._cached is None
+
+    @pytest.mark.asyncio
+    async def test_ttl_grows_with_successes(self):
+        """Test repeated successful validations extend the cache TTL."""
+        validator = TokenValidator("a" * 32, session=_make_session(200))
+
+        await validator.validate_token(force_refresh=True)
+        assert validator._current_ttl == 300
+        await validator.validate_token(force_refresh=True)
+        assert validator._current_ttl == 600
+
+        for _ in range(10):
+            await validator.validate_token(force_refresh=True)
+        assert validator._current_ttl == validator._max_ttl
+
+    @pytest.mark.asyncio
+    async def test_ttl_resets_on_failure(self):
+        """Test a failed validation drops the TTL to its minimum."""
+        validator = TokenValidator("a" * 32, session=_make_session(200))
+        validator._current_ttl = validator._max_ttl
+        validator.session.get.return_value = _FakeResponse(401)
+
+        with pytest.raises(AuthenticationError):
+            await validator.validate_token(force_refresh=True)
+
+        assert validator._current_ttl == validator._min_ttl
+
+
+class TestAuthHeaders:
+    """Test cases for precomputed authentication headers."""
+
+    def test_auth_headers_are_cached_and_read_only(self):
+        """Test the same immutable mapping is returned on every call."""
+        validator = TokenValidator("a" * 32)
+        headers = validator.get_auth_headers()
+
+        assert headers is validator.get_auth_headers()
+        assert headers["Authorization"] == f"Bearer {'a' * 32}"
+        with pytest.raises(TypeError):
+            headers["Content-Type"] = "text/plain"  # type: ignore[index]
+
+
+class TestTokenFormat:
+    """Test cases for token format validation."""
+
+    def test_valid_token_format(self):
+        """Test well-formed tokens are accepted."""
+        assert TokenValidator.validate_token_format("abc-123_DEF.456") is True
+        assert TokenValidator.validate_token_format("  abcdefghijkl  ") is True
+
+    def test_invalid_token_format(self):
+        """Test short, malformed, and non-string tokens are rejected."""
+        assert TokenValidator.validate_token_format("short") is False
+        assert TokenValidator.validate_token_format("abcdefghij klmnop") is False
+        assert TokenValidator.validate_token_format("abcdefghij$klmnop") is False
+        assert TokenValidator.validate_token_format(None) is False  # type: ignore[arg-type]
+
+
+class TestAuthenticationManager:
+    """Test cases for AuthenticationManager."""
+
+    @pytest.mark.asyncio
+    async def test_initialize_is_idempotent(self):
+        """Test re-initializing only adopts the new session."""
+        manager = AuthenticationManager()
+        manager._authenticated = True
+        manager._validator = TokenValidator("a" * 32)
+        session = _make_session(200)
+
+        await manager.initialize(session=session)
+
+        assert manager._validator.session is session
+        session.get.assert_not_called()
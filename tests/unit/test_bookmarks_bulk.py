@@ -0,0 +1,139 @@
+"""Unit tests for bulk bookmark operations."""
+
+import asyncio
+import pytest
+from unittest.mock import AsyncMock
+from src.tools.bookmarks import (
+    create_bookmarks_bulk,
+    delete_bookmarks_bulk,
+    tag_or_move_bookmarks,
+    update_bookmarks_bulk,
+)
+from src.raindrop.exceptions import NotFoundError
+from src.raindrop.models import BookmarkModel
+
+
+class TestBookmarksBulk:
+    """Test cases for the bulk bookmark tools."""
+
+    @pytest.fixture
+    def mock_client(self):
+        """Create mock Raindrop client."""
+        client = AsyncMock()
+        client.create_bookmark.side_effect = lambda data: BookmarkModel(
+            id=len(data["link"]), title="New", link=data["link"]
+        )
+        return client
+
+    @pytest.mark.asyncio
+    async def test_results_keep_input_order(self, mock_client):
+        """Test one result per item is returned in input order."""
+        urls = ["https://a.example.com", "https://bb.example.com"]
+
+        result = await create_bookmarks_bulk(
+            mock_client, {"items": [{"url": url} for url in urls]}
+        )
+
+        assert result["success"] is True
+        assert result["tool"] == "create_bookmarks_bulk"
+        assert result["data"]["succeeded"] == 2
+        assert [r["data"]["url"] for r in result["data"]["results"]] == urls
+
+    @pytest.mark.asyncio
+    async def test_item_failures_reported_in_place(self, mock_client):
+        """Test a failing item doesn't hide the results of the others."""
+
+        async def fake_update(bookmark_id, data):
+            if bookmark_id == 2:
+                raise NotFoundError("Bookmark", bookmark_id)
+            return BookmarkModel(id=bookmark_id, title=data["title"])
+
+        mock_client.update_bookmark.side_effect = fake_update
+        items = [{"bookmark_id": i, "title": "New"} for i in (1, 2, 3)]
+
+        result = await update_bookmarks_bulk(mock_client, {"items": items})
+        results = result["data"]["results"]
+
+        assert result["success"] is False
+        assert (result["data"]["succeeded"], result["data"]["failed"]) == (2, 1)
+        assert results[0]["data"]["id"] == 1
+        assert results[1]["error"]["code"] == "NOT_FOUND"
+        assert results[2]["data"]["id"] == 3
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_capped(self, mock_client):
+        """Test no more than `concurrency` API calls run at once."""
+        in_flight = peak = 0
+
+        async def fake_update(bookmark_id, data):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return BookmarkModel(id=bookmark_id, title=data["title"])
+
+        mock_client.update_bookmark.side_effect = fake_update
+        items = [{"bookmark_id": i, "title": f"T{i}"} for i in range(1, 7)]
+
+        result = await update_bookmarks_bulk(
+            mock_client, {"items": items}, concurrency=2
+        )
+
+        assert result["data"]["succeeded"] == 6
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_invalid_item_rejects_whole_call(self, mock_client):
+        """Test validation runs before any API call is made."""
+        items = [{"url": "https://example.com"}, {"url": "not-a-url"}]
+
+        with pytest.raises(ValueError, match=r"items\[1\]"):
+            await create_bookmarks_bulk(mock_client, {"items": items})
+
+        mock_client.create_bookmark.assert_not_called()
+
+
+class TestNativeBulkTools:
+    """Test cases for tools backed by Raindrop's bulk endpoints."""
+
+    @pytest.mark.asyncio
+    async def test_delete_uses_single_request(self):
+        """Test bulk delete sends every ID in one client call."""
+        client = AsyncMock()
+        client.bulk_delete_bookmarks.return_value = 3
+
+        result = await delete_bookmarks_bulk(client, {"ids": [1, 2, 3]})
+
+        client.bulk_delete_bookmarks.assert_awaited_once_with([1, 2, 3])
+        client.delete_bookmark.assert_not_called()
+        assert result["data"] == {"bookmark_ids": [1, 2, 3], "deleted": 3}
+
+    @pytest.mark.asyncio
+    async def test_tag_or_move_builds_shared_patch(self):
+        """Test tags and collection move are sent as one shared patch."""
+        client = AsyncMock()
+        client.bulk_update_bookmarks.return_value = 2
+        arguments = {
+            "ids": [1, 2],
+            "tags": ["Read", "read", ""],
+            "collection_id": 5,
+            "title": "ignored",
+        }
+
+        result = await tag_or_move_bookmarks(client, arguments)
+
+        client.bulk_update_bookmarks.assert_awaited_once_with(
+            [1, 2], {"tags": ["read"], "collection": {"$id": 5}}
+        )
+        assert result["data"]["modified"] == 2
+
+    @pytest.mark.asyncio
+    async def test_tag_or_move_requires_a_change(self):
+        """Test a call with nothing to apply is rejected."""
+        client = AsyncMock()
+
+        with pytest.raises(ValueError, match="tags or collection_id"):
+            await tag_or_move_bookmarks(client, {"ids": [1]})
+
+        client.bulk_update_bookmarks.assert_not_called()
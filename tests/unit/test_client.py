@@ -0,0 +1,380 @@
+"""Unit tests for the Raindrop API client."""
+
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, Mock, patch
+from src.raindrop.client import (
+    RaindropClient,
+    RetryConfig,
+    _parse_items,
+    close_connector,
+)
+from src.raindrop.exceptions import (
+    AuthenticationError,
+    InvalidTokenError,
+    NotFoundError,
+    PermissionError,
+    RaindropError,
+    RateLimitError,
+    ServerError,
+    TokenExpiredError,
+    ValidationError,
+)
+
+
+class TestRaindropClient:
+    """Test cases for RaindropClient API methods."""
+
+    @pytest.fixture
+    def client(self):
+        """Create client with mocked dependencies."""
+        return RaindropClient(auth_manager=Mock(), rate_limiter=AsyncMock())
+
+    @pytest.mark.asyncio
+    async def test_list_collections_merges_root_and_children(self, client):
+        """Test root and child collections are both returned."""
+        responses = {
+            "collections": {"items": [{"_id": 1, "title": "Root"}]},
+            "collections/childrens": {
+                "items": [{"_id": 2, "title": "Child", "parent": {"$id": 1}}]
+            },
+        }
+        client._make_request = AsyncMock(
+            side_effect=lambda method, endpoint, **kwargs: responses[endpoint]
+        )
+
+        collections = await client.list_collections()
+
+        assert [c.id for c in collections] == [1, 2]
+        assert collections[1].parent_id == 1
+        assert client._make_request.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_list_collections_tolerates_child_failure(self, client):
+        """Test a failed child fetch still returns root collections."""
+
+        async def fake_request(method, endpoint, **kwargs):
+            if endpoint == "collections/childrens":
+                raise ServerError("boom")
+            return {"items": [{"_id": 1, "title": "Root"}]}
+
+        client._make_request = fake_request
+
+        collections = await client.list_collections()
+
+        assert [c.id for c in collections] == [1]
+
+    @pytest.mark.asyncio
+    async def test_bulk_endpoints_send_ids_in_one_request(self, client):
+        """Test bulk update and delete hit the raindrops endpoints once."""
+        client._make_request = AsyncMock(return_value={"result": True, "modified": 2})
+
+        assert await client.bulk_update_bookmarks([1, 2], {"tags": ["a"]}) == 2
+        client._make_request.assert_awaited_once_with(
+            "PUT", "raindrops/0", data={"tags": ["a"], "ids": [1, 2]}
+        )
+
+        client._make_request.reset_mock()
+        assert await client.bulk_delete_bookmarks([1, 2], collection_id=-1) == 2
+        client._make_request.assert_awaited_once_with(
+            "DELETE", "raindrops/-1", data={"ids": [1, 2]}
+        )
+
+    @pytest.mark.asyncio
+    async def test_bulk_endpoints_reject_empty_ids(self, client):
+        """Test an empty ID list never reaches the collection-wide endpoints."""
+        client._make_request = AsyncMock()
+
+        with pytest.raises(ValueError, match="bookmark_ids"):
+            await client.bulk_update_bookmarks([], {"tags": ["a"]})
+        with pytest.raises(ValueError, match="bookmark_ids"):
+            await client.bulk_delete_bookmarks([])
+
+        client._make_request.assert_not_awaited()
+
+
+class _FakeResponse:
+    """Minimal stand-in for an aiohttp response."""
+
+    def __init__(
+        self, status, body=b"", content_type="application/json", headers=None
+    ):
+        self.status = status
+        self.content_type = content_type
+        self.headers = headers or {}
+        self._body = body
+
+    async def read(self):
+        return self._body
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class TestHandleResponse:
+    """Test cases for response decoding and error mapping."""
+
+    @pytest.fixture
+    def client(self):
+        return RaindropClient(auth_manager=Mock(), rate_limiter=AsyncMock())
+
+    @pytest.mark.asyncio
+    async def test_json_body_decoded(self, client):
+        """Test JSON bodies are decoded into a dict."""
+        response = _FakeResponse(200, b'{"result": true, "items": []}')
+
+        assert await client._handle_response(response) == {
+            "result": True,
+            "items": [],
+        }
+
+    @pytest.mark.asyncio
+    async def test_non_json_body_wrapped_as_message(self, client):
+        """Test non-JSON bodies are returned as a message."""
+        response = _FakeResponse(200, b"OK", content_type="text/plain")
+
+        assert await client._handle_response(response) == {"message": "OK"}
+
+    @pytest.mark.asyncio
+    async def test_server_error_raised(self, client):
+        """Test 5xx responses raise ServerError."""
+        response = _FakeResponse(503, b'{"error": "unavailable"}')
+
+        with pytest.raises(ServerError):
+            await client._handle_response(response)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "status,body,expected",
+        [
+            (400, b'{"error": "bad"}', ValidationError),
+            (401, b'{"error": "token expired"}', TokenExpiredError),
+            (401, b'{"error": "invalid token"}', InvalidTokenError),
+            (401, b'{"error": "nope"}', AuthenticationError),
+            (403, b"{}", PermissionError),
+            (404, b"{}", NotFoundError),
+            (429, b"{}", RateLimitError),
+            (418, b"{}", RaindropError),
+        ],
+    )
+    async def test_error_status_mapping(self, client, status, body, expected):
+        """Test error statuses map to the matching exception type."""
+        with pytest.raises(expected):
+            await client._handle_response(_FakeResponse(status, body))
+
+    def test_errors_without_details_share_empty_mapping(self):
+        """Test detail-less errors reuse one read-only empty mapping."""
+        first = ServerError("boom")
+        second = NotFoundError("Bookmark", 1)
+
+        assert first.details == {}
+        assert first.details is second.details
+        with pytest.raises(TypeError):
+            first.details["key"] = "value"  # type: ignore[index]
+        assert RaindropError("boom", details={"a": 1}).details == {"a": 1}
+
+
+class TestParseItems:
+    """Test cases for bulk item parsing."""
+
+    def test_all_valid_items(self):
+        """Test every item is parsed on the fast path."""
+        assert _parse_items([{"v": 1}, {"v": 2}], lambda d: d["v"], "item") == [1, 2]
+
+    def test_malformed_items_skipped(self):
+        """Test malformed items are dropped without losing valid ones."""
+        items = [{"v": 1}, {}, {"v": 3}]
+
+        assert _parse_items(items, lambda d: d["v"], "item") == [1, 3]
+
+
+class TestRetryConfig:
+    """Test cases for retry backoff configuration."""
+
+    def test_exponential_backoff_capped(self):
+        """Test delays double per attempt and respect max_delay."""
+        config = RetryConfig(max_retries=4, base_delay=1.0, max_delay=5.0)
+
+        assert [config.get_delay(i) for i in range(5)] == [1.0, 2.0, 4.0, 5.0, 5.0]
+
+    def test_jitter_bounds(self):
+        """Test jitter only ever adds up to the configured fraction."""
+        config = RetryConfig(max_retries=2, base_delay=2.0, jitter=0.25)
+
+        for _ in range(20):
+            assert 4.0 <= config.get_delay(1) <= 5.0
+
+
+class TestMakeRequest:
+    """Test cases for the request retry loop."""
+
+    @pytest.fixture
+    def client(self):
+        rate_limiter = Mock()
+        rate_limiter.acquire = AsyncMock(return_value=True)
+        client = RaindropClient(auth_manager=Mock(), rate_limiter=rate_limiter)
+        client.session = Mock()
+        return client
+
+    @pytest.mark.asyncio
+    async def test_retry_after_honored_on_429(self, client):
+        """Test a 429 waits for Retry-After and then retries."""
+        client.session.request.side_effect = [
+            _FakeResponse(429, b"{}", headers={"Retry-After": "2"}),
+            _FakeResponse(200, b'{"result": true}'),
+        ]
+
+        with patch("src.raindrop.client.asyncio.sleep", new=AsyncMock()) as sleep:
+            result = await client._make_request("GET", "user")
+
+        assert result == {"result": True}
+        sleep.assert_awaited_once_with(2)
+        client.rate_limiter.record_rate_limited.assert_called_once_with(2)
+
+    @pytest.mark.asyncio
+    async def test_long_retry_after_raised_immediately(self, client):
+        """Test a Retry-After beyond max_delay fails fast instead of sleeping."""
+        client.session.request.side_effect = [
+            _FakeResponse(429, b"{}", headers={"Retry-After": "3600"}),
+        ]
+
+        with patch("src.raindrop.client.asyncio.sleep", new=AsyncMock()) as sleep:
+            with pytest.raises(RateLimitError):
+                await client._make_request("GET", "user")
+
+        sleep.assert_not_awaited()
+        assert client.session.request.call_count == 1
+        client.rate_limiter.record_rate_limited.assert_called_once_with(3600)
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_raised_after_retries(self, client):
+        """Test persistent 429s surface as RateLimitError."""
+        client.retry_config = RetryConfig(max_retries=1)
+        client.session.request.side_effect = lambda **kwargs: _FakeResponse(429)
+
+        with patch("src.raindrop.client.asyncio.sleep", new=AsyncMock()):
+            with pytest.raises(RateLimitError):
+                await client._make_request("GET", "user")
+
+    @pytest.mark.asyncio
+    async def test_server_error_retried_and_recorded(self, client):
+        """Test a 5xx is retried and counted as a circuit breaker failure."""
+        client.session.request.side_effect = [
+            _FakeResponse(503, b'{"error": "unavailable"}'),
+            _FakeResponse(200, b'{"result": true}'),
+        ]
+
+        with patch("src.raindrop.client.asyncio.sleep", new=AsyncMock()):
+            result = await client._make_request("GET", "user")
+
+        assert result == {"result": True}
+        client.rate_limiter.record_failure.assert_called_once()
+        client.rate_limiter.record_success.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_server_error_raised_after_retries(self, client):
+        """Test persistent 5xx responses surface as ServerError."""
+        client.retry_config = RetryConfig(max_retries=1)
+        client.session.request.side_effect = lambda **kwargs: _FakeResponse(502)
+
+        with patch("src.raindrop.client.asyncio.sleep", new=AsyncMock()):
+            with pytest.raises(ServerError):
+                await client._make_request("GET", "user")
+
+        assert client.session.request.call_count == 2
+        assert client.rate_limiter.record_failure.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_post_server_error_not_retried(self, client):
+        """Test a 5xx on a POST is raised without repeating the write."""
+        client.session.request.side_effect = lambda **kwargs: _FakeResponse(503)
+
+        with patch("src.raindrop.client.asyncio.sleep", new=AsyncMock()) as sleep:
+            with pytest.raises(ServerError):
+                await client._make_request("POST", "raindrop", data={"link": "x"})
+
+        assert client.session.request.call_count == 1
+        client.rate_limiter.record_failure.assert_called_once()
+        sleep.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_delete_server_error_not_retried(self, client):
+        """Test a 5xx on a DELETE is raised so a trashed item isn't purged."""
+        client.session.request.side_effect = lambda **kwargs: _FakeResponse(502)
+
+        with patch("src.raindrop.client.asyncio.sleep", new=AsyncMock()) as sleep:
+            with pytest.raises(ServerError):
+                await client._make_request("DELETE", "raindrop/123")
+
+        assert client.session.request.call_count == 1
+        sleep.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_delete_skips_response_body(self, client):
+        """Test successful deletes don't read the response body."""
+        response = _FakeResponse(204)
+        response.read = AsyncMock()
+        client.session.request.return_value = response
+
+        assert await client.delete_bookmark(123) is True
+        response.read.assert_not_awaited()
+
+
+class TestSharedConnector:
+    """Test cases for the shared connection pool."""
+
+    @pytest.mark.asyncio
+    async def test_connector_shared_across_clients(self):
+        """Test sessions from separate clients use the same connector."""
+        auth_manager = Mock(initialize=AsyncMock())
+        first = RaindropClient(auth_manager=auth_manager, rate_limiter=AsyncMock())
+        second = RaindropClient(auth_manager=auth_manager, rate_limiter=AsyncMock())
+
+        try:
+            await first.initialize()
+            await second.initialize()
+            assert first.session.connector is second.session.connector
+
+            # Closing one client must leave the pool usable for the other
+            await first.close()
+            assert not second.session.connector.closed
+        finally:
+            await second.close()
+            await close_connector()
+
+    @pytest.mark.asyncio
+    async def test_session_recycle_keeps_connector(self):
+        """Test re-initializing swaps the session but keeps the pool."""
+        auth_manager = Mock(initialize=AsyncMock())
+        client = RaindropClient(auth_manager=auth_manager, rate_limiter=AsyncMock())
+
+        try:
+            await client.initialize()
+            old_session = client.session
+            connector = old_session.connector
+            await client.initialize()
+
+            assert old_session.closed
+            assert not client.session.closed
+            assert client.session.connector is connector
+            assert not client.session.connector.closed
+        finally:
+            await client.close()
+            await close_connector()
+
+    @pytest.mark.asyncio
+    async def test_close_does_not_hang_on_stuck_step(self):
+        """Test a stuck shutdown step is abandoned after the close timeout."""
+
+        async def stuck():
+            await asyncio.sleep(60)
+
+        client = RaindropClient(auth_manager=Mock(), rate_limiter=Mock(stop=stuck))
+
+        with patch("src.raindrop.client._CLOSE_TIMEOUT", 0.01):
+            await asyncio.wait_for(client.close(), timeout=1.0)
+
+        assert client._closed is True
@@ -1,8 +1,12 @@
 """Unit tests for Raindrop.io data models."""
 
+import gc
+import json
+import pickle
 import pytest
 from datetime import datetime
-from src.raindrop.models import BookmarkModel, CollectionModel, UserModel, BookmarkType, CollectionView
+from src.raindrop.models import BookmarkModel, CollectionModel, MediaModel, UserModel, BookmarkType, CollectionView
+from src.raindrop.models import _parse_datetime, _parse_iso_datetime
 
 
 class TestBookmarkModel:
@@ -80,6 +84,15 @@ class TestBookmarkModel:
         assert result["type"] == "link"
         assert result["tags"] == ["test"]
     
+    def test_bookmark_default_lists_not_shared(self):
+        """Test default tags and media are fresh lists per instance."""
+        first = BookmarkModel(id=1, title="A")
+        second = BookmarkModel(id=2, title="B")
+        
+        assert first.tags == [] and first.media == []
+        assert first.tags is not second.tags
+        assert first.media is not second.media
+    
     def test_bookmark_validation_valid(self):
         """Test bookmark validation with valid data."""
         bookmark = BookmarkModel(
@@ -109,6 +122,130 @@ class TestBookmarkModel:
         )
         
         assert bookmark.validate() is False
+    
+    def test_bookmark_from_dicts(self):
+        """Test batch creation of bookmarks from a page of data."""
+        bookmarks = BookmarkModel.from_dicts([
+            {"_id": 1, "title": "First"},
+            {"_id": 2, "title": "Second", "type": "article"},
+        ])
+        
+        assert [b.id for b in bookmarks] == [1, 2]
+        assert bookmarks[1].type == BookmarkType.ARTICLE
+    
+    def test_bookmark_from_dicts_matches_from_dict(self):
+        """Test batch parsing yields the same models as per-item parsing."""
+        items = [
+            {
+                "_id": 1,
+                "title": "Full",
+                "type": "video",
+                "tags": ["a", "b"],
+                "created": "2024-01-01T00:00:00Z",
+                "media": [{"link": "https://img", "type": "image"}, "junk"],
+                "user": {"$id": 7, "name": "User"},
+                "collection": {"$id": 5, "title": "Col", "view": "grid"},
+            },
+            {"_id": 2, "type": "unknown-type", "media": "not-a-list"},
+        ]
+        
+        batch = BookmarkModel.from_dicts(items)
+        single = [BookmarkModel.from_dict(item) for item in items]
+        
+        assert batch == single
+        # Equality skips media/user, so compare the full serialized form too
+        assert [b.to_dict() for b in batch] == [b.to_dict() for b in single]
+        assert [b.user for b in batch] == [b.user for b in single]
+    
+    def test_bookmark_media_skips_non_dict_entries(self):
+        """Test malformed media entries are dropped and null media is empty."""
+        items = [
+            {"_id": 1, "media": [{"link": "a.jpg", "type": "image"}, "junk", None]},
+            {"_id": 2, "media": None},
+        ]
+        
+        first, second = BookmarkModel.from_dicts(items)
+        
+        assert [m.link for m in first.media] == ["a.jpg"]
+        assert second.media == []
+        assert BookmarkModel.from_dict(items[0]) == first
+    
+    def test_bookmark_repr_and_eq_skip_bulky_fields(self):
+        """Test media, notes and user don't affect repr or equality."""
+        plain = BookmarkModel(id=1, title="Test")
+        detailed = BookmarkModel(
+            id=1,
+            title="Test",
+            note="long note",
+            media=[MediaModel(link="a.jpg", type="image")],
+            user=UserModel(id=7),
+        )
+        
+        assert detailed == plain
+        assert "media" not in repr(detailed)
+        assert "note" not in repr(detailed)
+    
+    def test_bookmark_from_dicts_restores_gc(self):
+        """Test batch parsing re-enables GC, even when an item is malformed."""
+        assert gc.isenabled()
+        
+        BookmarkModel.from_dicts([{"_id": 1}])
+        assert gc.isenabled()
+        
+        with pytest.raises(KeyError):
+            BookmarkModel.from_dicts([{"title": "no id"}])
+        assert gc.isenabled()
+    
+    def test_bookmark_uses_slots(self):
+        """Test bookmark instances don't carry a per-instance __dict__."""
+        bookmark = BookmarkModel(id=1, title="Test")
+        
+        assert not hasattr(bookmark, "__dict__")
+    
+    def test_bookmark_pickle_roundtrip(self):
+        """Test slotted models survive pickling."""
+        bookmark = BookmarkModel.from_dict({
+            "_id": 1,
+            "title": "Test",
+            "tags": None,
+            "collection": {"$id": 5, "title": "Col"},
+        })
+        
+        restored = pickle.loads(pickle.dumps(bookmark))
+        
+        assert restored == bookmark
+        assert restored.tags == []
+        assert restored.collection.cover == []
+    
+    def test_bookmark_to_dict_memoizes_isoformat(self):
+        """Test timestamps are formatted once and refreshed when reassigned."""
+        bookmark = BookmarkModel.from_dict({
+            "_id": 1,
+            "title": "Test",
+            "created": "2023-12-01T10:00:00Z",
+        })
+        
+        first = bookmark.to_dict()["created"]
+        assert bookmark.to_dict()["created"] is first
+        assert first == "2023-12-01T10:00:00+00:00"
+        
+        bookmark.created = datetime(2024, 1, 2, 3, 4, 5)
+        assert bookmark.to_dict()["created"] == "2024-01-02T03:04:05"
+        assert "lastUpdate" not in bookmark.to_dict()
+    
+    def test_repeated_domains_and_collection_titles_shared(self):
+        """Test repeated strings on a page are interned to one object."""
+        items = json.loads(json.dumps([
+            {"_id": i, "domain": "example.com", "collection": {"$id": 5, "title": "Col"}}
+            for i in range(2)
+        ]))
+        
+        first, second = BookmarkModel.from_dicts(items)
+        single = BookmarkModel.from_dict(items[0])
+        
+        assert first.domain is second.domain is single.domain
+        assert first.collection.title is second.collection.title
+        assert BookmarkModel.from_dict({"_id": 1, "domain": None}).domain is None
 
 
 class TestCollectionModel:
@@ -178,6 +315,14 @@ class TestCollectionModel:
         assert result["public"] is True
         assert result["count"] == 10
         assert result["view"] == "list"
+    
+    def test_unknown_enum_values_fall_back(self):
+        """Test unrecognised view and type values use the defaults."""
+        collection = CollectionModel.from_dict({"_id": 1, "view": "carousel"})
+        bookmark = BookmarkModel.from_dict({"_id": 2, "type": "hologram"})
+        
+        assert collection.view == CollectionView.LIST
+        assert bookmark.type == BookmarkType.LINK
 
 
 class TestUserModel:
@@ -223,4 +368,30 @@ class TestUserModel:
         user = UserModel.from_dict(data)
         
         assert user.id == 1
-        assert user.registered is None
\ No newline at end of file
+        assert user.registered is None
+    
+    def test_datetime_parsing_shared_across_records(self):
+        """Test repeated timestamps parse to equal UTC datetimes."""
+        data = {"id": 1, "registered": "2024-01-01T00:00:00Z"}
+        
+        first = UserModel.from_dict(data)
+        second = UserModel.from_dict(dict(data, id=2))
+        
+        assert first.registered == second.registered
+        assert first.registered.utcoffset().total_seconds() == 0
+    
+    def test_datetime_parsing_non_string(self):
+        """Test non-string timestamps are ignored."""
+        user = UserModel.from_dict({"id": 1, "registered": 1700000000})
+        
+        assert user.registered is None
+    
+    def test_datetime_parsing_rejects_non_dates_before_cache(self):
+        """Test strings that can't be ISO dates skip the parse cache."""
+        _parse_iso_datetime.cache_clear()
+        
+        for value in ("", "invalid-date", "2024", "not a date at all"):
+            assert _parse_datetime(value) is None
+        
+        assert _parse_iso_datetime.cache_info().currsize == 0
+        assert _parse_datetime("2024-13-45T00:00:00") is None
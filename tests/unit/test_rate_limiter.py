@@ -4,7 +4,8 @@ import pytest
 import asyncio
 import time
 from unittest.mock import Mock, patch
-from src.raindrop.rate_limiter import TokenBucket, CircuitBreaker, CircuitState, RateLimiter
+from src.raindrop.rate_limiter import TokenBucket, CircuitBreaker, CircuitState, RateLimiter, PriorityQueue
+from src.raindrop.rate_limiter import _STATE_ALLOWS_EXECUTION
 
 
 class TestTokenBucket:
@@ -38,7 +39,7 @@ class TestTokenBucket:
         bucket = TokenBucket(capacity=10, tokens=0, refill_rate=2.0)
         
         # Manually set last_refill to simulate time passage
-        bucket.last_refill = time.time() - 2.0  # 2 seconds ago
+        bucket.last_refill = time.monotonic() - 2.0  # 2 seconds ago
         
         available = bucket.tokens_available()
         assert available == 4  # 2 seconds * 2 tokens/second
@@ -48,7 +49,7 @@ class TestTokenBucket:
         bucket = TokenBucket(capacity=10, tokens=5, refill_rate=2.0)
         
         # Simulate 10 seconds passage (would add 20 tokens)
-        bucket.last_refill = time.time() - 10.0
+        bucket.last_refill = time.monotonic() - 10.0
         
         available = bucket.tokens_available()
         assert available == 10  # Capped at capacity
@@ -67,6 +68,16 @@ class TestTokenBucket:
         
         time_needed = bucket.time_until_available(5)
         assert time_needed == 0.0
+    
+    def test_drain_for(self):
+        """Test draining delays the next token without raising the balance."""
+        bucket = TokenBucket(capacity=10, tokens=10, refill_rate=2.0)
+        
+        bucket.drain_for(3.0)
+        assert abs(bucket.time_until_available() - 3.0) < 0.1
+        
+        bucket.drain_for(1.0)  # A shorter pause keeps the longer one
+        assert abs(bucket.time_until_available() - 3.0) < 0.1
 
 
 class TestCircuitBreaker:
@@ -125,6 +136,14 @@ class TestCircuitBreaker:
         assert cb.can_execute() is True
         assert cb.state == CircuitState.HALF_OPEN
     
+    def test_circuit_breaker_state_table_complete(self):
+        """Test every circuit state has an execution rule."""
+        assert set(_STATE_ALLOWS_EXECUTION) == set(CircuitState)
+        
+        cb = CircuitBreaker()
+        cb.state = CircuitState.HALF_OPEN
+        assert cb.can_execute() is True
+    
     def test_circuit_breaker_half_open_to_closed(self):
         """Test transition from half-open to closed state."""
         cb = CircuitBreaker(success_threshold=2)
@@ -212,6 +231,40 @@ class TestRateLimiter:
         
         await rate_limiter.stop()
     
+    @pytest.mark.asyncio
+    async def test_rate_limiter_short_wait_skips_queue(self, rate_limiter):
+        """Test a near-immediate refill is waited out without queuing."""
+        rate_limiter.token_bucket.tokens = 0.999
+        
+        assert await rate_limiter.acquire() is True
+        assert rate_limiter.stats.requests_queued == 0
+        assert rate_limiter._backlog == 0
+    
+    @pytest.mark.asyncio
+    async def test_rate_limiter_backlog_forces_queue(self, rate_limiter):
+        """Test requests queue behind an existing backlog."""
+        # Restart the refill clock too, so setup time can't top the bucket up
+        rate_limiter.token_bucket.tokens = 0.998
+        rate_limiter.token_bucket.last_refill = time.monotonic()
+        rate_limiter._backlog = 1
+        
+        assert await rate_limiter.acquire(timeout=0.01) is False
+        assert rate_limiter.stats.requests_queued == 1
+    
+    @pytest.mark.asyncio
+    async def test_rate_limiter_stop_during_long_refill(self):
+        """Test stop() interrupts a queue processor sleeping for a refill."""
+        rate_limiter = RateLimiter(requests_per_minute=6, circuit_breaker_enabled=False)
+        await rate_limiter.start()
+        for _ in range(6):
+            assert await rate_limiter.acquire(timeout=0.1) is True
+        
+        waiter = asyncio.create_task(rate_limiter.acquire(timeout=30.0))
+        await asyncio.sleep(0.05)
+        
+        await asyncio.wait_for(rate_limiter.stop(), timeout=0.5)
+        waiter.cancel()
+    
     @pytest.mark.asyncio
     async def test_rate_limiter_circuit_breaker_integration(self):
         """Test rate limiter with circuit breaker."""
@@ -228,6 +281,18 @@ class TestRateLimiter:
         
         await rate_limiter.stop()
     
+    @pytest.mark.asyncio
+    async def test_rate_limiter_acquire_after_recovery(self):
+        """Test an open breaker past its timeout lets a request through."""
+        rate_limiter = RateLimiter(requests_per_minute=60, circuit_breaker_enabled=True)
+        for _ in range(5):
+            rate_limiter.record_failure()
+        rate_limiter.circuit_breaker.last_failure_time = time.monotonic() - 61
+        
+        assert await rate_limiter.acquire() is True
+        assert rate_limiter.circuit_breaker.state == CircuitState.HALF_OPEN
+        assert rate_limiter.stats.requests_processed == 1
+    
     @pytest.mark.asyncio
     async def test_rate_limiter_statistics(self, rate_limiter):
         """Test rate limiter statistics tracking."""
@@ -277,4 +342,59 @@ class TestRateLimiter:
         assert status["running"] is False
         assert status["tokens_available"] >= 0
         assert "statistics" in status
-        assert "circuit_breaker" in status
\ No newline at end of file
+        assert "circuit_breaker" in status
+    
+    def test_rate_limiter_record_rate_limited(self, rate_limiter):
+        """Test a server rate limit drains tokens for the requested pause."""
+        rate_limiter.record_rate_limited(5)
+
+        assert rate_limiter.token_bucket.tokens_available() == 0
+        assert rate_limiter.token_bucket.time_until_available() == pytest.approx(
+            5.0, abs=0.1
+        )
+        assert rate_limiter.get_status()["statistics"]["requests_rate_limited"] == 1
+
+    def test_rate_limiter_average_wait_time(self, rate_limiter):
+        """Test average wait time is the mean of recorded waits."""
+        for wait in (1.0, 2.0, 6.0):
+            rate_limiter._update_average_wait_time(wait)
+
+        stats = rate_limiter.get_status()["statistics"]
+        assert stats["average_wait_time"] == pytest.approx(3.0)
+        assert stats["requests_processed"] == 0
+
+
+class TestPriorityQueue:
+    """Test cases for PriorityQueue."""
+    
+    @pytest.mark.asyncio
+    async def test_priority_order_and_fifo(self):
+        """Test higher priorities are served first, FIFO within a level."""
+        queue = PriorityQueue()
+        await queue.put("low-1", "low")
+        await queue.put("normal-1")
+        await queue.put("high-1", "high")
+        await queue.put("normal-2")
+        
+        assert queue.qsize() == {"high": 1, "normal": 2, "low": 1}
+        
+        results = [await queue.get() for _ in range(4)]
+        
+        assert results == [
+            ("high-1", "high"),
+            ("normal-1", "normal"),
+            ("normal-2", "normal"),
+            ("low-1", "low"),
+        ]
+        assert queue.qsize() == {"high": 0, "normal": 0, "low": 0}
+    
+    @pytest.mark.asyncio
+    async def test_get_waits_for_item(self):
+        """Test get blocks until an item is put."""
+        queue = PriorityQueue()
+        getter = asyncio.create_task(queue.get())
+        await asyncio.sleep(0)
+        
+        await queue.put({"request": 1}, "low")
+        
+        assert await asyncio.wait_for(getter, timeout=1.0) == ({"request": 1}, "low")
@@ -0,0 +1,189 @@
+"""Unit tests for MCP tool argument and response schemas."""
+
+import pytest
+import json
+from datetime import datetime
+from pydantic import ValidationError
+from src.raindrop.models import BookmarkModel, BookmarkType, CollectionModel
+from src.raindrop.schemas import (
+    ARG_ADAPTERS,
+    BookmarkResponse,
+    CollectionResponse,
+    ErrorResponse,
+    SearchResponse,
+    CreateBookmarkArgs,
+    CreateCollectionArgs,
+    GetBookmarkArgs,
+    ListCollectionsArgs,
+    SearchBookmarksArgs,
+    UpdateBookmarkArgs,
+    get_mcp_tools,
+)
+
+
+class TestSortAndViewChoices:
+    """Test cases for literal sort, order and view fields."""
+
+    def test_defaults(self):
+        """Test defaults are unchanged."""
+        assert SearchBookmarksArgs().sort == "created"
+        assert SearchBookmarksArgs().order == "desc"
+        assert ListCollectionsArgs().order == "asc"
+        assert CreateCollectionArgs(title="Reading").view == "list"
+
+    def test_order_is_lowercased(self):
+        """Test sort order is accepted case-insensitively."""
+        assert SearchBookmarksArgs(order="ASC").order == "asc"
+        assert ListCollectionsArgs(order="Desc").order == "desc"
+
+    @pytest.mark.parametrize(
+        "model,kwargs",
+        [
+            (SearchBookmarksArgs, {"sort": "count"}),
+            (SearchBookmarksArgs, {"order": "sideways"}),
+            (ListCollectionsArgs, {"sort": "score"}),
+            (ListCollectionsArgs, {"order": 1}),
+            (CreateCollectionArgs, {"title": "Reading", "view": "table"}),
+        ],
+    )
+    def test_invalid_choices_rejected(self, model, kwargs):
+        """Test values outside the allowed choices fail validation."""
+        with pytest.raises(ValidationError):
+            model(**kwargs)
+
+
+class TestTagList:
+    """Test cases for the shared tag list constraints."""
+
+    def test_valid_tags(self):
+        """Test tags within the limits are kept as given."""
+        args = CreateBookmarkArgs(url="https://example.com", tags=["a", "b" * 50])
+
+        assert args.tags == ["a", "b" * 50]
+        assert UpdateBookmarkArgs(bookmark_id=1).tags is None
+
+    @pytest.mark.parametrize(
+        "tags",
+        [["x"] * 51, ["x" * 51], ["ok", 5]],
+    )
+    def test_invalid_tags_rejected(self, tags):
+        """Test too many, too long, or non-string tags fail validation."""
+        with pytest.raises(ValidationError):
+            UpdateBookmarkArgs(bookmark_id=1, tags=tags)
+
+
+class TestBookmarkUrl:
+    """Test cases for the create_bookmark URL check."""
+
+    def test_url_kept_as_given(self):
+        """Test accepted URLs are stored without normalization."""
+        args = CreateBookmarkArgs(url="  HTTPS://Example.com?q=1  ")
+
+        assert args.url == "HTTPS://Example.com?q=1"
+
+    @pytest.mark.parametrize(
+        "url",
+        ["ftp://example.com", "https://", "example.com", "https://a b"],
+    )
+    def test_invalid_url_rejected(self, url):
+        """Test non-HTTP, empty-host, and whitespace URLs fail validation."""
+        with pytest.raises(ValidationError):
+            CreateBookmarkArgs(url=url)
+
+
+class TestArgAdapters:
+    """Test cases for the precompiled argument validators."""
+
+    def test_every_tool_has_adapter(self):
+        """Test each advertised tool has an argument adapter."""
+        assert set(ARG_ADAPTERS) == set(get_mcp_tools())
+
+    def test_input_schemas_generated_from_args(self):
+        """Test tool schemas carry the argument models' constraints."""
+        tools = get_mcp_tools()
+        create = tools["create_bookmark"]["inputSchema"]
+        update = tools["update_bookmark"]["inputSchema"]["properties"]
+
+        assert create["required"] == ["url"]
+        assert create["properties"]["tags"]["maxItems"] == 50
+        assert create["properties"]["tags"]["items"]["maxLength"] == 50
+        assert create["properties"]["title"] == {
+            "description": "Bookmark title",
+            "maxLength": 300,
+            "type": "string",
+        }
+        assert update["title"]["description"] == "New title"
+
+    def test_input_schemas_omit_nulls_and_titles(self):
+        """Test optional arguments are advertised without null or titles."""
+        schema = get_mcp_tools()["search_bookmarks"]["inputSchema"]
+
+        assert "title" not in schema
+        assert schema["properties"]["query"] == {
+            "description": "Search query string",
+            "type": "string",
+        }
+        assert schema["properties"]["order"]["default"] == "desc"
+
+    def test_tool_definitions_read_only(self):
+        """Test the tool table can't be modified at runtime."""
+        with pytest.raises(TypeError):
+            get_mcp_tools()["extra_tool"] = {}  # type: ignore[index]
+
+    def test_args_frozen_and_ignore_extra(self):
+        """Test args reject mutation and drop unknown fields."""
+        args = GetBookmarkArgs(bookmark_id=1, unknown="x")
+
+        assert not hasattr(args, "unknown")
+        assert hash(args) == hash(GetBookmarkArgs(bookmark_id=1))
+        with pytest.raises(ValidationError):
+            args.bookmark_id = 2
+
+    def test_tool_definitions_built_once(self):
+        """Test the lazily built tool table is reused across calls."""
+        assert get_mcp_tools() is get_mcp_tools()
+
+    def test_adapter_returns_model(self):
+        """Test adapters validate payloads into the args models."""
+        args = ARG_ADAPTERS["search_bookmarks"].validate_python({"order": "ASC"})
+
+        assert isinstance(args, SearchBookmarksArgs)
+        assert args.order == "asc"
+        with pytest.raises(ValidationError):
+            ARG_ADAPTERS["get_bookmark"].validate_python({})
+
+
+class TestResponseSchemas:
+    """Test cases for MCP response containers."""
+
+    @pytest.mark.parametrize(
+        "cls", [BookmarkResponse, CollectionResponse, SearchResponse, ErrorResponse]
+    )
+    def test_responses_use_slots(self, cls):
+        """Test response classes don't allocate a per-instance __dict__."""
+        assert "__slots__" in vars(cls)
+        assert "__dict__" not in vars(cls)
+
+    def test_slotted_responses_built_from_models(self):
+        """Test the model converters work with slotted responses."""
+        collection = CollectionModel(
+            id=5, title="Reading", count=3, created=datetime(2024, 1, 1)
+        )
+        bookmark = BookmarkModel(id=1, title="Test", collection=collection)
+
+        collection_response = CollectionResponse.from_collection_model(collection)
+        bookmark_response = BookmarkResponse.from_bookmark_model(bookmark)
+
+        assert collection_response.created == "2024-01-01T00:00:00"
+        assert bookmark_response.collection_title == "Reading"
+        assert not hasattr(bookmark_response, "__dict__")
+        assert not hasattr(collection_response, "__dict__")
+
+    def test_bookmark_type_serializes_as_string(self):
+        """Test the StrEnum bookmark type needs no .value to encode."""
+        bookmark = BookmarkModel(id=1, title="Test", type=BookmarkType.VIDEO)
+
+        response = BookmarkResponse.from_bookmark_model(bookmark)
+
+        assert response.type == "video"
+        assert json.dumps({"type": response.type}) == '{"type": "video"}'
@@ -1,7 +1,9 @@
 """Unit tests for data transformers."""
 
 import pytest
+from unittest.mock import patch
 from src.utils.transformers import (
+    remove_duplicates_preserve_order,
     sanitize_tag,
     validate_url,
     validate_collection_id,
@@ -11,8 +13,14 @@ from src.utils.transformers import (
     mcp_to_raindrop_update_bookmark,
     mcp_to_raindrop_create_collection,
     validate_mcp_tool_args,
-    format_error_response
+    format_error_response,
+    raindrop_to_mcp_search_results,
+    raindrop_to_mcp_search_dict,
+    raindrop_to_mcp_collection_dict,
+    sort_mcp_collections,
 )
+from datetime import datetime
+from src.raindrop.models import BookmarkModel, CollectionModel
 
 
 class TestUtilityFunctions:
@@ -44,6 +52,12 @@ class TestUtilityFunctions:
         result = sanitize_tag(123)
         assert result == ""
     
+    def test_remove_duplicates_preserve_order(self):
+        """Test dedup keeps first occurrences in order and drops empty items."""
+        items = ["b", "a", "", "b", "c", "a"]
+        
+        assert remove_duplicates_preserve_order(items) == ["b", "a", "c"]
+    
     def test_validate_url_valid(self):
         """Test URL validation with valid URLs."""
         assert validate_url("https://example.com") is True
@@ -57,6 +71,19 @@ class TestUtilityFunctions:
         assert validate_url("") is False
         assert validate_url("example.com") is False  # missing scheme
     
+    def test_validate_url_fast_path_matches_urlparse(self):
+        """Test the regex fast path agrees with the urlparse fallback."""
+        assert validate_url("HTTPS://Example.com") is True
+        assert validate_url("http://") is False
+        assert validate_url("https://?q=1") is False
+        assert validate_url("http://[::1]:8080/") is True
+        assert validate_url("http://[::1") is False  # malformed IPv6 literal
+    
+    def test_validate_url_non_string(self):
+        """Test non-string input is rejected rather than raising."""
+        assert validate_url(["http://x"]) is False  # type: ignore[arg-type]
+        assert validate_url({"url": "http://x"}) is False  # type: ignore[arg-type]
+    
     def test_validate_collection_id_valid(self):
         """Test collection ID validation with valid IDs."""
         assert validate_collection_id(1) is True
@@ -138,6 +165,20 @@ class TestMCPToRaindropTransformers:
         with pytest.raises(ValueError, match="Invalid sort field"):
             mcp_to_raindrop_search_params(args)
     
+    @pytest.mark.parametrize(
+        "args,message",
+        [
+            ({"type": "hologram"}, "Invalid bookmark type"),
+            ({"type": ["link"]}, "Invalid bookmark type"),
+            ({"sort": ["title"]}, "Invalid sort field"),
+            ({"order": {"asc": 1}}, "Invalid sort order"),
+        ],
+    )
+    def test_mcp_to_raindrop_search_params_invalid_choices(self, args, message):
+        """Test unknown or non-string choices raise ValueError."""
+        with pytest.raises(ValueError, match=message):
+            mcp_to_raindrop_search_params(args)
+    
     def test_mcp_to_raindrop_create_bookmark_minimal(self):
         """Test bookmark creation transformation with minimal input."""
         args = {"url": "https://example.com"}
@@ -173,6 +214,16 @@ class TestMCPToRaindropTransformers:
         with pytest.raises(ValueError, match="Invalid URL format"):
             mcp_to_raindrop_create_bookmark(args)
     
+    def test_mcp_to_raindrop_create_bookmark_skips_validated_url(self):
+        """Test a URL already checked by validation isn't parsed again."""
+        args = {"url": "https://example.com"}
+        
+        with patch("src.utils.transformers.validate_url") as check:
+            result = mcp_to_raindrop_create_bookmark(args, url_validated=True)
+        
+        assert result["link"] == "https://example.com"
+        check.assert_not_called()
+    
     def test_mcp_to_raindrop_create_bookmark_missing_url(self):
         """Test bookmark creation transformation with missing URL."""
         args = {"title": "Test"}
@@ -227,6 +278,70 @@ class TestMCPToRaindropTransformers:
             mcp_to_raindrop_create_collection(args)
 
 
+class TestRaindropToMCPTransformers:
+    """Test Raindrop to MCP transformation functions."""
+    
+    def test_raindrop_to_mcp_search_results(self):
+        """Test search results convert every bookmark and page info."""
+        bookmarks = [
+            BookmarkModel(
+                id=1,
+                title="First",
+                link="https://example.com/1",
+                created=datetime(2024, 1, 1, 12, 0),
+                collection=CollectionModel(id=5, title="Reading"),
+            ),
+            BookmarkModel(id=2, title="Second", link="https://example.com/2"),
+        ]
+        
+        result = raindrop_to_mcp_search_results(bookmarks, total=5, page=0, per_page=2)
+        
+        assert [item.id for item in result.items] == [1, 2]
+        assert result.items[0].created == "2024-01-01T12:00:00"
+        assert result.items[0].collection_title == "Reading"
+        assert result.items[1].collection_id is None
+        assert result.items[1].lastUpdate is None
+        assert result.count == 2
+        assert result.has_more is True
+
+    def test_raindrop_to_mcp_search_dict(self):
+        """Test the dict fast path builds each item and the page info."""
+        bookmarks = [
+            BookmarkModel(
+                id=1,
+                title="First",
+                tags=["a"],
+                created=datetime(2024, 1, 1, 12, 0),
+                collection=CollectionModel(id=5, title="Reading"),
+            ),
+            BookmarkModel(id=2, title="Second"),
+        ]
+
+        result = raindrop_to_mcp_search_dict(bookmarks, total=4, page=1, per_page=2)
+
+        assert [item["id"] for item in result["items"]] == [1, 2]
+        assert result["items"][0]["created"] == "2024-01-01T12:00:00"
+        assert result["items"][0]["collection_title"] == "Reading"
+        assert result["items"][0]["tags"] == ["a"]
+        assert result["items"][0]["tags"] is not bookmarks[0].tags
+        assert result["count"] == 2
+        assert result["has_more"] is False
+
+    def test_sort_mcp_collections(self):
+        """Test collection dicts sort by field, and unknown fields keep order."""
+        collections = [
+            raindrop_to_mcp_collection_dict(CollectionModel(id=i, title=t, count=c))
+            for i, t, c in [(1, "beta", 2), (2, "Alpha", 9), (3, "gamma", 5)]
+        ]
+
+        sort_mcp_collections(collections, "title", "asc")
+        assert [c["id"] for c in collections] == [2, 1, 3]
+        sort_mcp_collections(collections, "count", "DESC")
+        assert [c["id"] for c in collections] == [2, 3, 1]
+        sort_mcp_collections(collections, "unknown", "asc")
+        assert [c["id"] for c in collections] == [2, 3, 1]
+
+
 class TestMCPToolValidation:
     """Test MCP tool argument validation."""
     
@@ -236,6 +351,17 @@ class TestMCPToolValidation:
         validate_mcp_tool_args("search_bookmarks", {})
         validate_mcp_tool_args("search_bookmarks", {"query": "test"})
     
+    def test_validate_shared_bookmark_id_checks(self):
+        """Test every single-bookmark tool enforces an integer bookmark_id."""
+        for tool in ("get_bookmark", "update_bookmark", "delete_bookmark"):
+            validate_mcp_tool_args(tool, {"bookmark_id": 1})
+            with pytest.raises(ValueError, match="bookmark_id"):
+                validate_mcp_tool_args(tool, {"bookmark_id": "1"})
+    
+    def test_validate_unknown_tool_is_noop(self):
+        """Test tools without validation rules accept any arguments."""
+        validate_mcp_tool_args("list_collections", {"anything": object()})
+    
     def test_validate_create_bookmark_valid(self):
         """Test create_bookmark validation with valid args."""
         args = {"url": "https://example.com"}
@@ -300,6 +426,31 @@ class TestMCPToolValidation:
         with pytest.raises(ValueError):
             validate_mcp_tool_args("get_recent_unsorted", {"limit": 100})
     
+    def test_validate_bulk_tools(self):
+        """Test bulk tools validate every item with the single-item rules."""
+        validate_mcp_tool_args(
+            "create_bookmarks_bulk", {"items": [{"url": "https://example.com"}]}
+        )
+        validate_mcp_tool_args("delete_bookmarks_bulk", {"ids": [1, 2]})
+        
+        with pytest.raises(ValueError, match=r"items\[1\]: bookmark_id is required"):
+            validate_mcp_tool_args(
+                "update_bookmarks_bulk", {"items": [{"bookmark_id": 1}, {}]}
+            )
+    
+    def test_validate_bulk_tools_invalid_items(self):
+        """Test bulk tools reject missing, empty and oversized lists."""
+        for args in ({}, {"items": []}, {"items": "1"}, {"items": [1]}):
+            with pytest.raises(ValueError, match="items"):
+                validate_mcp_tool_args("update_bookmarks_bulk", args)
+        
+        for tool in ("delete_bookmarks_bulk", "tag_or_move_bookmarks"):
+            for args in ({}, {"ids": []}, {"ids": [1, "2"]}, {"ids": [True]}):
+                with pytest.raises(ValueError, match="ids"):
+                    validate_mcp_tool_args(tool, args)
+            with pytest.raises(ValueError, match="at most 100"):
+                validate_mcp_tool_args(tool, {"ids": list(range(1, 102))})
+    
     def test_validate_get_recent_unsorted_invalid_type(self):
         """Test get_recent_unsorted validation with invalid limit type."""
         with pytest.raises(ValueError):